@@ -0,0 +1,77 @@
+"""Waktu gambar grafik persentase realisasi pada 38, 500, dan 5.000 batang.
+
+Membandingkan cara lama (``sns.barplot`` + satu ``ax.text`` per baris dari
+``iterrows``) dengan ``charts.realisasi_barh`` yang memakai ``bar_label``
+dari array NumPy, baik dengan label dipaksa tampil maupun mode otomatis::
+
+    python -m benchmarks.bench_annotations
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+
+from dashboard import charts
+from dashboard.figcache import SAVEFIG_OPTIONS
+
+
+def synthetic_persentase(n, seed=0):
+    rng = np.random.default_rng(seed)
+    persen = np.sort(rng.normal(100, 3, n))[::-1]
+    return pd.DataFrame({
+        'Provinsi': [f"WILAYAH {i:04d}" for i in range(n)],
+        'Persentase Realisasi TKDD': persen,
+    })
+
+
+def legacy_barh(df_sorted):
+    fig = Figure(figsize=(12, 10))
+    ax = fig.subplots()
+    sns.barplot(y='Provinsi', x='Persentase Realisasi TKDD', data=df_sorted, color='skyblue', ax=ax)
+    for index, row in df_sorted.iterrows():
+        ax.text(row['Persentase Realisasi TKDD'] + 0.5, index,
+                f"{row['Persentase Realisasi TKDD']:.1f}%", va='center')
+    ax.set_xlim(0, max(df_sorted['Persentase Realisasi TKDD'].max() * 1.1, 105))
+    fig.tight_layout()
+    return fig
+
+
+def _time(build, df, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(df).savefig(io.BytesIO(), format='png', **SAVEFIG_OPTIONS)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes=(38, 500, 5000), repeat=1):
+    variants = {
+        'lama (iterrows)': legacy_barh,
+        'bar_label': lambda df: charts.realisasi_barh(df, show_labels=True),
+        'bar_label auto': lambda df: charts.realisasi_barh(df, show_labels='auto'),
+    }
+    return [
+        {'batang': n, 'varian': name, 'detik': _time(build, synthetic_persentase(n), repeat)}
+        for n in sizes
+        for name, build in variants.items()
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[38, 500, 5000])
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    for row in run(args.sizes, args.repeat):
+        print(f"{row['batang']:>6} batang  {row['varian']:<16} {row['detik']:8.3f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+"""CPU server dan ukuran payload per tampilan halaman untuk setiap backend grafik.
+
+Untuk setiap halaman, semua grafiknya dibangun seperti di app.py lalu
+diserialisasi seperti yang dikirim ke browser: PNG untuk Matplotlib (tanpa
+cache gambar) dan JSON spesifikasi untuk Vega-Lite; grafik tanpa versi
+Vega-Lite dihitung sebagai PNG seperti di dashboard. Cache gambar
+dikosongkan sebelum setiap putaran, termasuk tingkat disk/store bersama
+(``TKDD_FIGURE_CACHE_DIR``/``TKDD_CACHE_STORE``), sehingga tidak ada
+backend yang diukur dengan entri hangat. Waktu CPU diukur dengan
+``time.process_time``::
+
+    python -m benchmarks.bench_backends
+"""
+import argparse
+import time
+
+from dashboard import report
+from dashboard.backends import BACKENDS
+from dashboard.figcache import get_cache
+
+
+def page_views():
+    """Dict ``{halaman: [(nama grafik, data, params), ...]}`` sesuai isi halaman dashboard."""
+    views = {}
+    peta, _ = report.batas_peta()
+    for job in report.wilayah_jobs("tkdd", "Provinsi", 2023, peta=peta) + report.analisis_jobs():
+        views.setdefault(job.halaman, []).append((job.chart, job.data, job.params))
+    return views
+
+
+def run(repeat=3):
+    results = []
+    for page, views in page_views().items():
+        for name, backend in BACKENDS.items():
+            best_cpu, payload = float("inf"), 0
+            for _ in range(repeat):
+                get_cache().clear(tingkat_kedua=True)
+                start = time.process_time()
+                payload = sum(len(backend.render(chart, data, **params)) for chart, data, params in views)
+                best_cpu = min(best_cpu, time.process_time() - start)
+            results.append({"halaman": page, "backend": name, "cpu_detik": best_cpu, "payload_byte": payload})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'halaman':<18} {'backend':<11} {'CPU (s)':>8} {'payload':>10}")
+    for row in run(args.repeat):
+        print(f"{row['halaman']:<18} {row['backend']:<11} {row['cpu_detik']:>8.3f} {row['payload_byte'] / 1024:>8.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
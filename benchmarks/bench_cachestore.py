@@ -0,0 +1,93 @@
+"""Cache bersama lintas replika: waktu replika pertama vs berikutnya dan rasio hit antarreplika.
+
+Setiap replika dijalankan sebagai proses Python baru dengan ``TKDD_REPLICA``
+sendiri dan direktori berkas bertipe sendiri (seperti host terpisah), lalu
+memuat dataset, mem-fit kedua model OLS, dan merender grafik batang.
+Replika pertama mengisi store; replika berikutnya seharusnya memakai
+hasilnya tanpa parsing, fit, maupun Matplotlib.
+
+Backend ``local-redis`` menjalankan ``RedisStore`` terhadap pengganti lokal
+Redis sehingga adaptor Redis ikut teruji lintas proses tanpa server.
+
+::
+
+    python -m benchmarks.bench_cachestore
+    python -m benchmarks.bench_cachestore --store sqlite --store local-redis --replika 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+STORES = ('dir', 'sqlite', 'local-redis')
+
+_PROBE = """
+import json, sys, time
+from pathlib import Path
+start = time.perf_counter()
+from dashboard import cachestore, charts, data, figcache, ingest, models
+ingest.TYPED_DIR = Path(sys.argv[1])
+waktu = {}
+t = time.perf_counter()
+frames = {name: data.get_dataset(name) for name in ("tkdd", "all")}
+waktu["muat"] = time.perf_counter() - t
+t = time.perf_counter()
+for spec in ("realisasi_tkdd", "ipm"):
+    models.fit(spec)
+waktu["model"] = time.perf_counter() - t
+t = time.perf_counter()
+df_sorted = frames["tkdd"].sort_values('Persentase Realisasi TKDD', ascending=False)
+for builder in (charts.grouped_bar, charts.stacked_bar, charts.realisasi_barh):
+    figcache.render(builder, df_sorted)
+waktu["gambar"] = time.perf_counter() - t
+waktu["total"] = time.perf_counter() - start
+store = cachestore.get_store()
+print(json.dumps({"waktu": waktu, "stats": store.stats(), "rasio": store.rasio_replika()}))
+"""
+
+
+def replika(url, nama, typed_dir):
+    """Hasil satu replika (proses baru) terhadap store ``url``."""
+    env = {**os.environ, 'TKDD_CACHE_STORE': url, 'TKDD_REPLICA': nama}
+    env.pop('TKDD_FIGURE_CACHE_DIR', None)
+    out = subprocess.run(
+        [sys.executable, '-c', _PROBE, str(typed_dir)],
+        cwd=ROOT_DIR, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(stores=STORES, n_replika=3):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for store in stores:
+            url = f'{store}://{tmp / store}' + ('' if store == 'dir' else '.sqlite')
+            for i in range(n_replika):
+                nama = f'r{i + 1}'
+                rows.append((store, nama, replika(url, nama, tmp / f'typed-{store}-{nama}')))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--store', action='append', choices=STORES, help='backend (default: semua)')
+    parser.add_argument('--replika', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'store':<12} {'replika':<8} {'muat (s)':>9} {'model (s)':>9} {'gambar (s)':>10} "
+          f"{'total (s)':>9} {'hit antarreplika':>17}")
+    for store, nama, r in run(args.store or STORES, args.replika):
+        w = r['waktu']
+        print(f"{store:<12} {nama:<8} {w['muat']:>9.3f} {w['model']:>9.3f} {w['gambar']:>10.3f} "
+              f"{w['total']:>9.3f} {r['rasio']:>17.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""ETL workbook mentah: waktu dan puncak memori streaming per potongan vs ``pandas.read_excel``.
+
+Workbook sintetis berbentuk seperti workbook lomba (satu baris per wilayah,
+sebagian sel ``null``) ditulis dengan openpyxl mode ``write_only``. Memori
+diukur dengan ``tracemalloc`` (alokasi Python, termasuk sel openpyxl).
+``read_excel`` hanya membaca sel mentah; ETL juga menghasilkan dua dataset
+bersih, sehingga perbandingan yang relevan adalah ETL satu potongan vs
+per potongan.
+
+::
+
+    python -m benchmarks.bench_etl
+    python -m benchmarks.bench_etl --baris 1000 20000 --chunk 2000
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard import data, etl
+
+
+def tulis_workbook(path, n_baris, seed=0):
+    import openpyxl
+
+    rng = np.random.default_rng(seed)
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append([k.label for k in data.DATASETS['mentah'].columns])
+    for i in range(n_baris):
+        pagu = round(float(rng.lognormal(30.2, 0.6)), -4)
+        realisasi = float(round(pagu * rng.normal(1.0, 0.03), -4))
+        penduduk = float(round(rng.lognormal(15.2, 0.9)))
+        ws.append([
+            f'WILAYAH {i:06d}',
+            'null' if i % 17 == 0 else round(float(rng.normal(72.5, 4.0)), 2),
+            'null' if i % 29 == 0 else pagu,
+            realisasi,
+            penduduk,
+            round(realisasi / penduduk, 3),
+            round(float(rng.uniform(3, 30)), 2),
+            round(float(rng.lognormal(12.4, 1.0)), 2),
+            float(rng.integers(10, 200) * 1000000),
+            round(float(rng.normal(5, 1)), 2),
+        ])
+    wb.save(path)
+
+
+def _ukur(fungsi):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fungsi()
+    detik = time.perf_counter() - start
+    puncak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return detik, puncak
+
+
+def run(ukuran=(1000, 10000), chunk=etl.CHUNK):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Pemanasan: alokasi saat impor modul pandas/openpyxl tidak ikut terukur
+        kecil = Path(tmp) / 'kecil.xlsx'
+        tulis_workbook(kecil, 50)
+        pd.read_excel(kecil, dtype=object)
+        etl.transform(kecil)
+        for n in ukuran:
+            path = Path(tmp) / f'mentah-{n}.xlsx'
+            tulis_workbook(path, n)
+            rows.append((n, 'read_excel', *_ukur(lambda: pd.read_excel(path, dtype=object))))
+            rows.append((n, 'etl satu potongan', *_ukur(lambda: etl.transform(path, chunk=n))))
+            rows.append((n, f'etl chunk={chunk}', *_ukur(lambda: etl.transform(path, chunk=chunk))))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baris', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--chunk', type=int, default=etl.CHUNK)
+    args = parser.parse_args(argv)
+
+    print(f"{'baris':>8} {'cara':<18} {'waktu (s)':>10} {'puncak (MB)':>12}")
+    for n, cara, detik, puncak in run(args.baris, args.chunk):
+        print(f'{n:>8} {cara:<18} {detik:>10.3f} {puncak / 2**20:>12.1f}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Waktu tampilan kabupaten/kota satu dekade (target: < 2 detik per halaman).
+
+Membuat panel sintetis ~514 kabupaten/kota x 10 tahun, lalu mengukur
+agregasi tervektorisasi, pemotongan top-N/"Lainnya", dan render grafik
+setiap halaman TKDD ke PNG tanpa cache gambar::
+
+    python -m benchmarks.bench_hierarchy
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard import charts, hierarchy, regions
+from dashboard.figcache import SAVEFIG_OPTIONS
+
+
+def synthetic_kabkota(n_kabkota=514, n_tahun=10, n_provinsi=38, seed=0):
+    rng = np.random.default_rng(seed)
+    # Nama provinsi asli agar kode BPS-nya terpetakan
+    provinsi = np.array(list(regions.PROVINSI.values())[:n_provinsi])
+    unit_prov = provinsi[rng.integers(0, n_provinsi, n_kabkota)]
+    unit_nama = np.array([f"KAB {i:03d}" for i in range(n_kabkota)])
+    tahun = np.arange(2024 - n_tahun + 1, 2025)
+
+    pagu = rng.lognormal(mean=27, sigma=0.8, size=(n_tahun, n_kabkota))
+    realisasi = pagu * rng.normal(1.0, 0.04, size=pagu.shape)
+    return pd.DataFrame({
+        'Tahun': np.repeat(tahun, n_kabkota),
+        'Provinsi': np.tile(unit_prov, n_tahun),
+        hierarchy.KOLOM_KABKOTA: np.tile(unit_nama, n_tahun),
+        'Pagu TKDD': pagu.ravel(),
+        'Realisasi TKDD': realisasi.ravel(),
+    })
+
+
+def run(n_kabkota=514, n_tahun=10, top_n=10):
+    df = synthetic_kabkota(n_kabkota, n_tahun)
+    level = hierarchy.KOLOM_KABKOTA
+    timings = {}
+
+    start = time.perf_counter()
+    panel = hierarchy.precompute(df, level, default_year=2024)
+    provinsi = hierarchy.precompute(df, 'Provinsi', default_year=2024)
+    timings['agregasi'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    view = hierarchy.top_bottom(panel[max(panel)], top_n, level)
+    timings['top_bottom'] = time.perf_counter() - start
+
+    for name, builder, params in [
+        ('grouped_bar', charts.grouped_bar, {'label_col': level}),
+        ('stacked_bar', charts.stacked_bar, {'label_col': level}),
+        ('realisasi_barh', charts.realisasi_barh, {'label_col': level, 'tahun': max(panel)}),
+    ]:
+        start = time.perf_counter()
+        builder(view, **params).savefig(io.BytesIO(), format='png', **SAVEFIG_OPTIONS)
+        timings[name] = time.perf_counter() - start
+
+    persiapan = timings['agregasi'] + timings['top_bottom']
+    halaman = {
+        'Perbandingan Pagu dan Realisasi': persiapan + timings['grouped_bar'] + timings['stacked_bar'],
+        'Persentase Realisasi': persiapan + timings['realisasi_barh'],
+    }
+    return {'baris': len(df), 'unit': n_kabkota, 'tahun': n_tahun,
+            'provinsi_teragregasi': len(provinsi[max(provinsi)]),
+            'detik': timings, 'halaman': halaman}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--kabkota', type=int, default=514)
+    parser.add_argument('--tahun', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    result = run(args.kabkota, args.tahun)
+    print(f"{result['baris']:,} baris ({result['unit']} kab/kota x {result['tahun']} tahun)")
+    for stage, seconds in result['detik'].items():
+        print(f"  {stage:<15} {seconds:8.3f} s")
+    for page, seconds in result['halaman'].items():
+        print(f"halaman {page:<32} {seconds:8.3f} s")
+    return 0 if max(result['halaman'].values()) < 2.0 else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+"""Waktu inferensi bootstrap + permutasi untuk korelasi Pearson dan Chi-Square.
+
+Membandingkan loop Python per replikasi (``scipy.stats.pearsonr`` dan
+``chi2_contingency`` pada setiap sampel ulang) dengan blok matriks NumPy
+di ``dashboard.inference``, satu proses maupun dengan process pool::
+
+    python -m benchmarks.bench_inference
+    python -m benchmarks.bench_inference --replikasi 1000 10000 100000 --jobs 4
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import stats as sps
+
+from dashboard import inference
+
+
+def synthetic(n=34, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(70, 4, n)
+    y = 0.2 * x + rng.normal(0, 1, n)
+    a = rng.integers(0, 3, n)
+    b = (rng.random(n) < 0.4).astype(np.int64)
+    return x, y, a, b
+
+
+def loop_pearson(x, y, reps, seed):
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    boot, perm = np.empty(reps), np.empty(reps)
+    for i in range(reps):
+        idx = rng.integers(0, n, n)
+        boot[i] = sps.pearsonr(x[idx], y[idx])[0]
+        perm[i] = sps.pearsonr(x, rng.permutation(y))[0]
+    return boot, perm
+
+
+def loop_chi2(a, b, reps, seed):
+    rng = np.random.default_rng(seed)
+    n = len(a)
+    boot, perm = np.empty(reps), np.empty(reps)
+    for i in range(reps):
+        idx = rng.integers(0, n, n)
+        table = pd.crosstab(a[idx], b[idx]).to_numpy()
+        boot[i] = sps.chi2_contingency(table, correction=False)[0] if min(table.shape) > 1 else 0.0
+        perm[i] = sps.chi2_contingency(pd.crosstab(a, rng.permutation(b)).to_numpy(), correction=False)[0]
+    return boot, perm
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(sizes=(1000, 10000), jobs=2, loop_max=2000):
+    x, y, a, b = synthetic()
+    shape = (3, 2)
+    rows = []
+    for reps in sizes:
+        variants = {
+            'pearson blok': lambda: inference.replikasi('pearson', x, y, reps, 0),
+            f'pearson blok x{jobs}': lambda: inference.replikasi('pearson', x, y, reps, 0, workers=jobs),
+            'chi2 blok': lambda: inference.replikasi('chi2', a, b, reps, 0, shape=shape),
+            f'chi2 blok x{jobs}': lambda: inference.replikasi('chi2', a, b, reps, 0, shape=shape, workers=jobs),
+        }
+        if reps <= loop_max:
+            # Loop Python terlalu lambat untuk ukuran besar
+            variants['pearson loop'] = lambda: loop_pearson(x, y, reps, 0)
+            variants['chi2 loop'] = lambda: loop_chi2(a, b, reps, 0)
+        rows += [{'replikasi': reps, 'varian': name, 'detik': _time(fn)} for name, fn in variants.items()]
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--replikasi', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--jobs', type=int, default=2)
+    parser.add_argument('--loop-max', type=int, default=2000, help='ukuran terbesar yang juga diukur dengan loop')
+    args = parser.parse_args(argv)
+
+    for row in run(args.replikasi, args.jobs, args.loop_max):
+        print(f"{row['replikasi']:>8} replikasi  {row['varian']:<18} {row['detik']:8.3f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""Waktu pencocokan nama wilayah dan join pada skala kabupaten/kota.
+
+Panel sintetis ~514 kabupaten/kota x N tahun digabungkan dengan tabel
+referensi satu baris per kabupaten/kota (seperti batas wilayah). Cara lama
+menormalisasi string di kedua sisi lalu ``merge``; cara baru memetakan nama
+ke kode BPS sekali (``dashboard.regions``) lalu mencari kode bilangan bulat
+pada indeks referensi yang sudah jadi::
+
+    python -m benchmarks.bench_regions --tahun 1 10 20
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_hierarchy import synthetic_kabkota
+from dashboard import hierarchy, regions
+
+KABKOTA = hierarchy.KOLOM_KABKOTA
+
+
+def _bersih(series):
+    return series.str.upper().str.strip()
+
+
+def join_string(data, referensi):
+    data = data.assign(kunci=_bersih(data['Provinsi']) + '|' + _bersih(data[KABKOTA]))
+    referensi = referensi.assign(kunci=_bersih(referensi['Provinsi']) + '|' + _bersih(referensi[KABKOTA]))
+    return data.merge(referensi.drop(columns=['Provinsi', KABKOTA]), on='kunci', how='left')
+
+
+def join_kode(data, indeks, referensi):
+    posisi = indeks.get_indexer(data[regions.KODE_KABKOTA].to_numpy())
+    return data.assign(Luas=referensi['Luas'].to_numpy()[posisi])
+
+
+def _time(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_tahun=(1, 10, 20), n_kabkota=514, repeat=5):
+    rows = []
+    for tahun in n_tahun:
+        data = synthetic_kabkota(n_kabkota=n_kabkota, n_tahun=tahun)
+        referensi = data.drop_duplicates(KABKOTA)[['Provinsi', KABKOTA]].reset_index(drop=True)
+        referensi['Luas'] = np.arange(len(referensi), dtype='float64')
+
+        # Indeks baru dibuat setiap kali agar waktu "dingin" mencakup difflib/normalisasi
+        mulai = time.perf_counter()
+        regions.INDEX = regions.RegionIndex()
+        kode = regions.kolom_kode(data, hierarchy.LEVELS[KABKOTA])
+        dingin = time.perf_counter() - mulai
+        panas = _time(lambda: regions.kolom_kode(data, hierarchy.LEVELS[KABKOTA]), repeat)
+
+        data = data.assign(**kode)
+        indeks = pd.Index(regions.kolom_kode(referensi, hierarchy.LEVELS[KABKOTA])[regions.KODE_KABKOTA])
+        indeks.get_indexer(indeks[:1])
+
+        lama, baru = join_string(data, referensi), join_kode(data, indeks, referensi)
+        assert np.array_equal(lama['Luas'].to_numpy(), baru['Luas'].to_numpy())
+        rows.append({
+            'baris': len(data),
+            'kode dingin': dingin,
+            'kode memo': panas,
+            'join string': _time(lambda: join_string(data, referensi), repeat),
+            'join kode': _time(lambda: join_kode(data, indeks, referensi), repeat),
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tahun', type=int, nargs='+', default=[1, 10, 20])
+    parser.add_argument('--kabkota', type=int, default=514)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = run(args.tahun, args.kabkota, args.repeat)
+    print(f"{'baris':>7} " + ' '.join(f'{k:>12}' for k in rows[0] if k != 'baris'))
+    for row in rows:
+        print(f"{row['baris']:>7,} " + ' '.join(f'{v * 1000:>10.2f}ms' for k, v in row.items() if k != 'baris'))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
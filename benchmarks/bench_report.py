@@ -0,0 +1,68 @@
+"""Waktu laporan batch kabupaten/kota untuk 34 provinsi x 10 tahun.
+
+Membuat folder data sintetis (panel kabupaten/kota ditambah salinan dua
+CSV provinsi), lalu menjalankan ``python -m dashboard.report`` dengan
+``TKDD_DATA_DIR`` mengarah ke folder itu. Selain waktu nyata, dilaporkan
+total waktu render per grafik dari manifest dan perkiraan waktu untuk
+jumlah core tertentu::
+
+    python -m benchmarks.bench_report --jobs 8
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_hierarchy import synthetic_kabkota
+from dashboard.config import DATA_DIR, ROOT_DIR
+
+
+def siapkan_data(folder, n_provinsi=34, n_tahun=10, n_kabkota=514):
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    for name in ("DataTKDD.csv", "DataKeseluruhan.csv"):
+        shutil.copy(DATA_DIR / name, folder / name)
+    df = synthetic_kabkota(n_kabkota=n_kabkota, n_tahun=n_tahun, n_provinsi=n_provinsi)
+    df.to_csv(folder / "DataTKDDKabKota.csv", index=False)
+    return folder
+
+
+def run(jobs, formats, n_provinsi=34, n_tahun=10):
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = siapkan_data(Path(tmp) / "Data", n_provinsi, n_tahun)
+        out_dir = Path(tmp) / "laporan"
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "dashboard.report", "--dataset", "tkdd_kabkota", "--semua-wilayah",
+             "--jobs", str(jobs), "--output", str(out_dir), "--format", *formats],
+            cwd=ROOT_DIR, env={**os.environ, "TKDD_DATA_DIR": str(data_dir)}, check=True,
+        )
+        wall = time.perf_counter() - start
+        manifest = json.loads((out_dir / "manifest.json").read_text())
+    render = sum(entry["detik"] for entry in manifest["grafik"])
+    return {"wall": wall, "render": render, "grafik": manifest["jumlah_grafik"], "berkas": manifest["jumlah_berkas"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--format", nargs="+", default=["png"])
+    parser.add_argument("--provinsi", type=int, default=34)
+    parser.add_argument("--tahun", type=int, default=10)
+    parser.add_argument("--core", type=int, default=8, help="jumlah core untuk perkiraan waktu")
+    args = parser.parse_args(argv)
+
+    r = run(args.jobs, args.format, args.provinsi, args.tahun)
+    print(f"{r['grafik']} grafik, {r['berkas']} berkas dengan {args.jobs} proses: {r['wall']:.1f} s")
+    print(f"total waktu render per grafik: {r['render']:.1f} s "
+          f"(perkiraan {args.core} core: {r['render'] / args.core:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
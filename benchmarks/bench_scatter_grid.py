@@ -0,0 +1,84 @@
+"""Waktu gambar grid scatter plot pada 8, 16, dan 32 panel.
+
+Membandingkan cara lama (satu ``sns.scatterplot`` per ``add_subplot``)
+dengan ``dashboard.panels.scatter_panels`` yang membuat semua sumbu
+sekaligus dan menambahkan titik sebagai ``PathCollection`` mentah, dengan
+dan tanpa garis OLS/LOWESS::
+
+    python -m benchmarks.bench_scatter_grid
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+
+from dashboard import panels
+from dashboard.figcache import SAVEFIG_OPTIONS
+
+TARGET = 'Target'
+
+
+def synthetic_wide(n_var, n_rows=38, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.lognormal(0, 1, (n_rows, n_var))
+    y = X @ rng.normal(0, 1, n_var) + rng.normal(0, 1, n_rows)
+    df = pd.DataFrame(X, columns=[f'Variabel {i:02d}' for i in range(n_var)])
+    df[TARGET] = y
+    return df
+
+
+def legacy_grid(data, variabels, target):
+    nrows = -(-len(variabels) // 3)
+    fig = Figure(figsize=(20, 20 * nrows / 3))
+    for i, var in enumerate(variabels):
+        ax = fig.add_subplot(nrows, 3, i + 1)
+        sns.scatterplot(data=data, x=var, y=target, ax=ax)
+        ax.set_title(f'{var} vs {target}')
+        ax.set_xlabel(var)
+        ax.set_ylabel(target)
+    fig.tight_layout()
+    return fig
+
+
+def _time(build, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build().savefig(io.BytesIO(), format='png', **SAVEFIG_OPTIONS)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes=(8, 16, 32), repeat=1):
+    rows = []
+    for n in sizes:
+        df = synthetic_wide(n)
+        variabels = [col for col in df.columns if col != TARGET]
+        variants = {
+            'lama (seaborn)': lambda: legacy_grid(df, variabels, TARGET),
+            'panels': lambda: panels.scatter_panels(panels.melt(df, variabels, TARGET), TARGET, variabels),
+            'panels + ols': lambda: panels.scatter_panels(panels.melt(df, variabels, TARGET), TARGET, variabels, fit='ols'),
+            'panels + lowess': lambda: panels.scatter_panels(panels.melt(df, variabels, TARGET), TARGET, variabels,
+                                                             fit='lowess'),
+        }
+        rows += [{'panel': n, 'varian': name, 'detik': _time(build, repeat)} for name, build in variants.items()]
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[8, 16, 32])
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    for row in run(args.sizes, args.repeat):
+        print(f"{row['panel']:>4} panel  {row['varian']:<16} {row['detik']:8.3f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+"""Waktu evaluasi semua subset prediktor dengan leave-one-out per wilayah.
+
+Membandingkan ``sm.OLS`` untuk setiap subset dan setiap sampel tanpa satu
+wilayah dengan sweep kode Gray bertumpuk di ``dashboard.selection``, pada
+data sintetis 34 wilayah dengan 4, 6, dan 8 prediktor::
+
+    python -m benchmarks.bench_selection
+"""
+import argparse
+import time
+
+import numpy as np
+
+from dashboard import selection
+
+
+def synthetic_design(n, p, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, p))
+    y = X @ rng.normal(size=p) + rng.normal(size=n)
+    return np.column_stack([np.ones(n), X, y])
+
+
+def loop_ols(W):
+    import statsmodels.api as sm
+
+    n, d = W.shape
+    p = d - 2
+    aic = np.empty((n + 1, 2 ** p))
+    for i in range(n + 1):
+        rows = np.arange(n) != i - 1
+        for mask in range(2 ** p):
+            cols = [0, *(j + 1 for j in range(p) if mask >> j & 1)]
+            aic[i, mask] = sm.OLS(W[rows, -1], W[rows][:, cols]).fit().aic
+    return aic
+
+
+def _time(fn, W):
+    start = time.perf_counter()
+    fn(W)
+    return time.perf_counter() - start
+
+
+def run(sizes=(4, 6, 8), n=34, loop_max=6):
+    rows = []
+    for p in sizes:
+        W = synthetic_design(n, p)
+        rows.append({'prediktor': p, 'varian': 'sweep kode Gray', 'detik': _time(selection.semua_subset, W)})
+        if p <= loop_max:
+            # sm.OLS per subset terlalu lambat untuk p besar
+            rows.append({'prediktor': p, 'varian': 'sm.OLS per subset', 'detik': _time(loop_ols, W)})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[4, 6, 8])
+    parser.add_argument('--n', type=int, default=34)
+    parser.add_argument('--loop-max', type=int, default=6, help='p terbesar yang juga diukur dengan sm.OLS')
+    args = parser.parse_args(argv)
+
+    for row in run(args.sizes, args.n, args.loop_max):
+        print(f"{row['prediktor']:>3} prediktor  {row['varian']:<18} {row['detik']:8.3f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+"""Biaya impor saat cold start, total dan per halaman.
+
+Setiap pengukuran dijalankan di interpreter Python baru (subprocess) agar
+cache ``sys.modules`` tidak terbawa. Yang diukur:
+
+* shell: ``streamlit`` + registri halaman + backend grafik (biaya minimum
+  setiap proses sebelum halaman apa pun dibuka);
+* per halaman: biaya tambahan ``pages.preload`` untuk halaman itu saja;
+* semua halaman: biaya bila semua dependensi dimuat di awal seperti
+  ``app.py`` sebelum registri halaman ada.
+
+::
+
+    python -m benchmarks.bench_startup
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from dashboard.pages import PAGES
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+from dashboard import backends, pages
+shell = time.perf_counter() - start
+modules = len(sys.modules)
+start = time.perf_counter()
+for title in json.loads(sys.argv[1]):
+    pages.preload(title)
+print(json.dumps({"shell": shell, "page": time.perf_counter() - start,
+                  "modules": len(sys.modules) - modules}))
+"""
+
+
+def probe(titles):
+    """Waktu impor shell dan halaman ``titles`` di proses baru."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(list(titles))],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _best(titles, repeat):
+    results = [probe(titles) for _ in range(repeat)]
+    return min(results, key=lambda r: r["shell"] + r["page"])
+
+
+def run(repeat=3):
+    rows = [("shell saja", _best([], repeat))]
+    rows += [(title, _best([title], repeat)) for title in PAGES]
+    rows.append(("semua halaman (impor di awal)", _best(list(PAGES), repeat)))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'halaman':<46} {'shell (s)':>9} {'halaman (s)':>11} {'total (s)':>9} {'modul':>6}")
+    for title, r in run(args.repeat):
+        print(f"{title:<46} {r['shell']:>9.3f} {r['page']:>11.3f} {r['shell'] + r['page']:>9.3f} {r['modules']:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
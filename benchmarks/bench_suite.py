@@ -0,0 +1,281 @@
+"""Suite benchmark tahap-tahap dashboard pada data sintetis berbagai skala.
+
+Data sintetis berbentuk seperti ``DataKeseluruhan.csv`` (ditambah kolom
+Kabupaten/Kota dan Tahun) dibuat dengan seed tetap untuk setiap kombinasi
+jumlah wilayah dan tahun. Setiap tahap diukur tanpa Streamlit dan tanpa
+jaringan:
+
+* muat: baca + validasi CSV, lalu baca ulang berkas Arrow bertipe
+* kolom turunan dan agregasi panel wilayah (termasuk kode BPS)
+* korelasi (kubus statistik), OLS kedua model, uji chi-square
+* setiap pembuat grafik sampai PNG
+* join dan plot peta pada batas provinsi sintetis
+
+Hasil ditulis sebagai JSON (default ``Output/benchmarks/<commit>.json``)
+dan bisa dibandingkan dengan hasil commit lain; kode keluar 1 bila ada
+tahap yang melambat melebihi ambang::
+
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --wilayah 38 514 --tahun 1 --baseline Output/benchmarks/abc123.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard import charts, data, etl, geometry, hierarchy, ingest, models, regions, stats
+from dashboard.config import OUTPUT_DIR, ROOT_DIR
+from dashboard.figcache import SAVEFIG_OPTIONS
+
+HASIL_DIR = OUTPUT_DIR / 'benchmarks'
+KABKOTA = hierarchy.KOLOM_KABKOTA
+
+# Perlambatan relatif dan absolut minimum (detik) yang dianggap regresi
+AMBANG = 0.25
+SELISIH_MIN = 0.01
+
+
+def synthetic_keseluruhan(n_wilayah=38, n_tahun=1, seed=0):
+    """Frame seperti DataKeseluruhan.csv untuk ``n_wilayah`` x ``n_tahun`` baris (tanpa kolom turunan)."""
+    rng = np.random.default_rng(seed)
+    provinsi = np.array(list(regions.PROVINSI.values()))
+    # Wilayah pertama mencakup semua provinsi, sisanya dibagi acak
+    unit_prov = np.concatenate([provinsi, provinsi[rng.integers(0, len(provinsi), max(n_wilayah - len(provinsi), 0))]])
+    unit_prov = unit_prov[:n_wilayah]
+    skala = len(provinsi) / n_wilayah
+    n = n_wilayah * n_tahun
+
+    penduduk = rng.lognormal(15.2, 0.9, n) * skala
+    pagu = rng.lognormal(30.2, 0.6, n) * skala
+    realisasi = pagu * rng.normal(1.0, 0.03, n)
+    pdrb = rng.lognormal(12.4, 1.0, n) * skala
+    ipm = np.clip(rng.normal(72.5, 4.0, n), 45, 90)
+    return pd.DataFrame({
+        'Provinsi': np.tile(unit_prov, n_tahun),
+        KABKOTA: np.tile([f'WILAYAH {i:05d}' for i in range(n_wilayah)], n_tahun),
+        'Tahun': np.repeat(np.arange(2024 - n_tahun + 1, 2025), n_wilayah),
+        'IPM': ipm.round(2),
+        'Pagu TKDD': pagu.round(-3),
+        'Realisasi TKDD': realisasi.round(-3),
+        'Jumlah Penduduk': penduduk.round(),
+        'Anggaran APBN per kapita': (realisasi / penduduk).round(3),
+        'Persentase Penduduk Miskin': np.clip(rng.normal(10, 5, n), 1, 40).round(2),
+        'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku': pdrb.round(2),
+        'Produk Domestik Regional Bruto per Kapita HB': (pdrb * 1e6 / penduduk).round(),
+        'Laju Pertumbuhan PDRB atas dasar konstan 2010': rng.normal(5, 2, n).round(2),
+        'Kategori Persentase Realisasi TKDD': etl.kategori_realisasi(realisasi / pagu * 100),
+        'Kategori IPM': etl.kategori_ipm(ipm),
+    })
+
+
+def synthetic_batas(resolusi=400):
+    """GeoDataFrame 38 provinsi berbentuk lingkaran (~4 x ``resolusi`` titik sudut) pada grid."""
+    import geopandas as gpd
+    import shapely
+
+    nama = list(regions.PROVINSI.values())
+    pusat = [shapely.Point(95 + (i % 10) * 4, 5 - (i // 10) * 4) for i in range(len(nama))]
+    return gpd.GeoDataFrame({'PROVINSI': nama}, geometry=[p.buffer(1.8, quad_segs=resolusi) for p in pusat],
+                            crs='EPSG:4326')
+
+
+def _time(fn, repeat):
+    """Waktu terbaik dari ``repeat`` kali dan hasil panggilan terakhir."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _png(builder, *args, **params):
+    builder(*args, **params).savefig(io.BytesIO(), format='png', **SAVEFIG_OPTIONS)
+
+
+def run_skala(n_wilayah, n_tahun, repeat=3, seed=0):
+    """Dict ``{tahap: detik}`` untuk satu skala data."""
+    tahap = {}
+    mentah = synthetic_keseluruhan(n_wilayah, n_tahun, seed)
+    schema = replace(
+        data.DATASETS['all'],
+        name=f'bench_{n_wilayah}x{n_tahun}',
+        columns=(*data.DATASETS['all'].columns, data.KOLOM['kabkota'], data.KOLOM['tahun']),
+        keys=('provinsi', 'kabkota', 'tahun'),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        schema = replace(schema, path=Path(tmp) / 'DataKeseluruhan.csv')
+        mentah.to_csv(schema.path, index=False)
+        tahap['muat csv'], df = _time(lambda: ingest.validate(ingest.read_source(schema), schema), repeat)
+        arrow = ingest.write_typed(df, schema, Path(tmp) / 'typed.arrow')
+        tahap['muat arrow'], df = _time(lambda: ingest.to_frame(*ingest.read_typed(arrow)), repeat)
+        # Salinan penuh agar tidak bergantung pada memory map setelah folder dihapus
+        df = df.copy(deep=True)
+
+    tahap['kolom turunan'], df = _time(lambda: schema.derive(df), repeat)
+    tahap['agregasi wilayah'], panel = _time(
+        lambda: {level: hierarchy.precompute(df, level, 2024) for level in hierarchy.LEVELS}, repeat)
+    # Dataset 'all' diganti sementara agar models.fit memakai data sintetis;
+    # entri sebelumnya dipasang kembali setelah tahap model dan grafik selesai
+    sebelum, stamp = data.loaded().get('all'), data.source_stamp('all')
+    version = data.install('all', df, stamp=None)
+    try:
+        return _tahap_analisis(tahap, df, version, panel, repeat)
+    finally:
+        if sebelum is None:
+            data.clear_cache('all')
+        else:
+            data.install('all', sebelum, stamp)
+        models.clear_cache()
+
+
+def _tahap_analisis(tahap, df, version, panel, repeat):
+    tahap['korelasi'], cube = _time(lambda: stats.compute(df, version), repeat)
+
+    def ols():
+        models.clear_cache()
+        return {name: models.fit(name) for name in models.SPECS}
+
+    tahap['ols'], hasil = _time(ols, repeat)
+
+    def chi_square():
+        from scipy.stats import chi2_contingency
+
+        return chi2_contingency(pd.crosstab(df['Kategori IPM'], df['Kategori Persentase Realisasi TKDD']))
+
+    tahap['chi-square'], _ = _time(chi_square, repeat)
+
+    # Grafik sama dengan halaman (lihat dashboard.report), dirender sampai PNG
+    tahun = max(panel[KABKOTA])
+    view = panel[KABKOTA][tahun]
+    if len(view) > hierarchy.MAX_BARS:
+        view = hierarchy.top_bottom(view, 10, KABKOTA)
+    var_realisasi = list(models.PREDIKTOR_REALISASI)
+    var_ipm = [col for col in models.PREDIKTOR_IPM if col != 'Realisasi TKDD'] + ['Realisasi TKDD']
+    corr, pval = cube.pearson_test('IPM', 'Realisasi TKDD')
+    grafik = {
+        'grouped_bar': lambda: _png(charts.grouped_bar, view, label_col=KABKOTA),
+        'stacked_bar': lambda: _png(charts.stacked_bar, view, label_col=KABKOTA),
+        'realisasi_barh': lambda: _png(charts.realisasi_barh, view, label_col=KABKOTA, tahun=tahun),
+        'scatter_grid': lambda: _png(charts.scatter_grid, df[['Realisasi TKDD', *var_realisasi]],
+                                     variabels=var_realisasi, target='Realisasi TKDD'),
+        'scatter_grid (ipm)': lambda: _png(charts.scatter_grid, df[['IPM', *var_ipm]], variabels=var_ipm,
+                                           target='IPM'),
+        'korelasi_heatmap': lambda: _png(charts.korelasi_heatmap, cube.korelasi_target('IPM', var_ipm),
+                                         title='Korelasi terhadap IPM'),
+        'ipm_scatter': lambda: _png(charts.ipm_scatter, df[['Provinsi', 'IPM', 'Realisasi TKDD']],
+                                    corr=corr, pval=pval),
+        'diagnostik_regresi': lambda: _png(charts.diagnostik_regresi, hasil['ipm'].diagnostik_frame(),
+                                           n_params=len(hasil['ipm'].params), title='Diagnostik Residual: IPM'),
+    }
+    for name, fn in grafik.items():
+        tahap[f'grafik {name}'], _ = _time(fn, repeat)
+
+    gdf = synthetic_batas()
+    tahap['peta join'], merged = _time(lambda: geometry.join_provinsi(gdf, panel['Provinsi'][tahun])[0], repeat)
+    tahap['peta plot'], _ = _time(lambda: _png(charts.choropleth, merged, tahun=tahun), repeat)
+    return tahap
+
+
+def _commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(wilayah=(38, 514, 5000), tahun=(1, 20), repeat=3, seed=0):
+    import matplotlib
+
+    matplotlib.use('Agg')
+    hasil = []
+    for n_wilayah in wilayah:
+        for n_tahun in tahun:
+            hasil.append({
+                'skala': f'{n_wilayah}x{n_tahun}',
+                'wilayah': n_wilayah,
+                'tahun': n_tahun,
+                'baris': n_wilayah * n_tahun,
+                'tahap': run_skala(n_wilayah, n_tahun, repeat, seed),
+            })
+    return {
+        'meta': {
+            'commit': _commit(),
+            'waktu': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu': os.cpu_count(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'matplotlib': matplotlib.__version__,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'hasil': hasil,
+    }
+
+
+def bandingkan(baseline, hasil, ambang=AMBANG, selisih_min=SELISIH_MIN):
+    """Daftar tahap yang lebih lambat dari ``baseline`` lebih dari ``ambang`` (relatif) dan ``selisih_min`` detik."""
+    lama = {(row['skala'], name): detik for row in baseline['hasil'] for name, detik in row['tahap'].items()}
+    regresi = []
+    for row in hasil['hasil']:
+        for name, detik in row['tahap'].items():
+            sebelum = lama.get((row['skala'], name))
+            if sebelum is None:
+                continue
+            if detik > sebelum * (1 + ambang) and detik - sebelum > selisih_min:
+                regresi.append({'skala': row['skala'], 'tahap': name, 'sebelum': sebelum, 'sesudah': detik,
+                                'rasio': detik / sebelum if sebelum else float('inf')})
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--wilayah', type=int, nargs='+', default=[38, 514, 5000])
+    parser.add_argument('--tahun', type=int, nargs='+', default=[1, 20])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help='berkas JSON hasil (default: Output/benchmarks/<commit>.json)')
+    parser.add_argument('--baseline', type=Path, help='JSON hasil commit lain untuk dibandingkan')
+    parser.add_argument('--ambang', type=float, default=AMBANG, help='perlambatan relatif yang ditoleransi')
+    parser.add_argument('--selisih-min', type=float, default=SELISIH_MIN,
+                        help='perlambatan absolut minimum (detik) agar dihitung regresi')
+    args = parser.parse_args(argv)
+
+    hasil = run(args.wilayah, args.tahun, args.repeat, args.seed)
+    output = args.output or HASIL_DIR / f"{(hasil['meta']['commit'] or 'lokal')[:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(hasil, indent=2))
+
+    for row in hasil['hasil']:
+        print(f"{row['skala']} ({row['baris']:,} baris)")
+        for name, detik in row['tahap'].items():
+            print(f"  {name:<28} {detik:8.3f} s")
+    print(f"hasil ditulis ke {output}")
+
+    if args.baseline is None:
+        return 0
+    regresi = bandingkan(json.loads(args.baseline.read_text()), hasil, args.ambang, args.selisih_min)
+    for r in regresi:
+        print(f"REGRESI {r['skala']:<10} {r['tahap']:<28} {r['sebelum']:.3f} s -> {r['sesudah']:.3f} s "
+              f"(x{r['rasio']:.2f})")
+    if not regresi:
+        print(f"tidak ada regresi terhadap {args.baseline} (ambang {args.ambang:.0%})")
+    return 1 if regresi else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1 @@
+"""Modul pendukung dashboard TKDD TECHFEST 2025."""
@@ -0,0 +1,82 @@
+"""Backend grafik yang bisa ditukar untuk halaman dashboard.
+
+Halaman memanggil grafik lewat nama (misalnya ``"grouped_bar"``) dan
+backend aktif yang menentukan cara menampilkannya:
+
+* ``MatplotlibBackend`` merender PNG di server (lewat cache gambar). Backend
+  ini juga dipakai untuk ekspor berkas PNG/PDF.
+* ``VegaLiteBackend`` hanya mengirim spesifikasi JSON Vega-Lite (Altair);
+  render, hover, dan zoom dikerjakan browser.
+
+Grafik yang belum punya versi Vega-Lite otomatis memakai Matplotlib.
+"""
+import os
+
+from dashboard import telemetry
+
+
+class MatplotlibBackend:
+    name = "matplotlib"
+    label = "Statis (Matplotlib PNG)"
+
+    def builder(self, chart):
+        from dashboard import charts
+
+        return getattr(charts, chart)
+
+    def renders_on_server(self, chart):
+        return True
+
+    def render(self, chart, data, **params):
+        """Byte PNG grafik ``chart``, diambil dari cache gambar bila ada."""
+        from dashboard import figcache
+
+        return figcache.render(self.builder(chart), data, **params)
+
+    def show(self, st, chart, data, **params):
+        image = self.render(chart, data, **params)
+        with telemetry.fase("serialize"):
+            st.image(image, use_column_width=True)
+
+
+class VegaLiteBackend:
+    name = "vega-lite"
+    label = "Interaktif (Vega-Lite)"
+
+    def builder(self, chart):
+        from dashboard import charts_altair
+
+        return getattr(charts_altair, chart, None)
+
+    def renders_on_server(self, chart):
+        # Grafik tanpa versi Vega-Lite jatuh ke PNG Matplotlib
+        return self.builder(chart) is None
+
+    def render(self, chart, data, **params):
+        """Spesifikasi JSON Vega-Lite grafik ``chart``, atau byte PNG bila grafik belum punya versi Vega-Lite."""
+        builder = self.builder(chart)
+        if builder is None:
+            return BACKENDS["matplotlib"].render(chart, data, **params)
+        with telemetry.fase("render"):
+            spec = builder(data, **params)
+        with telemetry.fase("serialize"):
+            return spec.to_json()
+
+    def show(self, st, chart, data, **params):
+        builder = self.builder(chart)
+        if builder is None:
+            BACKENDS["matplotlib"].show(st, chart, data, **params)
+            return
+        with telemetry.fase("render"):
+            spec = builder(data, **params)
+        with telemetry.fase("serialize"):
+            st.altair_chart(spec, use_container_width=True)
+
+
+BACKENDS = {backend.name: backend for backend in (MatplotlibBackend(), VegaLiteBackend())}
+
+DEFAULT_BACKEND = os.environ.get("TKDD_CHART_BACKEND", "matplotlib")
+
+
+def get_backend(name=None):
+    return BACKENDS[name or DEFAULT_BACKEND]
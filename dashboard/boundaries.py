@@ -0,0 +1,192 @@
+"""Penyimpanan lokal batas wilayah 38 provinsi untuk peta realisasi TKDD.
+
+Batas wilayah dibaca dari GeoParquet di ``Data/geo`` beserta manifest
+berisi checksum SHA-256. Bila penyimpanan belum ada, proses pertama yang
+membutuhkannya mengunduh GeoJSON sekali (dengan batas waktu) dan
+membangunnya; setelah itu aplikasi tidak mengakses jaringan lagi. Setiap
+proses memuat berkas itu satu kali dan membaginya ke semua sesi
+Streamlit. Bila unduhan gagal atau berkas rusak, galatnya diingat (sampai
+berkasnya berubah) sehingga rerun berikutnya langsung menampilkan
+peringatan tanpa mencoba lagi. ``TKDD_GEO_DOWNLOAD=0`` mematikan unduhan
+pertama untuk host tanpa internet.
+
+Penyimpanan juga bisa dibangun ulang secara manual, di host yang
+terhubung internet atau dari berkas lokal::
+
+    python -m dashboard.boundaries                      # unduh dari GitHub (timeout 30 s)
+    python -m dashboard.boundaries --source prov.json   # impor berkas lokal
+    python -m dashboard.boundaries --verify
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+import urllib.request
+from functools import lru_cache
+
+from dashboard import telemetry
+from dashboard.config import DATA_DIR
+
+GEOJSON_URL = "https://raw.githubusercontent.com/ardian28/GeoJson-Indonesia-38-Provinsi/refs/heads/main/Provinsi/38%20Provinsi%20Indonesia%20-%20Provinsi.json"
+
+# Naikkan jika skema berkas penyimpanan berubah agar salinan lama dibangun ulang
+STORE_VERSION = 1
+
+# Batas waktu unduhan GeoJSON (CLI dan unduhan pertama), dalam detik
+DOWNLOAD_TIMEOUT = 30
+
+# Unduh GeoJSON sekali saat penyimpanan lokal belum ada
+UNDUH_PERTAMA = os.environ.get("TKDD_GEO_DOWNLOAD", "1") == "1"
+
+STORE_DIR = DATA_DIR / "geo"
+STORE_PATH = STORE_DIR / "provinsi_38.parquet"
+MANIFEST_PATH = STORE_DIR / "provinsi_38.json"
+
+_lock = threading.Lock()
+
+
+class BoundaryStoreError(RuntimeError):
+    """Batas wilayah tidak tersedia atau berkas penyimpanan rusak."""
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _baca_geojson(source, timeout):
+    import geopandas as gpd
+
+    if str(source).startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=timeout) as response:
+            return gpd.read_file(io.BytesIO(response.read()))
+    return gpd.read_file(source)
+
+
+def build_store(source=GEOJSON_URL, timeout=DOWNLOAD_TIMEOUT):
+    """Baca GeoJSON dari ``source`` (URL atau path) dan tulis GeoParquet + manifest."""
+    gdf = _baca_geojson(source, timeout)
+    if "PROVINSI" not in gdf.columns:
+        raise BoundaryStoreError(f"Kolom 'PROVINSI' tidak ditemukan pada {source}")
+    gdf = gdf[["PROVINSI", "geometry"]].reset_index(drop=True)
+
+    STORE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = STORE_PATH.with_suffix(".parquet.tmp")
+    gdf.to_parquet(tmp_path, index=False)
+    tmp_path.replace(STORE_PATH)
+
+    manifest = {
+        "version": STORE_VERSION,
+        "source": str(source),
+        "sha256": _sha256(STORE_PATH),
+        "rows": len(gdf),
+        "crs": gdf.crs.to_string() if gdf.crs is not None else None,
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    return STORE_PATH
+
+
+def read_manifest():
+    if not MANIFEST_PATH.exists():
+        return None
+    return json.loads(MANIFEST_PATH.read_text())
+
+
+def verify_store():
+    """True jika berkas penyimpanan ada, versinya cocok, dan checksum-nya valid."""
+    manifest = read_manifest()
+    if manifest is None or not STORE_PATH.exists():
+        return False
+    if manifest.get("version") != STORE_VERSION:
+        return False
+    return _sha256(STORE_PATH) == manifest.get("sha256")
+
+
+def store_cap():
+    """Ukuran/mtime berkas penyimpanan dan manifest; None bila salah satunya tidak ada.
+
+    Berubah setiap kali penyimpanan dibangun ulang, sehingga dipakai sebagai
+    kunci cache turunan batas wilayah.
+    """
+    try:
+        store, manifest = STORE_PATH.stat(), MANIFEST_PATH.stat()
+    except OSError:
+        return None
+    return store.st_size, store.st_mtime_ns, manifest.st_mtime_ns
+
+
+@lru_cache(maxsize=1)
+def _load_boundaries(cap):
+    """GeoDataFrame dari penyimpanan lokal, atau ``BoundaryStoreError``; keduanya diingat per ``cap``.
+
+    ``cap`` None berarti penyimpanan belum ada: GeoJSON diunduh sekali
+    (bila ``UNDUH_PERTAMA``); kegagalannya diingat di kunci yang sama.
+    """
+    import geopandas as gpd
+
+    if cap is None:
+        petunjuk = (
+            "Jalankan `python -m dashboard.boundaries` di host yang terhubung internet, "
+            "atau `python -m dashboard.boundaries --source <berkas.json>` untuk mengimpor GeoJSON."
+        )
+        if not UNDUH_PERTAMA:
+            return BoundaryStoreError(f"Batas wilayah belum tersedia secara lokal ({STORE_PATH} tidak ada). {petunjuk}")
+        try:
+            with telemetry.fase("download"):
+                build_store(GEOJSON_URL, DOWNLOAD_TIMEOUT)
+        except (OSError, RuntimeError, ValueError) as exc:
+            # URLError/timeout turunan OSError; galat GeoJSON rusak dari pyogrio turunan RuntimeError
+            return BoundaryStoreError(
+                f"Batas wilayah belum tersedia secara lokal dan unduhan pertama gagal ({exc}). {petunjuk}"
+            )
+    if not verify_store():
+        return BoundaryStoreError(f"Checksum {STORE_PATH} tidak cocok dengan manifest")
+    with telemetry.fase("load"):
+        return gpd.read_parquet(STORE_PATH)
+
+
+def load_boundaries():
+    """GeoDataFrame batas provinsi, dimuat sekali per proses.
+
+    Objek yang dikembalikan dipakai bersama oleh semua sesi; jangan diubah
+    di tempat (gunakan ``merge``/``copy`` seperti biasa). ``BoundaryStoreError``
+    bila penyimpanan lokal tidak ada atau rusak.
+    """
+    with _lock:
+        hasil = _load_boundaries(store_cap())
+    if isinstance(hasil, BoundaryStoreError):
+        # Instance baru agar traceback galat yang diingat tidak terus bertambah
+        raise BoundaryStoreError(*hasil.args)
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun penyimpanan lokal batas provinsi.")
+    parser.add_argument("--source", default=GEOJSON_URL, help="URL atau path berkas GeoJSON")
+    parser.add_argument("--timeout", type=float, default=DOWNLOAD_TIMEOUT, help="Batas waktu unduhan (detik)")
+    parser.add_argument("--verify", action="store_true", help="Hanya periksa checksum berkas yang ada")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        ok = verify_store()
+        print(f"{STORE_PATH}: {'OK' if ok else 'TIDAK VALID'}")
+        return 0 if ok else 1
+
+    try:
+        path = build_store(args.source, args.timeout)
+    except (OSError, RuntimeError, ValueError) as exc:
+        # URLError/timeout turunan OSError; berkas tak terbaca dari fiona/pyogrio turunan ValueError/RuntimeError
+        print(f"GAGAL membangun penyimpanan dari {args.source}: {exc}")
+        return 1
+    manifest = read_manifest()
+    print(f"{path} ({manifest['rows']} provinsi, sha256={manifest['sha256'][:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,416 @@
+"""Penyimpanan cache bersama lintas proses dan replika.
+
+Cache di modul dashboard (dataset, model, gambar) berada di memori proses.
+Bila beberapa replika dijalankan di belakang load balancer, setiap replika
+mengulang pekerjaan yang sama. Modul ini menyediakan tingkat cache kedua
+yang dipakai bersama: satu replika menghitung, replika lain membaca.
+
+Backend dipilih lewat ``TKDD_CACHE_STORE``:
+
+* kosong (default): tanpa cache bersama, perilaku per proses seperti biasa;
+* ``memory://``: dict di memori proses (untuk uji dan benchmark);
+* ``dir:///path``: satu berkas per entri di direktori (boleh volume bersama);
+* ``sqlite:///path``: satu berkas SQLite mode WAL, aman untuk banyak proses;
+* ``redis://host:port/db``: server Redis lewat ``redis-py`` (opsional);
+* ``local-redis:///path``: pengganti lokal Redis berbasis SQLite dengan
+  subset API ``redis-py``, untuk menguji adaptor Redis tanpa server.
+
+Path kosong memakai lokasi default di ``Output/cache``. Setiap entri
+disimpan per ``(namespace, key)`` bersama versi data, waktu kedaluwarsa
+(``TKDD_CACHE_TTL`` detik, default tanpa batas), dan ID replika penulis
+(``TKDD_REPLICA``, default ``host-pid``). Entri dengan versi lain dianggap
+miss; ``invalidate`` menghapus entri per namespace dan/atau versi.
+
+Setiap store menghitung akses per namespace: ``hit`` (entri tulisan
+replika ini), ``replika`` (entri tulisan replika lain), dan ``miss``.
+Rasio hit antarreplika dilaporkan lewat ``dashboard.telemetry``.
+"""
+import abc
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import socket
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from dashboard.config import CACHE_DIR
+
+ENV_URL = "TKDD_CACHE_STORE"
+ENV_TTL = "TKDD_CACHE_TTL"
+ENV_REPLIKA = "TKDD_REPLICA"
+
+Entri = namedtuple("Entri", "nilai versi kedaluwarsa penulis")
+
+_AMAN = re.compile(r"[\w.-]{1,128}")
+
+
+def replika_id():
+    return os.environ.get(ENV_REPLIKA) or f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _ttl_default():
+    ttl = os.environ.get(ENV_TTL)
+    return float(ttl) if ttl else None
+
+
+def _bungkus(entri):
+    # Panjang header (4 byte) + header JSON + nilai; dipakai backend berbasis berkas/Redis
+    header = json.dumps([entri.versi, entri.kedaluwarsa, entri.penulis]).encode()
+    return len(header).to_bytes(4, "big") + header + entri.nilai
+
+
+def _buka(blob):
+    n = int.from_bytes(blob[:4], "big")
+    versi, kedaluwarsa, penulis = json.loads(blob[4:4 + n])
+    return Entri(bytes(blob[4 + n:]), versi, kedaluwarsa, penulis)
+
+
+class Store(abc.ABC):
+    """Antarmuka cache bersama; subclass mengisi ``_baca``, ``_tulis``, ``_hapus``, dan ``_daftar``."""
+
+    def __init__(self, ttl=None, replika=None):
+        self.ttl = ttl
+        self.replika = replika or replika_id()
+        self._counts = {}
+        self._stats_lock = threading.Lock()
+
+    def _catat(self, namespace, hasil):
+        with self._stats_lock:
+            counts = self._counts.setdefault(namespace, {})
+            counts[hasil] = counts.get(hasil, 0) + 1
+
+    def get(self, namespace, key, version=""):
+        """Nilai ``bytes`` entri, atau None bila tidak ada, kedaluwarsa, atau versinya berbeda."""
+        entri = self._baca(namespace, key)
+        if entri is not None and entri.kedaluwarsa is not None and entri.kedaluwarsa <= time.time():
+            self._hapus(namespace, key)
+            entri = None
+        # Versi lain tidak dihapus: replika yang belum memuat data baru masih bisa memakainya
+        if entri is None or entri.versi != version:
+            self._catat(namespace, "miss")
+            return None
+        self._catat(namespace, "hit" if entri.penulis == self.replika else "replika")
+        return entri.nilai
+
+    def set(self, namespace, key, value, version="", ttl=None):
+        """Simpan ``value`` (bytes); ``ttl`` detik, default ``self.ttl`` (None = tanpa batas)."""
+        ttl = ttl if ttl is not None else self.ttl
+        kedaluwarsa = time.time() + ttl if ttl is not None else None
+        self._tulis(namespace, key, Entri(bytes(value), version, kedaluwarsa, self.replika))
+
+    def delete(self, namespace, key):
+        self._hapus(namespace, key)
+
+    def invalidate(self, namespace=None, version=None):
+        """Hapus entri ``namespace`` (None = semua) yang versinya ``version`` (None = semua versi)."""
+        hapus = [(ns, key) for ns, key, versi, _ in self._daftar(namespace)
+                 if version is None or versi == version]
+        for ns, key in hapus:
+            self._hapus(ns, key)
+        return len(hapus)
+
+    def purge(self):
+        """Hapus semua entri yang sudah kedaluwarsa."""
+        now = time.time()
+        hapus = [(ns, key) for ns, key, _, kedaluwarsa in self._daftar(None)
+                 if kedaluwarsa is not None and kedaluwarsa <= now]
+        for ns, key in hapus:
+            self._hapus(ns, key)
+        return len(hapus)
+
+    def clear(self):
+        self.invalidate()
+
+    def stats(self):
+        """Dict ``{namespace: {"hit": n, "replika": n, "miss": n}}`` untuk proses ini."""
+        with self._stats_lock:
+            return {namespace: dict(counts) for namespace, counts in self._counts.items()}
+
+    def rasio_replika(self):
+        """Porsi akses yang dilayani entri tulisan replika lain."""
+        counts = self.stats().values()
+        total = sum(sum(c.values()) for c in counts)
+        return sum(c.get("replika", 0) for c in counts) / total if total else float("nan")
+
+    @abc.abstractmethod
+    def _baca(self, namespace, key):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _tulis(self, namespace, key, entri):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _hapus(self, namespace, key):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _daftar(self, namespace):
+        """Iterasi ``(namespace, key, versi, kedaluwarsa)`` semua entri ``namespace`` (None = semua)."""
+        raise NotImplementedError
+
+
+class MemoryStore(Store):
+    """Dict di memori proses; tidak berbagi apa pun antarproses."""
+
+    def __init__(self, ttl=None, replika=None):
+        super().__init__(ttl, replika)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _baca(self, namespace, key):
+        with self._lock:
+            return self._entries.get((namespace, key))
+
+    def _tulis(self, namespace, key, entri):
+        with self._lock:
+            self._entries[(namespace, key)] = entri
+
+    def _hapus(self, namespace, key):
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+
+    def _daftar(self, namespace):
+        with self._lock:
+            return [(ns, key, e.versi, e.kedaluwarsa) for (ns, key), e in self._entries.items()
+                    if namespace is None or ns == namespace]
+
+
+class DirectoryStore(Store):
+    """Satu berkas per entri di ``root/<namespace>/``; tulis atomik lewat rename."""
+
+    def __init__(self, root, ttl=None, replika=None):
+        super().__init__(ttl, replika)
+        self.root = Path(root)
+
+    def _path(self, namespace, key):
+        # Kunci yang tidak aman sebagai nama berkas di-hash
+        name = key if _AMAN.fullmatch(key) else hashlib.sha1(key.encode()).hexdigest()
+        return self.root / namespace / name
+
+    def _baca(self, namespace, key):
+        try:
+            return _buka(self._path(namespace, key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _tulis(self, namespace, key, entri):
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(_bungkus(entri))
+        tmp_path.replace(path)
+
+    def _hapus(self, namespace, key):
+        try:
+            self._path(namespace, key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _daftar(self, namespace):
+        folders = [self.root / namespace] if namespace is not None else (
+            [p for p in self.root.iterdir() if p.is_dir()] if self.root.exists() else [])
+        rows = []
+        for folder in folders:
+            for path in folder.glob("*"):
+                if path.suffix == ".tmp":
+                    continue
+                # Hanya header yang dibaca
+                try:
+                    with open(path, "rb") as f:
+                        n = int.from_bytes(f.read(4), "big")
+                        versi, kedaluwarsa, _ = json.loads(f.read(n))
+                except (OSError, ValueError):
+                    continue
+                rows.append((folder.name, path.name, versi, kedaluwarsa))
+        return rows
+
+
+class SQLiteStore(Store):
+    """Satu berkas SQLite (mode WAL) yang dipakai bersama semua proses di host/volume yang sama."""
+
+    def __init__(self, path, ttl=None, replika=None):
+        super().__init__(ttl, replika)
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Satu koneksi per thread; autocommit, menunggu kunci penulis lain hingga 30 detik
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entri (namespace TEXT, kunci TEXT, versi TEXT, "
+                "kedaluwarsa REAL, penulis TEXT, nilai BLOB, PRIMARY KEY (namespace, kunci))"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _baca(self, namespace, key):
+        row = self._conn().execute(
+            "SELECT nilai, versi, kedaluwarsa, penulis FROM entri WHERE namespace = ? AND kunci = ?",
+            (namespace, key),
+        ).fetchone()
+        return Entri(bytes(row[0]), *row[1:]) if row is not None else None
+
+    def _tulis(self, namespace, key, entri):
+        self._conn().execute(
+            "INSERT OR REPLACE INTO entri VALUES (?, ?, ?, ?, ?, ?)",
+            (namespace, key, entri.versi, entri.kedaluwarsa, entri.penulis, entri.nilai),
+        )
+
+    def _hapus(self, namespace, key):
+        self._conn().execute("DELETE FROM entri WHERE namespace = ? AND kunci = ?", (namespace, key))
+
+    def _daftar(self, namespace):
+        if namespace is None:
+            return self._conn().execute("SELECT namespace, kunci, versi, kedaluwarsa FROM entri").fetchall()
+        return self._conn().execute(
+            "SELECT namespace, kunci, versi, kedaluwarsa FROM entri WHERE namespace = ?", (namespace,)
+        ).fetchall()
+
+    def invalidate(self, namespace=None, version=None):
+        # Satu DELETE, tanpa membaca daftar entri
+        where, args = [], []
+        if namespace is not None:
+            where.append("namespace = ?")
+            args.append(namespace)
+        if version is not None:
+            where.append("versi = ?")
+            args.append(version)
+        sql = "DELETE FROM entri" + (" WHERE " + " AND ".join(where) if where else "")
+        return self._conn().execute(sql, args).rowcount
+
+
+class RedisStore(Store):
+    """Adaptor untuk klien dengan API ``redis-py`` (``get``, ``set(px=)``, ``delete``, ``scan_iter``).
+
+    Kedaluwarsa ditangani Redis sendiri lewat ``PX``; header entri tetap
+    memuat versi dan penulis.
+    """
+
+    def __init__(self, client, prefix="tkdd", ttl=None, replika=None):
+        super().__init__(ttl, replika)
+        self.client = client
+        self.prefix = prefix
+
+    def _kunci(self, namespace, key):
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _baca(self, namespace, key):
+        blob = self.client.get(self._kunci(namespace, key))
+        return _buka(blob) if blob is not None else None
+
+    def _tulis(self, namespace, key, entri):
+        px = None
+        if entri.kedaluwarsa is not None:
+            px = max(1, int((entri.kedaluwarsa - time.time()) * 1000))
+        self.client.set(self._kunci(namespace, key), _bungkus(entri), px=px)
+
+    def _hapus(self, namespace, key):
+        self.client.delete(self._kunci(namespace, key))
+
+    def _daftar(self, namespace):
+        rows = []
+        pola = f"{self.prefix}:{namespace if namespace is not None else '*'}:*"
+        for name in self.client.scan_iter(match=pola):
+            name = name.decode() if isinstance(name, bytes) else name
+            blob = self.client.get(name)
+            if blob is None:
+                continue
+            entri = _buka(blob)
+            ns, key = name[len(self.prefix) + 1:].split(":", 1)
+            rows.append((ns, key, entri.versi, entri.kedaluwarsa))
+        return rows
+
+
+class LocalRedis:
+    """Pengganti lokal server Redis: subset API ``redis-py`` di atas satu berkas SQLite.
+
+    Berkasnya bisa dipakai bersama beberapa proses sehingga ``RedisStore``
+    dapat diuji lintas proses tanpa server Redis.
+    """
+
+    def __init__(self, path):
+        self._store = SQLiteStore(path, replika="local-redis")
+
+    def get(self, name):
+        entri = self._store._baca("redis", name)
+        if entri is None:
+            return None
+        if entri.kedaluwarsa is not None and entri.kedaluwarsa <= time.time():
+            self._store._hapus("redis", name)
+            return None
+        return entri.nilai
+
+    def set(self, name, value, px=None, ex=None):
+        ttl = px / 1000 if px is not None else ex
+        kedaluwarsa = time.time() + ttl if ttl is not None else None
+        self._store._tulis("redis", name, Entri(bytes(value), "", kedaluwarsa, ""))
+        return True
+
+    def delete(self, *names):
+        for name in names:
+            self._store._hapus("redis", name)
+        return len(names)
+
+    def scan_iter(self, match=None):
+        for _, name, _, _ in self._store._daftar("redis"):
+            if match is None or fnmatch.fnmatchcase(name, match):
+                yield name.encode()
+
+    def flushdb(self):
+        self._store.invalidate("redis")
+        return True
+
+
+def dari_url(url, ttl=None, replika=None):
+    """Store untuk ``url`` (lihat docstring modul), atau None bila ``url`` kosong."""
+    if not url:
+        return None
+    scheme, _, rest = url.partition("://")
+    if scheme == "memory":
+        return MemoryStore(ttl, replika)
+    if scheme == "dir":
+        return DirectoryStore(rest or CACHE_DIR / "store", ttl, replika)
+    if scheme == "sqlite":
+        return SQLiteStore(rest or CACHE_DIR / "store.sqlite", ttl, replika)
+    if scheme == "local-redis":
+        return RedisStore(LocalRedis(rest or CACHE_DIR / "local-redis.sqlite"), ttl=ttl, replika=replika)
+    if scheme in ("redis", "rediss", "unix"):
+        import redis
+
+        return RedisStore(redis.Redis.from_url(url), ttl=ttl, replika=replika)
+    raise ValueError(f"Skema {ENV_URL} tidak dikenal: {url!r}")
+
+
+_store = None
+_dimuat = False
+_lock = threading.Lock()
+
+
+def get_store():
+    """Store bersama yang dikonfigurasi (dari ``TKDD_CACHE_STORE`` saat pertama dipanggil), atau None."""
+    global _store, _dimuat
+    with _lock:
+        if not _dimuat:
+            _store = dari_url(os.environ.get(ENV_URL), ttl=_ttl_default())
+            _dimuat = True
+        return _store
+
+
+def configure(url=None, store=None):
+    """Ganti store bersama global dengan ``store`` atau store dari ``url`` (keduanya kosong = nonaktif)."""
+    global _store, _dimuat
+    with _lock:
+        _store = store if store is not None else dari_url(url, ttl=_ttl_default())
+        _dimuat = True
+    return _store
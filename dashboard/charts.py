@@ -0,0 +1,232 @@
+"""Pembuat gambar Matplotlib untuk setiap grafik di dashboard.
+
+Setiap fungsi menerima DataFrame (ditambah parameter grafik) dan
+mengembalikan ``matplotlib.figure.Figure`` baru tanpa memakai state global
+pyplot, sehingga aman dipanggil dari cache gambar maupun dari luar
+Streamlit.
+"""
+from statistics import NormalDist
+
+import numpy as np
+import seaborn as sns
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+from dashboard import panels
+
+
+def grouped_bar(df_sorted, label_col='Provinsi'):
+    """Grouped bar chart Pagu vs Realisasi TKDD per wilayah."""
+    fig = Figure(figsize=(14, 6))
+    ax1 = fig.subplots()
+    bar_width = 0.4
+    index = np.arange(len(df_sorted))
+
+    ax1.bar(index, df_sorted['Pagu TKDD'], bar_width, label='Pagu TKDD')
+    ax1.bar(index + bar_width, df_sorted['Realisasi TKDD'], bar_width, label='Realisasi TKDD')
+
+    ax1.set_xlabel(label_col)
+    ax1.set_ylabel('Nilai (Rp)')
+    ax1.set_title(f'Perbandingan Pagu dan Realisasi TKDD per {label_col}')
+    ax1.set_xticks(index + bar_width / 2)
+    ax1.set_xticklabels(df_sorted[label_col], rotation=90)
+    ax1.legend()
+    fig.tight_layout()
+    return fig
+
+
+def stacked_bar(df_sorted, label_col='Provinsi'):
+    """Stacked bar chart 100% proporsi Pagu dan Realisasi TKDD."""
+    fig = Figure(figsize=(14, 6))
+    ax2 = fig.subplots()
+    index = np.arange(len(df_sorted))
+    bar_width = 0.6
+
+    ax2.bar(index, df_sorted['Pagu (%)'], bar_width, label='Pagu TKDD')
+    ax2.bar(index, df_sorted['Realisasi (%)'], bar_width, bottom=df_sorted['Pagu (%)'], label='Realisasi TKDD')
+
+    ax2.set_xticks(index)
+    ax2.set_xticklabels(df_sorted[label_col], rotation=90)
+    ax2.set_ylabel('Persentase (%)')
+    ax2.set_title(f'Stacked Bar Chart 100%: Pagu vs Realisasi TKDD per {label_col}')
+    ax2.legend()
+    fig.tight_layout()
+    return fig
+
+
+def choropleth(merged, tahun=2023):
+    """Peta persentase realisasi TKDD dari GeoDataFrame hasil merge."""
+    fig = Figure(figsize=(14, 10))
+    ax3 = fig.subplots()
+    merged.plot(
+        column='Persentase Realisasi TKDD',
+        cmap='viridis',
+        linewidth=0.5,
+        ax=ax3,
+        edgecolor='0.5',
+        legend=True,
+        legend_kwds={
+            'label': "% Realisasi TKDD",
+            'shrink': 0.3,
+            'aspect': 10,
+            'orientation': 'vertical',
+            'pad': 0.01
+        },
+        missing_kwds={
+            'color': 'lightgrey',
+            'edgecolor': '0.5',
+            'label': 'Data Tidak Tersedia'
+        }
+    )
+
+    # Tambahkan legend manual
+    missing_patch = Patch(facecolor='lightgrey', edgecolor='0.5', label='Data Tidak Tersedia')
+    ax3.legend(handles=[missing_patch], loc='lower left', title='Keterangan')
+
+    ax3.set_title(f'Peta Realisasi TKDD per Provinsi (%) Tahun {tahun}')
+    ax3.axis('off')
+    fig.tight_layout()
+    return fig
+
+
+def label_capacity(ax, fontsize=None):
+    """Jumlah baris label yang muat sepanjang tinggi sumbu pada ukuran huruf ``fontsize``."""
+    import matplotlib
+
+    fontsize = fontsize or matplotlib.rcParams['font.size']
+    ax_height_pt = ax.get_position().height * ax.figure.get_figheight() * 72
+    return max(int(ax_height_pt // fontsize), 1)
+
+
+def _barh_verts(posisi, nilai, height):
+    """Titik sudut persegi panjang setiap batang horizontal, bentuk (n, 4, 2)."""
+    bawah, atas = posisi - height / 2, posisi + height / 2
+    nol = np.zeros_like(nilai)
+    return np.stack([
+        np.column_stack([nol, bawah]),
+        np.column_stack([nilai, bawah]),
+        np.column_stack([nilai, atas]),
+        np.column_stack([nol, atas]),
+    ], axis=1)
+
+
+def realisasi_barh(df_sorted, label_col='Provinsi', tahun=2023, show_labels='auto'):
+    """Bar chart horizontal persentase realisasi, diurutkan dari tertinggi.
+
+    Label nilai dipasang sekaligus lewat ``bar_label`` dari array NumPy.
+    Dengan ``show_labels='auto'`` label nilai disembunyikan bila batang lebih
+    banyak daripada baris teks yang muat di sumbu; pada kondisi itu batang
+    digambar sebagai satu ``PolyCollection`` dan label wilayah dijarangkan.
+    """
+    fig = Figure(figsize=(12, 10))
+    ax = fig.subplots()
+    persen = df_sorted['Persentase Realisasi TKDD'].to_numpy(dtype='float64')
+    nama = df_sorted[label_col].to_numpy()
+    posisi = np.arange(len(persen))
+    warna = sns.desaturate('skyblue', 0.75)
+
+    kapasitas = label_capacity(ax)
+    padat = len(persen) > kapasitas
+    if show_labels == 'auto':
+        show_labels = not padat
+
+    if show_labels or not padat:
+        bars = ax.barh(posisi, persen, height=0.8, color=warna)
+        # Tambahkan anotasi nilai persentase
+        if show_labels:
+            ax.bar_label(bars, labels=np.char.mod('%.1f%%', persen), padding=3)
+    else:
+        ax.add_collection(PolyCollection(_barh_verts(posisi, persen, 0.8), facecolors=warna, edgecolors='none'))
+
+    step = int(np.ceil(len(persen) / kapasitas)) if padat else 1
+    ax.set_yticks(posisi[::step], labels=nama[::step])
+    ax.set_ylim(len(persen) - 0.5, -0.5)
+
+    ax.set_xlabel('Persentase Realisasi TKDD')
+    ax.set_ylabel(label_col)
+    ax.set_title(f'Persentase Realisasi TKDD per {label_col} ({tahun})\nDiurutkan dari Tertinggi ke Terendah')
+    ax.set_xlim(0, max(np.nanmax(persen) * 1.1, 105))
+    fig.tight_layout()
+    return fig
+
+
+def scatter_grid(data, variabels, target, fit=None):
+    """Grid scatter plot (3 kolom) setiap variabel terhadap ``target``.
+
+    Digambar oleh ``dashboard.panels`` dalam satu lintasan; ``fit`` opsional
+    ``'ols'`` atau ``'lowess'``.
+    """
+    return panels.scatter_panels(panels.melt(data, variabels, target), target, order=variabels, fit=fit)
+
+
+def korelasi_heatmap(corr_target, title):
+    """Heatmap satu kolom korelasi terhadap variabel target."""
+    fig = Figure(figsize=(6, 6))
+    ax = fig.subplots()
+    sns.heatmap(corr_target, annot=True, cmap='Blues', center=0, fmt=".2f", ax=ax)
+    ax.set_title(title)
+    return fig
+
+
+def ipm_scatter(data, corr, pval):
+    """Scatter plot IPM vs Realisasi TKDD dengan garis regresi dan korelasi Pearson."""
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    sns.scatterplot(data=data, x='IPM', y='Realisasi TKDD', color='teal', s=60, edgecolor='black', ax=ax)
+    sns.regplot(data=data, x='IPM', y='Realisasi TKDD', scatter=False, color='red', ax=ax)
+
+    ax.set_title(f'Scatter Plot: IPM vs Realisasi TKDD\nKorelasi Pearson = {corr:.2f} (p = {pval:.4f})')
+    ax.set_xlabel('IPM')
+    ax.set_ylabel('Realisasi TKDD')
+    ax.grid(True)
+    return fig
+
+
+def diagnostik_regresi(frame, n_params, title, label_top=3):
+    """Tiga panel diagnostik OLS: residual vs fitted, QQ residual, dan leverage dengan kontur jarak Cook."""
+    fig = Figure(figsize=(18, 5.5))
+    ax_res, ax_qq, ax_lev = fig.subplots(1, 3)
+    fitted = frame['Fitted'].to_numpy()
+    resid = frame['Residual'].to_numpy()
+    student = frame['Residual terstudentisasi'].to_numpy()
+    leverage = frame['Leverage'].to_numpy()
+    cooks = frame["Cook's D"].to_numpy()
+    labels = frame['Provinsi'].to_numpy()
+    top = np.argsort(cooks)[::-1][:label_top]
+
+    ax_res.scatter(fitted, resid, color='teal', edgecolor='black', s=40)
+    ax_res.axhline(0, color='red', linewidth=1)
+    ax_res.set_xlabel('Fitted')
+    ax_res.set_ylabel('Residual')
+    ax_res.set_title('Residual vs Fitted')
+
+    # Kuantil normal teoretis dengan posisi plot Blom, seperti scipy.stats.probplot
+    n = len(student)
+    teoretis = np.array([NormalDist().inv_cdf((i - 0.375) / (n + 0.25)) for i in range(1, n + 1)])
+    ax_qq.scatter(teoretis, np.sort(student), color='teal', edgecolor='black', s=40)
+    batas = [teoretis.min(), teoretis.max()]
+    ax_qq.plot(batas, batas, color='red', linewidth=1)
+    ax_qq.set_xlabel('Kuantil normal teoretis')
+    ax_qq.set_ylabel('Residual terstudentisasi')
+    ax_qq.set_title('Normal Q-Q')
+
+    ax_lev.scatter(leverage, student, color='teal', edgecolor='black', s=40)
+    # Kontur jarak Cook 0,5 dan 1: |r| = sqrt(D * p * (1 - h) / h)
+    h = np.linspace(max(leverage.min() * 0.9, 1e-3), min(leverage.max() * 1.05, 0.999), 100)
+    for d, style in ((0.5, '--'), (1.0, ':')):
+        r = np.sqrt(d * n_params * (1 - h) / h)
+        ax_lev.plot(h, r, color='red', linestyle=style, linewidth=1, label=f"Cook's D = {d}")
+        ax_lev.plot(h, -r, color='red', linestyle=style, linewidth=1)
+    ax_lev.set_ylim(min(student.min(), -3) * 1.1, max(student.max(), 3) * 1.1)
+    for i in top:
+        ax_lev.annotate(labels[i], (leverage[i], student[i]), xytext=(4, 4), textcoords='offset points', fontsize=8)
+    ax_lev.set_xlabel('Leverage')
+    ax_lev.set_ylabel('Residual terstudentisasi')
+    ax_lev.set_title("Leverage dan Jarak Cook")
+    ax_lev.legend(loc='best', fontsize=8)
+
+    fig.suptitle(title)
+    fig.tight_layout()
+    return fig
+
@@ -0,0 +1,150 @@
+"""Pembuat grafik Vega-Lite (Altair) yang dirender di browser.
+
+Nama dan parameter fungsi sama dengan ``dashboard.charts`` sehingga backend
+bisa ditukar tanpa mengubah halaman. Server hanya mengirim spesifikasi JSON
+berisi kolom yang benar-benar dipakai grafik; render, hover, dan zoom
+terjadi di sisi klien.
+"""
+import json
+
+import altair as alt
+import pandas as pd
+
+
+def _q(field, title=None, **kwargs):
+    return {"field": field, "type": "quantitative", "title": title or field, **kwargs}
+
+
+def _n(field, title=None, **kwargs):
+    return {"field": field, "type": "nominal", "title": title or field, **kwargs}
+
+
+def grouped_bar(df_sorted, label_col='Provinsi'):
+    data = df_sorted[[label_col, 'Pagu TKDD', 'Realisasi TKDD']]
+    return alt.Chart(data, title=f'Perbandingan Pagu dan Realisasi TKDD per {label_col}').transform_fold(
+        ['Pagu TKDD', 'Realisasi TKDD'], as_=['Jenis', 'Nilai']
+    ).mark_bar().encode(
+        x=alt.X(**_n(label_col, sort=list(data[label_col]))),
+        xOffset=alt.XOffset('Jenis:N'),
+        y=alt.Y('Nilai:Q', title='Nilai (Rp)'),
+        color=alt.Color('Jenis:N', title=None),
+        tooltip=[alt.Tooltip(**_n(label_col)), 'Jenis:N', alt.Tooltip('Nilai:Q', format=',.0f')],
+    ).interactive()
+
+
+def stacked_bar(df_sorted, label_col='Provinsi'):
+    data = df_sorted[[label_col, 'Pagu (%)', 'Realisasi (%)']]
+    return alt.Chart(data, title=f'Stacked Bar Chart 100%: Pagu vs Realisasi TKDD per {label_col}').transform_fold(
+        ['Pagu (%)', 'Realisasi (%)'], as_=['Jenis', 'Persen']
+    ).mark_bar().encode(
+        x=alt.X(**_n(label_col, sort=list(data[label_col]))),
+        y=alt.Y('Persen:Q', title='Persentase (%)', stack='zero'),
+        color=alt.Color('Jenis:N', title=None),
+        order=alt.Order('Jenis:N'),
+        tooltip=[alt.Tooltip(**_n(label_col)), 'Jenis:N', alt.Tooltip('Persen:Q', format='.2f')],
+    )
+
+
+def choropleth(merged, tahun=2023):
+    # GeoDataFrame dikirim sebagai fitur GeoJSON (NaN menjadi null lewat to_json)
+    features = json.loads(merged[['PROVINSI', 'Persentase Realisasi TKDD', 'geometry']].to_json())
+    data = alt.InlineData(values=features, format=alt.DataFormat(property='features', type='json'))
+    return alt.Chart(data, title=f'Peta Realisasi TKDD per Provinsi (%) Tahun {tahun}').mark_geoshape(
+        stroke='gray', strokeWidth=0.5
+    ).encode(
+        color=alt.condition(
+            'isValid(datum.properties["Persentase Realisasi TKDD"])',
+            alt.Color(**_q('properties.Persentase Realisasi TKDD', '% Realisasi TKDD'), scale=alt.Scale(scheme='viridis')),
+            alt.value('lightgrey'),
+        ),
+        tooltip=[alt.Tooltip(**_n('properties.PROVINSI', 'Provinsi')),
+                 alt.Tooltip(**_q('properties.Persentase Realisasi TKDD', '% Realisasi'), format='.1f')],
+    ).project(type='mercator')
+
+
+# Ukuran huruf label Vega-Lite (px) dan tinggi maksimum bar chart, setara
+# sumbu figure 10 inci pada ``dashboard.charts.realisasi_barh``
+LABEL_FONTSIZE = 11
+TINGGI_MAKS = 720
+
+
+def label_capacity(height, fontsize=LABEL_FONTSIZE):
+    """Jumlah baris label yang muat sepanjang ``height`` piksel pada ukuran huruf ``fontsize``."""
+    return max(int(height // fontsize), 1)
+
+
+def realisasi_barh(df_sorted, label_col='Provinsi', tahun=2023, show_labels='auto'):
+    # Aturan 'auto' sama dengan pembuat Matplotlib: label nilai disembunyikan
+    # bila batang lebih banyak daripada baris teks yang muat, dan label
+    # wilayah dijarangkan lewat labelOverlap
+    data = df_sorted[[label_col, 'Persentase Realisasi TKDD']]
+    height = min(max(15 * len(data), 300), TINGGI_MAKS)
+    padat = len(data) > label_capacity(height)
+    if show_labels == 'auto':
+        show_labels = not padat
+    base = alt.Chart(
+        data,
+        title=f'Persentase Realisasi TKDD per {label_col} ({tahun}) - Diurutkan dari Tertinggi ke Terendah',
+    ).encode(
+        y=alt.Y(**_n(label_col, sort=list(data[label_col])), axis=alt.Axis(labelOverlap=padat)),
+        x=alt.X(**_q('Persentase Realisasi TKDD')),
+        tooltip=[alt.Tooltip(**_n(label_col)), alt.Tooltip(**_q('Persentase Realisasi TKDD'), format='.1f')],
+    )
+    bars = base.mark_bar(color='skyblue')
+    if not show_labels:
+        return bars.properties(height=height)
+    labels = base.mark_text(align='left', dx=3, fontSize=LABEL_FONTSIZE).encode(
+        text=alt.Text(**_q('Persentase Realisasi TKDD'), format='.1f'),
+    )
+    return alt.layer(bars, labels).properties(height=height)
+
+
+def scatter_grid(data, variabels, target, fit=None):
+    # Format panjang: satu baris per (provinsi, variabel), panel dibuat lewat facet
+    long = data[[target, *variabels]].melt(id_vars=[target], var_name='Variabel', value_name='Nilai')
+    base = alt.Chart().encode(
+        x=alt.X('Nilai:Q', title=None, scale=alt.Scale(zero=False)),
+        y=alt.Y(**_q(target), scale=alt.Scale(zero=False)),
+    )
+    layers = [base.mark_point().encode(tooltip=['Variabel:N', 'Nilai:Q', alt.Tooltip(**_q(target))])]
+    if fit == 'ols':
+        layers.append(base.transform_regression('Nilai', target, groupby=['Variabel']).mark_line(color='red'))
+    elif fit == 'lowess':
+        layers.append(base.transform_loess('Nilai', target, groupby=['Variabel']).mark_line(color='red'))
+    elif fit is not None:
+        raise ValueError(f"fit harus None, 'ols', atau 'lowess', bukan {fit!r}")
+    return alt.layer(*layers, data=long).properties(width=220, height=180).facet(
+        facet=alt.Facet('Variabel:N', title=None, sort=list(variabels), header=alt.Header(labelLimit=260)),
+        columns=3,
+    ).resolve_scale(x='independent').properties(title=f'Variabel vs {target}').interactive()
+
+
+def korelasi_heatmap(corr_target, title):
+    target = corr_target.columns[0]
+    data = pd.DataFrame({'Variabel': corr_target.index, 'Korelasi': corr_target[target].to_numpy()})
+    base = alt.Chart(data, title=title).encode(
+        y=alt.Y('Variabel:N', sort=list(data['Variabel']), title=None),
+    )
+    cells = base.mark_rect().encode(
+        color=alt.Color('Korelasi:Q', scale=alt.Scale(scheme='blues', domainMid=0)),
+        tooltip=['Variabel:N', alt.Tooltip('Korelasi:Q', format='.2f')],
+    )
+    labels = base.mark_text().encode(text=alt.Text('Korelasi:Q', format='.2f'))
+    return alt.layer(cells, labels).properties(width=120)
+
+
+def ipm_scatter(data, corr, pval):
+    data = data[['Provinsi', 'IPM', 'Realisasi TKDD']]
+    base = alt.Chart(
+        data,
+        title=f'Scatter Plot: IPM vs Realisasi TKDD - Korelasi Pearson = {corr:.2f} (p = {pval:.4f})',
+    )
+    points = base.mark_circle(size=60, color='teal', stroke='black').encode(
+        x=alt.X('IPM:Q', scale=alt.Scale(zero=False)),
+        y=alt.Y(**_q('Realisasi TKDD')),
+        tooltip=['Provinsi:N', 'IPM:Q', alt.Tooltip(**_q('Realisasi TKDD'), format=',.0f')],
+    )
+    line = base.transform_regression('IPM', 'Realisasi TKDD').mark_line(color='red').encode(
+        x='IPM:Q', y=alt.Y(**_q('Realisasi TKDD')),
+    )
+    return alt.layer(points, line).interactive()
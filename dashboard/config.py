@@ -0,0 +1,11 @@
+"""Lokasi berkas yang dipakai bersama oleh app.py dan modul dashboard."""
+import os
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+# Bisa diarahkan ke folder lain (misalnya data sintetis untuk benchmark)
+DATA_DIR = Path(os.environ.get("TKDD_DATA_DIR") or ROOT_DIR / "Data")
+OUTPUT_DIR = ROOT_DIR / "Output"
+
+# Cache turunan yang boleh dihapus kapan saja (diabaikan git)
+CACHE_DIR = OUTPUT_DIR / "cache"
@@ -0,0 +1,274 @@
+"""Registry dataset dashboard TKDD.
+
+Setiap dataset dideklarasikan sekali beserta skema kolomnya, dimuat secara
+malas saat pertama kali diminta, lalu disimpan sebagai satu salinan per
+proses yang dipakai bersama semua sesi dan halaman. Kolom turunan
+(persentase realisasi, proporsi pagu/realisasi) dihitung sekali saat muat.
+
+Kolom setiap dataset diambil dari katalog ``KOLOM``: ID pendek yang dipakai
+di berkas bertipe, label tampilan yang dipakai halaman, dan tipe data.
+Uang dan jumlah penduduk disimpan float64; IPM, persentase kemiskinan,
+dan laju pertumbuhan (dua desimal) cukup float32. Sumber CSV/xlsx
+divalidasi dan diubah ke berkas Arrow oleh ``dashboard.ingest``.
+
+Selama ``irisan_aktif(irisan)`` berlaku, ``get_dataset`` hanya mengembalikan
+baris yang lolos filter (``dashboard.slices``) dan ``dataset_version``
+memuat token irisan, sehingga cache turunan terpisah per irisan.
+
+``get_dataset`` mengembalikan salinan dangkal: pemanggil boleh menambah
+kolom atau memakai ``assign``/``copy``, tetapi tidak boleh mengubah nilai
+kolom yang ada di tempat karena datanya dipakai bersama. Modul ini tidak
+mengubah opsi pandas global; ``app.py`` mengaktifkan copy-on-write untuk
+proses Streamlit sebagai pengaman tambahan.
+"""
+import contextvars
+import hashlib
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+
+from dashboard import ingest, telemetry
+from dashboard.config import DATA_DIR, ROOT_DIR
+from dashboard.ingest import SchemaError
+
+NUMERIC_COLUMNS = [
+    'IPM',
+    'Pagu TKDD',
+    'Realisasi TKDD',
+    'Jumlah Penduduk',
+    'Anggaran APBN per kapita',
+    'Persentase Penduduk Miskin',
+    'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku',
+    'Produk Domestik Regional Bruto per Kapita HB',
+    'Laju Pertumbuhan PDRB atas dasar konstan 2010',
+]
+
+URUTAN_IPM = ["Sangat Tinggi", "Tinggi", "Sedang", "Rendah"]
+URUTAN_REALISASI = ["<90%", "90-100%", ">100%"]
+
+
+@dataclass(frozen=True)
+class Kolom:
+    id: str
+    label: str
+    dtype: str
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    categories: Optional[Tuple[str, ...]] = None
+
+
+# Katalog kolom: ID pendek -> label tampilan, tipe, dan aturan validasi
+KOLOM = {k.id: k for k in (
+    Kolom('provinsi', 'Provinsi', 'string'),
+    Kolom('kabkota', 'Kabupaten/Kota', 'string'),
+    Kolom('tahun', 'Tahun', 'int16', minimum=1945, maximum=2100),
+    Kolom('ipm', 'IPM', 'float32', minimum=0, maximum=100),
+    Kolom('pagu', 'Pagu TKDD', 'float64', minimum=0),
+    Kolom('realisasi', 'Realisasi TKDD', 'float64', minimum=0),
+    Kolom('penduduk', 'Jumlah Penduduk', 'float64', minimum=0),
+    Kolom('apbn_kapita', 'Anggaran APBN per kapita', 'float64', minimum=0),
+    Kolom('miskin', 'Persentase Penduduk Miskin', 'float32', minimum=0, maximum=100),
+    Kolom('pdrb', 'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku', 'float64', minimum=0),
+    Kolom('pdrb_kapita', 'Produk Domestik Regional Bruto per Kapita HB', 'float64', minimum=0),
+    Kolom('laju_pdrb', 'Laju Pertumbuhan PDRB atas dasar konstan 2010', 'float32'),
+    Kolom('kat_realisasi', 'Kategori Persentase Realisasi TKDD', 'category', categories=tuple(URUTAN_REALISASI)),
+    Kolom('kat_ipm', 'Kategori IPM', 'category', categories=tuple(URUTAN_IPM)),
+)}
+
+LABELS = {k.id: k.label for k in KOLOM.values()}
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    name: str
+    path: Path
+    columns: Tuple[Kolom, ...]
+    keys: Tuple[str, ...] = ()
+    required: Tuple[str, ...] = ()
+    derive: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    description: str = ""
+
+
+def _kolom(*ids):
+    return tuple(KOLOM[i] for i in ids)
+
+
+def _persentase_realisasi(df):
+    return df.assign(**{
+        'Persentase Realisasi TKDD': df['Realisasi TKDD'] / df['Pagu TKDD'] * 100,
+    })
+
+
+def _derive_tkdd(df):
+    df = _persentase_realisasi(df)
+    total = df['Pagu TKDD'] + df['Realisasi TKDD']
+    return df.assign(**{
+        'Pagu (%)': df['Pagu TKDD'] / total * 100,
+        'Realisasi (%)': df['Realisasi TKDD'] / total * 100,
+    })
+
+
+_BASE = ('provinsi', 'ipm', 'pagu', 'realisasi', 'penduduk', 'apbn_kapita', 'miskin', 'pdrb', 'pdrb_kapita', 'laju_pdrb')
+_KATEGORI = ('kat_realisasi', 'kat_ipm')
+
+DATASETS = {
+    "tkdd": DatasetSchema(
+        name="tkdd",
+        path=DATA_DIR / "DataTKDD.csv",
+        columns=_kolom(*_BASE, *_KATEGORI),
+        keys=('provinsi',),
+        required=('provinsi', 'pagu', 'realisasi', 'kat_realisasi'),
+        derive=_derive_tkdd,
+        description="Provinsi dengan Pagu dan Realisasi TKDD lengkap",
+    ),
+    "all": DatasetSchema(
+        name="all",
+        path=DATA_DIR / "DataKeseluruhan.csv",
+        columns=_kolom(*_BASE, *_KATEGORI),
+        keys=('provinsi',),
+        required=_BASE + _KATEGORI,
+        derive=_persentase_realisasi,
+        description="Provinsi tanpa nilai kosong pada seluruh variabel",
+    ),
+    # Workbook lomba apa adanya (masih berisi nilai kosong)
+    "mentah": DatasetSchema(
+        name="mentah",
+        path=ROOT_DIR / "Dataset Lomba Data Analytics TECHFEST 2025.xlsx",
+        columns=_kolom(*_BASE),
+        keys=('provinsi',),
+        required=('provinsi',),
+        description="Data mentah 38 provinsi dari workbook lomba",
+    ),
+    # Opsional: panel kabupaten/kota multi-tahun, hanya dipakai bila berkasnya ada
+    "tkdd_kabkota": DatasetSchema(
+        name="tkdd_kabkota",
+        path=DATA_DIR / "DataTKDDKabKota.csv",
+        columns=_kolom('provinsi', 'kabkota', 'tahun', 'pagu', 'realisasi'),
+        keys=('provinsi', 'kabkota', 'tahun'),
+        required=('provinsi', 'kabkota', 'tahun'),
+        derive=_persentase_realisasi,
+        description="Pagu dan Realisasi TKDD per kabupaten/kota dan tahun",
+    ),
+}
+
+_cache = {}
+_versions = {}
+_stamps = {}
+_lock = threading.Lock()
+
+# Irisan (filter) aktif untuk sesi/thread ini; None = semua baris
+_irisan = contextvars.ContextVar("tkdd_irisan", default=None)
+
+
+def _load(schema):
+    # Berkas Arrow bertipe di-memory-map; sumber divalidasi ulang bila berubah
+    df = ingest.load(schema)
+    if schema.derive is not None:
+        df = schema.derive(df)
+    return df
+
+
+def is_available(name):
+    """True jika berkas sumber dataset ``name`` tersedia."""
+    return name in DATASETS and DATASETS[name].path.exists()
+
+
+def get_dataset(name):
+    """DataFrame dataset ``name``; dimuat sekali per proses saat pertama diminta."""
+    if name not in DATASETS:
+        raise KeyError(f"Dataset tidak dikenal: {name!r} (tersedia: {sorted(DATASETS)})")
+    with _lock:
+        telemetry.cache_event("dataset", "hit" if name in _cache else "miss")
+        if name not in _cache:
+            # Cap sumber diambil sebelum dibaca agar perubahan selama pemuatan tetap terdeteksi
+            _stamps[name] = ingest.source_stamp(DATASETS[name].path)
+            with telemetry.fase("load"):
+                _cache[name] = _load(DATASETS[name])
+                _versions[name] = fingerprint(_cache[name])
+        df = _cache[name]
+        version = _versions[name]
+    irisan = _irisan.get()
+    if irisan is not None:
+        from dashboard import slices
+
+        return slices.terapkan(name, df, version, irisan)
+    return df.copy(deep=False)
+
+
+@contextmanager
+def irisan_aktif(irisan):
+    """Batasi ``get_dataset``/``dataset_version`` pada ``irisan`` (``slices.Irisan``) di dalam blok ini."""
+    token = _irisan.set(None if irisan is None or irisan.kosong else irisan)
+    try:
+        yield
+    finally:
+        _irisan.reset(token)
+
+
+def irisan():
+    """Irisan yang sedang aktif, atau None."""
+    return _irisan.get()
+
+
+def loaded():
+    """Dict ``{nama: DataFrame}`` dataset yang sudah dimuat di proses ini (tanpa memuat yang lain)."""
+    with _lock:
+        return {name: df.copy(deep=False) for name, df in _cache.items()}
+
+
+def source_stamp(name):
+    """Ukuran dan mtime berkas sumber saat dataset ``name`` terakhir dimuat, atau None."""
+    return _stamps.get(name)
+
+
+def install(name, df, stamp):
+    """Pasang ``df`` sebagai versi baru dataset ``name`` dan kembalikan versinya."""
+    version = fingerprint(df)
+    with _lock:
+        _cache[name] = df
+        _versions[name] = version
+        _stamps[name] = stamp
+    return version
+
+
+def dataset_version(name):
+    """Fingerprint isi dataset ``name`` yang sedang dimuat; dipakai sebagai kunci cache turunan."""
+    if name not in _versions:
+        get_dataset(name)
+    aktif = _irisan.get()
+    if aktif is not None:
+        from dashboard import slices
+
+        return slices.versi(_versions[name], aktif)
+    return _versions[name]
+
+
+def fingerprint(df):
+    """Hash isi DataFrame (nilai, indeks, nama dan tipe kolom) sebagai string hex."""
+    digest = hashlib.sha1()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    for col, dtype in df.dtypes.items():
+        values = df[col]
+        if getattr(dtype, "name", "") == "geometry":
+            # Kolom geometri di-hash lewat WKB-nya
+            digest.update(b"".join(values.to_wkb()))
+        else:
+            digest.update(pd.util.hash_pandas_object(values, index=False).values.tobytes())
+    digest.update(pd.util.hash_pandas_object(df.index).values.tobytes())
+    return digest.hexdigest()
+
+
+def clear_cache(name=None):
+    with _lock:
+        if name is None:
+            _cache.clear()
+            _versions.clear()
+            _stamps.clear()
+        else:
+            _cache.pop(name, None)
+            _versions.pop(name, None)
+            _stamps.pop(name, None)
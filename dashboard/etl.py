@@ -0,0 +1,322 @@
+"""ETL workbook mentah -> dataset bersih (``DataTKDD.csv``, ``DataKeseluruhan.csv``) dan berkas bertipe.
+
+Langkah pembersihan yang dulu dikerjakan di notebook, sekarang bisa diulang
+dari terminal maupun dari aplikasi:
+
+1. Setiap sheet workbook yang header-nya memuat semua kolom dasar dibaca
+   dengan openpyxl mode ``read_only`` (XML sheet di-stream, tidak dimuat
+   utuh) per potongan ``CHUNK`` baris. Sel rumus memakai hasil terakhir
+   yang tersimpan; bila workbook belum pernah dihitung, ``Anggaran APBN per
+   kapita`` diturunkan ulang dari ``Realisasi TKDD / Jumlah Penduduk``.
+2. Teks ``null`` dan sel kosong menjadi NaN; teks lain di kolom angka
+   dilaporkan sebagai ``SchemaError`` beserta nomor baris sheet.
+3. Per potongan: ``Persentase Realisasi TKDD``, kategori realisasi
+   (``<90%``, ``90-100%``, ``>100%``) dan kategori IPM, lalu kolom turunan
+   tiap dataset. Baris disaring menurut kolom wajib skema dataset: TKDD
+   butuh Pagu dan Realisasi, Keseluruhan butuh semua variabel.
+4. Hasil divalidasi, diurutkan per Provinsi, dan CSV hanya ditulis (atomik)
+   bila isinya berubah. Berkas Arrow bertipe lalu dibangun lewat
+   ``dashboard.ingest``.
+
+Yang disimpan di memori hanya satu potongan mentah dan baris bersih yang
+lolos saringan. Keluaran untuk workbook lomba identik byte per byte dengan
+CSV di repo.
+
+::
+
+    python -m dashboard.etl
+    python -m dashboard.etl --check
+    python -m dashboard.etl --output-dir /tmp/etl --chunk 10
+
+CLI di atas adalah cara membangun ulang CSV yang di-commit. Di aplikasi,
+ETL hanya berjalan bila ``TKDD_ETL=1``: ``perbarui()`` dipanggil dari
+``dashboard.refresh.poll`` saat cap workbook berubah sejak ETL terakhir
+(termasuk workbook baru yang ditaruh di ``Data/masuk``), dan CSV yang
+berbeda ditaruh di ``Data/masuk`` sehingga masuk lewat jalur validasi dan
+muat ulang inkremental yang sama dengan berkas kiriman lain.
+"""
+import argparse
+import json
+import os
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard import data, ingest
+from dashboard.config import CACHE_DIR
+
+CHUNK = int(os.environ.get("TKDD_ETL_CHUNK", "5000"))
+
+# Dataset bersih yang dihasilkan dari workbook mentah
+KELUARAN = ("tkdd", "all")
+
+STATUS_PATH = CACHE_DIR / "etl.json"
+
+# ETL otomatis di aplikasi hanya bila diminta (TKDD_ETL=1)
+AKTIF = os.environ.get("TKDD_ETL", "0") == "1"
+
+_KOSONG = ("", "null")
+
+_PERSEN = 'Persentase Realisasi TKDD'
+_KAT_REALISASI = data.LABELS['kat_realisasi']
+_KAT_IPM = data.LABELS['kat_ipm']
+
+
+def kategori_realisasi(persen):
+    """Kategori persentase realisasi: <90%, 90-100% (100 tepat termasuk), >100%."""
+    persen = np.asarray(persen, dtype="float64")
+    label = np.select([persen < 90, persen <= 100, persen > 100], ["<90%", "90-100%", ">100%"], default="")
+    # Kategori (kode 1 byte) jauh lebih hemat daripada teks per baris; NaN tetap kosong
+    return pd.Categorical(label, categories=data.URUTAN_REALISASI, ordered=True)
+
+
+def kategori_ipm(ipm):
+    """Kategori IPM menurut batas BPS: <60 Rendah, <70 Sedang, <80 Tinggi, selebihnya Sangat Tinggi."""
+    ipm = np.asarray(ipm, dtype="float64")
+    label = np.select([ipm < 60, ipm < 70, ipm < 80, ipm >= 80], ["Rendah", "Sedang", "Tinggi", "Sangat Tinggi"], default="")
+    return pd.Categorical(label, categories=data.URUTAN_IPM, ordered=True)
+
+
+class _Kolom:
+    """Kolom dasar workbook beserta jenisnya."""
+
+    def __init__(self, kolom):
+        self.label = kolom.label
+        self.angka = kolom.dtype not in ("string", "category")
+        # Kolom yang seluruh selnya bilangan bulat ditulis tanpa ".0", sama seperti pandas.read_excel
+        self.bulat = self.angka
+
+
+def _sheets(workbook, labels, names=None):
+    """Sheet yang header-nya memuat semua ``labels``, beserta posisi kolomnya."""
+    for ws in workbook.worksheets:
+        if names and ws.title not in names:
+            continue
+        header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        header = [str(v).strip() if v is not None else None for v in header]
+        if all(label in header for label in labels):
+            yield ws.title, {label: header.index(label) for label in labels}
+
+
+def _potongan(ws, posisi, chunk):
+    """Generator list ``(nomor_baris, nilai)`` per potongan; baris kosong (misalnya di akhir sheet) dilewati."""
+    rows = ws.iter_rows(min_row=2, values_only=True)
+    nomor = 2
+    while True:
+        blok = list(islice(rows, chunk))
+        if not blok:
+            return
+        awal, nomor = nomor, nomor + len(blok)
+        yield [
+            (awal + i, tuple(row[j] if j < len(row) else None for j in posisi))
+            for i, row in enumerate(blok)
+            if any(v is not None and str(v).strip() != "" for v in row)
+        ]
+
+
+def _sel(nilai):
+    if isinstance(nilai, str):
+        nilai = nilai.strip()
+        return None if nilai.lower() in _KOSONG else nilai
+    return nilai
+
+
+def _bersihkan(baris, kolom, sheet, problems):
+    """DataFrame berlabel dari baris mentah satu potongan; kolom angka jadi float64."""
+    nomor = [n for n, _ in baris]
+    columns = {}
+    for j, k in enumerate(kolom):
+        values = pd.Series([_sel(row[j]) for _, row in baris], dtype=object)
+        if not k.angka:
+            columns[k.label] = values.where(values.notna(), None).map(lambda v: str(v) if v is not None else None)
+            continue
+        angka = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64")
+        rusak = values.notna().to_numpy() & np.isnan(angka)
+        if rusak.any():
+            contoh = [f"{sheet}!{nomor[i]}={values[i]!r}" for i in np.flatnonzero(rusak)[:5]]
+            problems.append(f"'{k.label}': bukan angka {contoh}")
+        if k.bulat and (np.isnan(angka).any() or (angka != np.round(angka)).any()):
+            k.bulat = False
+        columns[k.label] = angka
+    return pd.DataFrame(columns)
+
+
+def _turunkan(df):
+    """Kolom turunan dan kategori untuk satu potongan yang sudah dibersihkan."""
+    realisasi, penduduk = df['Realisasi TKDD'], df['Jumlah Penduduk']
+    # Workbook yang belum pernah dihitung Excel tidak menyimpan hasil rumus APBN per kapita (=D/E)
+    apbn = df['Anggaran APBN per kapita'].fillna(realisasi / penduduk)
+    persen = realisasi / df['Pagu TKDD'] * 100
+    return df.assign(**{
+        'Anggaran APBN per kapita': apbn,
+        _PERSEN: persen,
+        _KAT_REALISASI: kategori_realisasi(persen),
+        _KAT_IPM: kategori_ipm(df['IPM']),
+    })
+
+
+def _saring(df, schema):
+    # Baris dipertahankan bila semua kolom wajib skema terisi
+    wajib = [data.KOLOM[i].label for i in schema.required]
+    return df[df[wajib].notna().all(axis=1)]
+
+
+def transform(path=None, sheets=None, chunk=CHUNK):
+    """Dict ``{dataset: DataFrame berlabel}`` dari workbook mentah; ``SchemaError`` bila isinya rusak."""
+    import openpyxl
+
+    mentah = data.DATASETS["mentah"]
+    path = Path(path or mentah.path)
+    kolom = [_Kolom(k) for k in mentah.columns]
+    labels = [k.label for k in kolom]
+    hasil = {name: [] for name in KELUARAN}
+    problems = []
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ditemukan = list(_sheets(workbook, labels, sheets))
+        if not ditemukan:
+            raise ingest.SchemaError(f"{path.name}: tidak ada sheet dengan kolom {labels}")
+        for title, header in ditemukan:
+            posisi = [header[label] for label in labels]
+            for baris in _potongan(workbook[title], posisi, chunk):
+                if not baris:
+                    continue
+                df = _turunkan(_bersihkan(baris, kolom, title, problems))
+                for name in KELUARAN:
+                    schema = data.DATASETS[name]
+                    bagian = _saring(df, schema)
+                    if schema.derive is not None:
+                        bagian = schema.derive(bagian)
+                    hasil[name].append(bagian)
+    finally:
+        workbook.close()
+    if problems:
+        raise ingest.SchemaError(f"{path.name}: " + "; ".join(problems))
+
+    bulat = [k.label for k in kolom if k.bulat]
+    frames = {}
+    for name, bagian in hasil.items():
+        df = pd.concat(bagian, ignore_index=True) if bagian else pd.DataFrame()
+        if df.empty:
+            raise ingest.SchemaError(f"{path.name}: tidak ada baris untuk dataset {name}")
+        df = df.sort_values('Provinsi', kind="stable", ignore_index=True)
+        frames[name] = df.astype({label: "int64" for label in bulat})
+    return frames
+
+
+def isi_csv(df):
+    """Byte CSV dataset bersih, sama persis dengan format berkas di ``Data``."""
+    return df.to_csv(index=False).encode()
+
+
+def _tulis_csv(isi, path):
+    """Tulis ``isi`` ke ``path`` secara atomik bila berbeda; True bila berkas berubah."""
+    try:
+        if path.read_bytes() == isi:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(isi)
+    tmp_path.replace(path)
+    return True
+
+
+def _bersih(path, sheets, chunk):
+    frames = transform(path, sheets, chunk)
+    # Validasi semua dataset dulu agar sumber rusak tidak menimpa satu CSV pun
+    for name, df in frames.items():
+        ingest.validate(df, data.DATASETS[name])
+    return frames
+
+
+def jalankan(path=None, sheets=None, chunk=CHUNK, output_dir=None):
+    """Jalankan ETL: tulis CSV bersih (dan berkas bertipe) lalu kembalikan ``{dataset: (baris, berubah)}``.
+
+    Tanpa ``output_dir`` CSV sumber dataset di ``Data`` ditimpa langsung;
+    ini cara membangun ulang berkas yang di-commit.
+    """
+    laporan = {}
+    for name, df in _bersih(path, sheets, chunk).items():
+        schema = data.DATASETS[name]
+        if output_dir:
+            berubah = _tulis_csv(isi_csv(df), Path(output_dir) / schema.path.name)
+        else:
+            berubah = _tulis_csv(isi_csv(df), schema.path)
+            # Dibangun ulang hanya bila CSV berubah atau berkas bertipe belum segar
+            ingest.load(schema)
+        laporan[name] = (len(df), berubah)
+    return laporan
+
+
+def perbarui(drop_dir):
+    """ETL bila workbook berubah sejak ETL terakhir; kembalikan ``{dataset: (baris, dikirim)}`` atau None.
+
+    CSV yang isinya berbeda dari sumber dataset ditaruh di ``drop_dir``
+    (``Data/masuk``), bukan menimpa sumbernya; ``dashboard.refresh``
+    memvalidasi dan memasangnya seperti berkas kiriman lain.
+    """
+    if not AKTIF:
+        return None
+    try:
+        stamp = ingest.source_stamp(data.DATASETS["mentah"].path)
+    except OSError:
+        return None
+    try:
+        if json.loads(STATUS_PATH.read_text()).get("stamp") == stamp:
+            return None
+    except (OSError, ValueError):
+        pass
+    laporan = {}
+    try:
+        for name, df in _bersih(None, None, CHUNK).items():
+            schema = data.DATASETS[name]
+            isi = isi_csv(df)
+            try:
+                sama = schema.path.read_bytes() == isi
+            except FileNotFoundError:
+                sama = False
+            if not sama:
+                _tulis_csv(isi, Path(drop_dir) / schema.path.name)
+            laporan[name] = (len(df), not sama)
+    finally:
+        # Workbook rusak juga dicatat agar tidak dibaca ulang setiap putaran sampai berkasnya diganti
+        STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        STATUS_PATH.write_text(json.dumps({"stamp": stamp}))
+    return laporan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bersihkan workbook mentah TKDD menjadi dataset CSV dan berkas bertipe.")
+    parser.add_argument("--workbook", help="berkas xlsx (default: workbook lomba)")
+    parser.add_argument("--sheet", action="append", help="nama sheet (default: semua sheet dengan kolom dasar)")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="jumlah baris per potongan")
+    parser.add_argument("--output-dir", help="tulis CSV ke folder lain (tanpa berkas bertipe)")
+    parser.add_argument("--check", action="store_true", help="bandingkan hasil dengan CSV yang ada tanpa menulis")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.check:
+            frames = transform(args.workbook, args.sheet, args.chunk)
+            status = 0
+            for name, df in frames.items():
+                path = data.DATASETS[name].path
+                sama = path.exists() and path.read_bytes() == isi_csv(df)
+                print(f"{'SAMA ' if sama else 'BEDA '} {name}: {len(df)} baris vs {path}")
+                status |= not sama
+            return status
+        laporan = jalankan(args.workbook, args.sheet, args.chunk, args.output_dir)
+    except ingest.SchemaError as exc:
+        print(f"GAGAL: {exc}")
+        return 1
+    for name, (baris, berubah) in laporan.items():
+        print(f"OK    {name}: {baris} baris" + (" (ditulis)" if berubah else " (tidak berubah)"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+"""Cache gambar yang sudah dirender (PNG/SVG) untuk semua sesi.
+
+Kunci cache adalah hash dari nama pembuat grafik, isi DataFrame masukan,
+parameter grafik, tema Matplotlib aktif, dan format keluaran. Rerun
+Streamlit dan sesi lain dengan data yang sama langsung memakai byte yang
+tersimpan tanpa menyentuh Matplotlib.
+
+Tingkat memori dibatasi dengan LRU berdasarkan ukuran byte. Tingkat kedua
+bersifat opsional: cache bersama lintas replika bila ``TKDD_CACHE_STORE``
+diisi (lihat ``dashboard.cachestore``), jika tidak direktori disk bila
+``TKDD_FIGURE_CACHE_DIR`` diisi (misalnya ``Output/cache``) atau lewat
+``configure(disk_dir=...)``.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from dashboard import cachestore, telemetry
+from dashboard.data import fingerprint
+
+DEFAULT_MEMORY_BYTES = int(os.environ.get("TKDD_FIGURE_CACHE_MB", "64")) * 1024 * 1024
+
+# Sama dengan opsi yang dipakai st.pyplot
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200}
+
+
+class FigureCache:
+    def __init__(self, memory_bytes=DEFAULT_MEMORY_BYTES, disk_dir=None, store=None):
+        self.memory_bytes = memory_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        # Tingkat kedua: store bersama bila ada, jika tidak direktori disk bila diisi
+        if store is None and self.disk_dir is not None:
+            store = cachestore.DirectoryStore(self.disk_dir)
+        self.store = store
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key, fmt):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+        if self.store is not None:
+            data = self.store.get("gambar", f"{key}.{fmt}")
+            if data is not None:
+                self._put_memory(key, data)
+                with self._lock:
+                    self.disk_hits += 1
+                return data
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, fmt, data):
+        self._put_memory(key, data)
+        if self.store is not None:
+            self.store.set("gambar", f"{key}.{fmt}", data)
+
+    def _put_memory(self, key, data):
+        if len(data) > self.memory_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.memory_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self, tingkat_kedua=False):
+        """Kosongkan tingkat memori; dengan ``tingkat_kedua`` juga gambar di disk/store bersama."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if tingkat_kedua and self.store is not None:
+            self.store.invalidate("gambar")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "memory_bytes": self.memory_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+
+_cache = FigureCache(disk_dir=os.environ.get("TKDD_FIGURE_CACHE_DIR") or None, store=cachestore.get_store())
+
+
+def configure(memory_bytes=None, disk_dir=None, store=None):
+    """Ganti batas memori, direktori disk, dan/atau store tingkat kedua cache global."""
+    global _cache
+    _cache = FigureCache(
+        memory_bytes=memory_bytes if memory_bytes is not None else _cache.memory_bytes,
+        disk_dir=disk_dir if disk_dir is not None else _cache.disk_dir,
+        store=store if store is not None else cachestore.get_store(),
+    )
+    return _cache
+
+
+def get_cache():
+    return _cache
+
+
+def theme_fingerprint():
+    """Hash rcParams Matplotlib yang aktif (termasuk perubahan dari seaborn)."""
+    import matplotlib
+
+    items = sorted((key, repr(value)) for key, value in matplotlib.rcParams.items())
+    return hashlib.sha1(repr(items).encode()).hexdigest()
+
+
+def cache_key(builder, data, params, fmt):
+    payload = json.dumps({
+        "builder": f"{builder.__module__}.{builder.__qualname__}",
+        "data": fingerprint(data),
+        "params": params,
+        "theme": theme_fingerprint(),
+        "fmt": fmt,
+    }, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def render(builder, data, fmt="png", **params):
+    """Byte gambar ``builder(data, **params)``, diambil dari cache bila ada.
+
+    ``builder`` harus berupa fungsi yang mengembalikan ``Figure`` dan hanya
+    bergantung pada ``data`` dan ``params`` agar kunci cache tetap benar.
+    """
+    key = cache_key(builder, data, params, fmt)
+    cached = _cache.get(key, fmt)
+    if cached is not None:
+        return cached
+
+    with telemetry.fase("render"):
+        fig = builder(data, **params)
+    buf = io.BytesIO()
+    with telemetry.fase("serialize"):
+        fig.savefig(buf, format=fmt, **SAVEFIG_OPTIONS)
+    image = buf.getvalue()
+    _cache.put(key, fmt, image)
+    return image
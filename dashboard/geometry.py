@@ -0,0 +1,185 @@
+"""Tingkat penyederhanaan geometri provinsi untuk peta TKDD.
+
+Garis pantai Indonesia memiliki sangat banyak titik sudut, padahal pada
+gambar 14x10 inci sebagian besar detail itu lebih kecil dari satu piksel.
+Beberapa versi geometri yang disederhanakan (dengan ``preserve_topology``)
+dibangun sekali per versi penyimpanan batas wilayah, lalu peta memilih versi paling kasar yang
+masih lebih halus dari ukuran satu piksel pada DPI keluarannya.
+
+Batas wilayah diberi indeks kode provinsi BPS (``dashboard.regions``) saat
+dimuat, sehingga penggabungan dengan data TKDD adalah pencarian bilangan
+bulat pada indeks hash yang sudah jadi, bukan ``merge`` pada string.
+
+Laporan jumlah titik sudut dan waktu render tiap tingkat::
+
+    python -m dashboard.geometry --dpi 200
+"""
+import argparse
+import io
+import time
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import regions, telemetry
+from dashboard.boundaries import load_boundaries, store_cap
+
+# Toleransi penyederhanaan dalam derajat (CRS EPSG:4326); 0.0 = resolusi penuh
+TOLERANCES = (0.001, 0.01, 0.05)
+
+# st.pyplot menyimpan gambar dengan dpi=200
+MAP_DPI = 200
+MAP_FIGSIZE = (14, 10)
+
+
+def simplified_tiers():
+    """Dict ``{toleransi: GeoDataFrame}`` termasuk resolusi penuh pada kunci 0.0, berindeks kode BPS.
+
+    Dibangun ulang bila penyimpanan batas wilayah berubah.
+    """
+    # Dimuat dulu agar penyimpanan yang belum ada dibangun sebelum cap-nya dibaca
+    load_boundaries()
+    return _tiers(store_cap())
+
+
+@lru_cache(maxsize=1)
+def _tiers(cap):
+    gdf = _index_kode(load_boundaries())
+    tiers = {0.0: gdf}
+    for tol in TOLERANCES:
+        tiers[tol] = gdf.set_geometry(gdf.geometry.simplify(tol, preserve_topology=True))
+    return tiers
+
+
+def vertex_count(gdf):
+    import shapely
+
+    return int(shapely.get_num_coordinates(gdf.geometry.values).sum())
+
+
+def pick_tolerance(bounds, figsize=MAP_FIGSIZE, dpi=MAP_DPI):
+    """Toleransi terbesar yang tidak melebihi ukuran satu piksel (dalam derajat)."""
+    minx, miny, maxx, maxy = bounds
+    deg_per_px = max(
+        (maxx - minx) / (figsize[0] * dpi),
+        (maxy - miny) / (figsize[1] * dpi),
+    )
+    usable = [tol for tol in TOLERANCES if tol <= deg_per_px]
+    return max(usable) if usable else 0.0
+
+
+def boundaries_for(figsize=MAP_FIGSIZE, dpi=MAP_DPI):
+    """GeoDataFrame batas provinsi dengan tingkat detail yang sesuai ukuran render."""
+    tiers = simplified_tiers()
+    tol = pick_tolerance(tiers[0.0].total_bounds, figsize, dpi)
+    return tiers[tol]
+
+
+def _index_kode(gdf):
+    kode = regions.INDEX.encode(gdf["PROVINSI"], sumber="batas wilayah")
+    return gdf.set_index(pd.Index(kode, name=regions.KODE_PROVINSI))
+
+
+@dataclass(frozen=True)
+class HasilJoin:
+    # Nama provinsi di data yang tidak ada di peta, dan wilayah peta tanpa data
+    tanpa_peta: Tuple[str, ...]
+    tanpa_data: Tuple[str, ...]
+
+
+def join_provinsi(gdf, data_tkdd):
+    """Left join batas wilayah dengan agregat TKDD tingkat provinsi pada kode BPS.
+
+    Mengembalikan ``(merged, HasilJoin)``. Kode data dicari pada indeks
+    ``gdf`` (hash index pandas, dibangun sekali untuk GeoDataFrame yang di-cache).
+    """
+    with telemetry.fase("transform"):
+        return _join_provinsi(gdf, data_tkdd)
+
+
+def _join_provinsi(gdf, data_tkdd):
+    if gdf.index.name != regions.KODE_PROVINSI:
+        gdf = _index_kode(gdf)
+    if regions.KODE_PROVINSI in data_tkdd.columns:
+        kode = data_tkdd[regions.KODE_PROVINSI].to_numpy()
+    else:
+        kode = regions.INDEX.encode(data_tkdd["Provinsi"])
+
+    # Indeks batas wilayah bisa berisi kode ganda (TIDAK_COCOK untuk nama yang
+    # tidak dikenal, atau provinsi yang terbagi atas beberapa baris); pencarian
+    # memakai kode unik yang cocok saja
+    kunci = gdf.index[(gdf.index != regions.TIDAK_COCOK) & ~gdf.index.duplicated()]
+    posisi = kunci.get_indexer(kode)
+    ada = posisi >= 0
+    baris_kunci = np.full(len(kunci), -1)
+    baris_kunci[posisi[ada]] = np.flatnonzero(ada)
+    per_wilayah = kunci.get_indexer(gdf.index)
+    baris = np.where(per_wilayah >= 0, baris_kunci[per_wilayah], -1)
+
+    # Baris -1 tidak ada di RangeIndex, sehingga reindex mengisinya dengan NaN;
+    # digabung per posisi karena indeks kode tidak selalu unik
+    data = data_tkdd.drop(columns=regions.KODE_PROVINSI, errors="ignore").reset_index(drop=True)
+    data = data.reindex(baris).reset_index(drop=True)
+    merged = gdf.reset_index().join(data).set_index(regions.KODE_PROVINSI)
+    hasil = HasilJoin(
+        tanpa_peta=tuple(data_tkdd["Provinsi"].to_numpy()[~ada]),
+        tanpa_data=tuple(gdf["PROVINSI"].to_numpy()[baris < 0]),
+    )
+    return merged, hasil
+
+
+def merge_provinsi(gdf, data_tkdd):
+    """Gabungkan batas wilayah dengan agregat TKDD tingkat provinsi (left join pada kode BPS)."""
+    merged, hasil = join_provinsi(gdf, data_tkdd)
+    if hasil.tanpa_peta:
+        warnings.warn(
+            f"Provinsi di data tidak ditemukan di peta: {', '.join(map(str, hasil.tanpa_peta))}",
+            regions.RegionKeyWarning, stacklevel=2,
+        )
+    return merged
+
+
+def benchmark_tiers(figsize=MAP_FIGSIZE, dpi=MAP_DPI, repeat=3):
+    """Jumlah titik sudut dan waktu render (plot + savefig PNG) untuk tiap tingkat."""
+    from matplotlib.figure import Figure
+
+    tiers = simplified_tiers()
+    chosen = pick_tolerance(tiers[0.0].total_bounds, figsize, dpi)
+    rows = []
+    for tol, gdf in tiers.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fig = Figure(figsize=figsize)
+            ax = fig.subplots()
+            gdf.plot(ax=ax, linewidth=0.5, edgecolor="0.5")
+            fig.savefig(io.BytesIO(), format="png", dpi=dpi, bbox_inches="tight")
+            best = min(best, time.perf_counter() - start)
+        rows.append({
+            "toleransi": tol,
+            "titik_sudut": vertex_count(gdf),
+            "render_detik": best,
+            "dipilih": tol == chosen,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan tingkat penyederhanaan peta provinsi.")
+    parser.add_argument("--dpi", type=int, default=MAP_DPI)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'toleransi':>10} {'titik sudut':>12} {'render (s)':>11}")
+    for row in benchmark_tiers(dpi=args.dpi, repeat=args.repeat):
+        mark = "  <- dipakai" if row["dipilih"] else ""
+        print(f"{row['toleransi']:>10g} {row['titik_sudut']:>12,} {row['render_detik']:>11.3f}{mark}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+"""Mode data hierarkis: provinsi -> kabupaten/kota, ditambah dimensi tahun.
+
+Agregasi dilakukan sekali per dataset dan tingkat wilayah dengan satu
+``groupby`` tervektorisasi, lalu dipecah per tahun dan diurutkan menurut
+persentase realisasi. Halaman tinggal mengambil potongan tahun yang
+dipilih, memotongnya menjadi tampilan top-N/bottom-N dengan baris
+"Lainnya", atau menelusuri (drill-down) satu provinsi.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dashboard import regions, slices, telemetry
+from dashboard.data import dataset_version, get_dataset
+
+KOLOM_TAHUN = 'Tahun'
+KOLOM_KABKOTA = 'Kabupaten/Kota'
+NILAI = ['Pagu TKDD', 'Realisasi TKDD']
+
+# Kolom kunci untuk setiap tingkat wilayah
+LEVELS = {
+    'Provinsi': ['Provinsi'],
+    KOLOM_KABKOTA: ['Provinsi', KOLOM_KABKOTA],
+}
+
+# Di atas jumlah batang ini grafik beralih ke tampilan top-N/bottom-N
+MAX_BARS = 40
+LAINNYA = "Lainnya"
+
+_panels = slices.CacheVersi()
+_lock = threading.Lock()
+
+
+def tambah_persentase(agg):
+    """Kolom persentase realisasi dan proporsi Pagu/Realisasi (%) secara tervektorisasi."""
+    pagu = agg['Pagu TKDD'].to_numpy(dtype='float64')
+    realisasi = agg['Realisasi TKDD'].to_numpy(dtype='float64')
+    total = pagu + realisasi
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return agg.assign(**{
+            'Persentase Realisasi TKDD': realisasi / pagu * 100,
+            'Pagu (%)': pagu / total * 100,
+            'Realisasi (%)': realisasi / total * 100,
+        })
+
+
+def precompute(df, level, default_year):
+    """Dict ``{tahun: DataFrame}`` berisi agregat dan kode BPS per unit ``level``, terurut menurun."""
+    keys = LEVELS[level]
+    if KOLOM_TAHUN not in df.columns:
+        df = df.assign(**{KOLOM_TAHUN: default_year})
+    agg = (
+        df.groupby([KOLOM_TAHUN, *keys], observed=True, sort=False)[NILAI]
+        .sum(min_count=1)
+        .reset_index()
+    )
+    # Kode BPS dipetakan sekali di sini sehingga join (misalnya ke peta) berjalan pada bilangan bulat
+    agg = tambah_persentase(agg.assign(**regions.kolom_kode(agg, keys)))
+    agg = agg.sort_values([KOLOM_TAHUN, 'Persentase Realisasi TKDD'], ascending=[True, False])
+    return {
+        int(tahun): frame.reset_index(drop=True)
+        for tahun, frame in agg.groupby(KOLOM_TAHUN, sort=True)
+    }
+
+
+def panel(dataset, level, default_year=2023):
+    """Hasil ``precompute`` untuk ``dataset`` pada ``level``, di-cache per versi data."""
+    key = (dataset, level, dataset_version(dataset))
+    with _lock:
+        result = _panels.get(key)
+    telemetry.cache_event("panel wilayah", "hit" if result is not None else "miss")
+    if result is None:
+        with telemetry.fase("transform"):
+            result = precompute(get_dataset(dataset), level, default_year)
+        with _lock:
+            result = _panels.setdefault(key, result)
+    return result
+
+
+def carry_over(change, df, default_year=2023):
+    """Pindahkan panel ``change.dataset`` ke versi baru; hanya tahun yang terdampak diagregasi ulang."""
+    with _lock:
+        lama = [(level, result) for (dataset, level, version), result in _panels.items()
+                if dataset == change.dataset and version == change.old_version]
+    for level, result in lama:
+        if change.rows_same and not set(change.columns) & set(NILAI):
+            baru = result
+        elif KOLOM_TAHUN in change.key_columns:
+            # Tahun terdampak = tahun dari baris yang berubah, ditambah, atau dihapus
+            tahun = {int(t) for t in change.key_values(KOLOM_TAHUN)}
+            subset = df[df[KOLOM_TAHUN].isin(list(tahun))]
+            baru = {t: frame for t, frame in result.items() if t not in tahun}
+            if len(subset):
+                baru.update(precompute(subset, level, default_year))
+            baru = dict(sorted(baru.items()))
+        else:
+            baru = precompute(df, level, default_year)
+        with _lock:
+            _panels.pop((change.dataset, level, change.old_version), None)
+            _panels.setdefault((change.dataset, level, change.new_version), baru)
+
+
+def years(dataset, level='Provinsi'):
+    return sorted(panel(dataset, level))
+
+
+def drill_down(df, provinsi):
+    """Baris milik satu provinsi saja (misalnya kabupaten/kota di provinsi itu)."""
+    return df[df['Provinsi'].to_numpy() == provinsi].reset_index(drop=True)
+
+
+def top_bottom(df_sorted, n, label_col):
+    """N teratas dan N terbawah dari ``df_sorted`` dengan sisanya digabung jadi satu baris "Lainnya".
+
+    ``df_sorted`` harus sudah terurut menurun. Baris "Lainnya" memakai total
+    Pagu dan Realisasi unit yang digabung sehingga persentasenya tetap benar.
+    """
+    if len(df_sorted) <= 2 * n + 1:
+        return df_sorted
+    tengah = df_sorted.iloc[n:len(df_sorted) - n]
+    lainnya = tambah_persentase(pd.DataFrame({
+        label_col: [f"{LAINNYA} ({len(tengah)} wilayah)"],
+        'Pagu TKDD': [tengah['Pagu TKDD'].sum()],
+        'Realisasi TKDD': [tengah['Realisasi TKDD'].sum()],
+    }))
+    return pd.concat(
+        [df_sorted.iloc[:n], lainnya, df_sorted.iloc[len(df_sorted) - n:]],
+        ignore_index=True,
+    )
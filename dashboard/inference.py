@@ -0,0 +1,362 @@
+"""Inferensi berbasis resampling untuk uji korelasi Pearson dan Chi-Square.
+
+Dengan hanya 34 provinsi, p-value asimtotik ``pearsonr`` dan
+``chi2_contingency`` pada tabel kontingensi yang jarang kurang bisa
+dipercaya. Modul ini menambahkan:
+
+* interval kepercayaan bootstrap persentil (r Pearson, Cramer's V);
+* p-value permutasi (Monte Carlo) untuk kedua uji;
+* p-value eksak bersyarat untuk tabel kontingensi berkolom dua.
+
+Ribuan replikasi dihitung sebagai operasi matriks NumPy per blok
+``CHUNK`` replikasi. Setiap blok memakai turunan ``SeedSequence`` sendiri
+sehingga hasilnya sama persis berapa pun jumlah worker process pool yang
+dipakai. Hasil di-cache per versi dataset di memori dan di
+``Output/cache/inference``.
+
+Menghitung dari terminal::
+
+    python -m dashboard.inference --replikasi 100000 --jobs 4
+"""
+import argparse
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import slices, telemetry
+from dashboard.config import CACHE_DIR
+from dashboard.data import dataset_version, get_dataset
+
+INFERENCE_DIR = CACHE_DIR / "inference"
+
+REPLIKASI = int(os.environ.get("TKDD_REPLIKASI", "10000"))
+SEED = 2023
+
+# Replikasi per blok; tetap agar hasil tidak bergantung pada jumlah worker
+CHUNK = 1000
+
+# Batas jumlah tabel yang dienumerasi untuk uji eksak
+MAX_TABEL_EKSAK = 2_000_000
+
+_results = slices.CacheVersi()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class UjiSpec:
+    name: str
+    dataset: str
+    # 'pearson' atau 'chi2'
+    kind: str
+    x: str
+    y: str
+    replikasi: int = REPLIKASI
+    seed: int = SEED
+    tingkat: float = 0.95
+    # Koreksi kontinuitas Yates pada p-value asimtotik tabel 2x2, sama dengan
+    # chi2_contingency bawaan yang dipakai halaman
+    yates: bool = True
+
+
+@dataclass(frozen=True)
+class HasilResampling:
+    spec: UjiSpec
+    version: str
+    n: int
+    # r Pearson atau statistik Chi-Square
+    statistik: float
+    p_asimtotik: float
+    p_permutasi: float
+    # r Pearson atau Cramer's V beserta interval bootstrap persentil
+    efek: float
+    ci: Tuple[float, float]
+    p_eksak: Optional[float] = None
+    detik: float = 0.0
+
+    def ringkasan(self):
+        """Dict berlabel untuk ditampilkan di samping hasil asimtotik."""
+        efek = "r" if self.spec.kind == "pearson" else "Cramer's V"
+        tingkat = f"{self.spec.tingkat:.0%}"
+        baris = {
+            f"{efek}": self.efek,
+            f"CI bootstrap {tingkat} ({efek})": f"[{self.ci[0]:.4f}, {self.ci[1]:.4f}]",
+            "p-value asimtotik" + (" (koreksi Yates bila 2x2)" if self.spec.kind == "chi2" and self.spec.yates else ""):
+                self.p_asimtotik,
+            f"p-value permutasi ({self.spec.replikasi:,} replikasi)": self.p_permutasi,
+        }
+        if self.p_eksak is not None:
+            baris["p-value eksak (bersyarat margin)"] = self.p_eksak
+        return baris
+
+
+SPECS = {
+    "ipm_realisasi": UjiSpec(name="ipm_realisasi", dataset="all", kind="pearson",
+                             x='IPM', y='Realisasi TKDD'),
+    "kategori_ipm_realisasi": UjiSpec(name="kategori_ipm_realisasi", dataset="all", kind="chi2",
+                                      x='Kategori IPM', y='Kategori Persentase Realisasi TKDD'),
+}
+
+
+def _pearson_rows(X, Y):
+    """r Pearson setiap baris ``X`` terhadap baris yang sama di ``Y``."""
+    Xc = X - X.mean(axis=1, keepdims=True)
+    Yc = Y - Y.mean(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (Xc * Yc).sum(axis=1) / np.sqrt((Xc * Xc).sum(axis=1) * (Yc * Yc).sum(axis=1))
+
+
+def _tables(A, B, shape):
+    """Tabel kontingensi ``(replikasi, R, C)`` dari kode baris ``A`` dan kolom ``B``."""
+    reps = len(A)
+    R, C = shape
+    flat = (np.arange(reps)[:, None] * R + A) * C + B
+    return np.bincount(flat.ravel(), minlength=reps * R * C).reshape(reps, R, C)
+
+
+def _chi2_tables(tables):
+    """Statistik Chi-Square Pearson (tanpa koreksi) setiap tabel; sel berharapan nol diabaikan."""
+    n = tables.sum(axis=(1, 2), keepdims=True)
+    expected = tables.sum(axis=2, keepdims=True) * tables.sum(axis=1, keepdims=True) / n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(expected > 0, (tables - expected) ** 2 / expected, 0.0)
+    return terms.sum(axis=(1, 2))
+
+
+def _cramers_v(chi2, n, shape):
+    # Tabel dengan satu baris/kolom (mis. pada irisan kecil) menghasilkan NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sqrt(np.asarray(chi2, dtype='float64') / (n * (min(shape) - 1)))
+
+
+def _blok(kind, x, y, shape, seed_seq, size):
+    """Satu blok: pasangan array ``(statistik bootstrap, statistik permutasi)``."""
+    rng = np.random.default_rng(seed_seq)
+    n = len(x)
+    boot = rng.integers(0, n, size=(size, n))
+    perm = rng.permuted(np.broadcast_to(np.arange(n), (size, n)), axis=1)
+    if kind == "pearson":
+        return _pearson_rows(x[boot], y[boot]), _pearson_rows(np.broadcast_to(x, (size, n)), y[perm])
+    boot_chi2 = _chi2_tables(_tables(x[boot], y[boot], shape))
+    perm_chi2 = _chi2_tables(_tables(np.broadcast_to(x, (size, n)), y[perm], shape))
+    return _cramers_v(boot_chi2, n, shape), perm_chi2
+
+
+def replikasi(kind, x, y, reps, seed, shape=None, workers=None):
+    """Semua statistik bootstrap dan permutasi, dihitung per blok ``CHUNK`` replikasi.
+
+    ``workers`` > 1 menjalankan blok-blok di process pool. Setiap blok
+    memakai turunan ``SeedSequence(seed)`` sesuai urutannya sehingga hasil
+    identik untuk jumlah worker berapa pun.
+    """
+    sizes = [CHUNK] * (reps // CHUNK) + ([reps % CHUNK] if reps % CHUNK else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(kind, x, y, shape, s, size) for s, size in zip(seeds, sizes)]
+    if workers and workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_blok, *zip(*args)))
+    else:
+        parts = [_blok(*a) for a in args]
+    return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+
+def _log_factorial(values):
+    from scipy.special import gammaln
+
+    return gammaln(np.asarray(values, dtype='float64') + 1)
+
+
+def exact_chi2(table):
+    """p-value eksak bersyarat margin untuk tabel ``R x 2`` (atau ``2 x C``), None bila terlalu besar.
+
+    Semua tabel dengan margin yang sama dienumerasi; p-value adalah total
+    peluang hipergeometrik multivariat tabel yang statistik Chi-Square-nya
+    tidak lebih kecil dari tabel teramati.
+    """
+    table = np.asarray(table, dtype='int64')
+    if table.shape[1] != 2:
+        table = table.T
+    if table.shape[1] != 2:
+        return None
+    rows, kolom1 = table.sum(axis=1), int(table[:, 0].sum())
+    if np.prod(rows + 1, dtype='float64') > MAX_TABEL_EKSAK:
+        return None
+
+    # Semua isi kolom pertama yang mungkin, disaring menurut total kolom
+    first = np.array(list(itertools.product(*(range(r + 1) for r in rows))), dtype='int64')
+    first = first[first.sum(axis=1) == kolom1]
+    tables = np.stack([first, rows - first], axis=-1)
+
+    n = rows.sum()
+    log_const = _log_factorial(rows).sum() + _log_factorial(table.sum(axis=0)).sum() - _log_factorial(n)
+    prob = np.exp(log_const - _log_factorial(tables).sum(axis=(1, 2)))
+    chi2 = _chi2_tables(tables)
+    observed = _chi2_tables(table[None])[0]
+    return float(min(1.0, prob[chi2 >= observed * (1 - 1e-9)].sum()))
+
+
+def _p_value(null, observed):
+    # Satu ditambahkan ke pembilang dan penyebut agar p-value Monte Carlo tidak pernah nol
+    return float((1 + np.count_nonzero(null >= observed * (1 - 1e-9))) / (len(null) + 1))
+
+
+def _interval(values, tingkat):
+    alpha = (1 - tingkat) / 2
+    values = values[~np.isnan(values)]
+    low, high = np.quantile(values, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+def _hitung(spec, version, workers=None):
+    from scipy import stats as sps
+
+    start = time.perf_counter()
+    df = get_dataset(spec.dataset)[[spec.x, spec.y]].dropna()
+    if spec.kind == "pearson":
+        x, y = df[spec.x].to_numpy(dtype='float64'), df[spec.y].to_numpy(dtype='float64')
+        r, p = sps.pearsonr(x, y)
+        boot, perm = replikasi("pearson", x, y, spec.replikasi, spec.seed, workers=workers)
+        return HasilResampling(
+            spec=spec, version=version, n=len(x),
+            statistik=float(r), p_asimtotik=float(p),
+            p_permutasi=_p_value(np.abs(perm), abs(r)),
+            efek=float(r), ci=_interval(boot, spec.tingkat),
+            detik=time.perf_counter() - start,
+        )
+    if spec.kind != "chi2":
+        raise ValueError(f"jenis uji tidak dikenal: {spec.kind!r}")
+
+    # Kategori tanpa observasi dibuang, sama seperti pd.crosstab di halaman
+    a, levels_a = pd.factorize(df[spec.x], sort=True)
+    b, levels_b = pd.factorize(df[spec.y], sort=True)
+    shape = (len(levels_a), len(levels_b))
+    table = _tables(a[None], b[None], shape)[0]
+    # Statistik tanpa koreksi untuk permutasi dan Cramer's V; dengan margin tetap
+    # koreksi Yates monoton terhadap statistik ini sehingga p permutasi sama saja
+    chi2, _, _, _ = sps.chi2_contingency(table, correction=False)
+    p = sps.chi2_contingency(table, correction=spec.yates)[1]
+    boot, perm = replikasi("chi2", a, b, spec.replikasi, spec.seed, shape=shape, workers=workers)
+    return HasilResampling(
+        spec=spec, version=version, n=len(a),
+        statistik=float(chi2), p_asimtotik=float(p),
+        p_permutasi=_p_value(perm, chi2),
+        efek=float(_cramers_v(chi2, len(a), shape)), ci=_interval(boot, spec.tingkat),
+        p_eksak=exact_chi2(table),
+        detik=time.perf_counter() - start,
+    )
+
+
+def _path(spec, version):
+    digest = hashlib.sha1(json.dumps(dataclasses.asdict(spec), sort_keys=True).encode()).hexdigest()[:12]
+    return INFERENCE_DIR / f"{spec.name}-{version}-{digest}.json"
+
+
+def save(result, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fields = {k: v for k, v in dataclasses.asdict(result).items() if k != "spec"}
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(fields))
+    tmp_path.replace(path)
+
+
+def load(path, spec):
+    fields = json.loads(path.read_text())
+    return HasilResampling(spec=spec, **{**fields, "ci": tuple(fields["ci"])})
+
+
+def hasil(spec, workers=None):
+    """``HasilResampling`` untuk ``spec`` (objek ``UjiSpec`` atau nama di ``SPECS``); dari memori, disk, lalu dihitung."""
+    if isinstance(spec, str):
+        spec = SPECS[spec]
+    version = dataset_version(spec.dataset)
+    key = (spec, version)
+    with _lock:
+        result = _results.get(key)
+    if result is not None:
+        telemetry.cache_event("inferensi", "hit")
+        return result
+
+    # Hasil irisan hanya di memori agar kombinasi filter tidak menumpuk berkas di disk
+    path = None if slices.teriris(version) else _path(spec, version)
+    result = None
+    if path is not None:
+        try:
+            result = load(path, spec)
+            telemetry.cache_event("inferensi", "disk")
+        except (OSError, KeyError, TypeError, ValueError):
+            pass
+    if result is None:
+        telemetry.cache_event("inferensi", "miss")
+        # Waktu CPU worker process pool tidak ikut terhitung di thread ini
+        with telemetry.fase("model"):
+            result = _hitung(spec, version, workers)
+        if path is not None:
+            try:
+                save(result, path)
+            except OSError:
+                pass
+    with _lock:
+        return _results.setdefault(key, result)
+
+
+def carry_over(change):
+    """Pindahkan hasil ``change.dataset`` ke versi baru bila kolom ujinya tidak berubah.
+
+    Hasil yang terdampak dibuang saja; replikasi dihitung ulang saat
+    halamannya dibuka lagi, bukan di tengah pemantauan.
+    """
+    with _lock:
+        lama = [(spec, result) for (spec, version), result in _results.items()
+                if spec.dataset == change.dataset and version == change.old_version]
+    dibuang = []
+    for spec, result in lama:
+        try:
+            # Berkas versi lama tidak akan dibaca lagi
+            _path(spec, change.old_version).unlink(missing_ok=True)
+        except OSError:
+            pass
+        with _lock:
+            _results.pop((spec, change.old_version), None)
+            if change.rows_same and not set(change.columns) & {spec.x, spec.y}:
+                _results.setdefault((spec, change.new_version), dataclasses.replace(result, version=change.new_version))
+                continue
+        dibuang.append(spec.name)
+    return dibuang
+
+
+def clear_cache():
+    with _lock:
+        _results.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hitung inferensi bootstrap/permutasi untuk uji di dashboard TKDD.")
+    parser.add_argument("names", nargs="*", help=f"nama uji: {', '.join(SPECS)} (default: semua)")
+    parser.add_argument("--replikasi", type=int, default=REPLIKASI)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--jobs", type=int, default=1, help="jumlah worker process pool")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.names) - set(SPECS))
+    if unknown:
+        parser.error(f"uji tidak dikenal: {unknown}")
+
+    for name in args.names or SPECS:
+        spec = dataclasses.replace(SPECS[name], replikasi=args.replikasi, seed=args.seed)
+        result = hasil(spec, workers=args.jobs)
+        print(f"{name} (n={result.n}, {result.detik:.2f} s)")
+        for label, value in result.ringkasan().items():
+            print(f"  {label:<45} {value if isinstance(value, str) else f'{value:.4f}'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
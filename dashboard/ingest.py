@@ -0,0 +1,312 @@
+"""Ingesti kolumnar: sumber CSV/xlsx -> berkas Arrow bertipe yang divalidasi.
+
+Setiap dataset di ``dashboard.data.DATASETS`` dibaca dari berkas sumbernya,
+divalidasi terhadap katalog kolom (kolom wajib, nilai yang bisa dibaca
+sebagai angka, rentang nilai, kategori yang dikenal, kunci unik), lalu
+disimpan sebagai berkas Arrow IPC tanpa kompresi di ``Data/typed`` dengan
+ID kolom pendek. Label tampilan disimpan di metadata skema.
+
+Saat aplikasi berjalan, berkas Arrow di-memory-map sehingga kolom numerik
+tanpa nilai kosong dibaca tanpa parsing maupun salinan tambahan. Berkas
+dibangun ulang otomatis bila ukuran/mtime sumber atau katalog kolom
+berubah. Sumber yang rusak ditolak dengan ``SchemaError`` sebelum sampai
+ke grafik.
+
+Bila cache bersama aktif (``dashboard.cachestore``), tabel bertipe juga
+disimpan di sana dengan versi dari hash katalog dan isi sumber. Replika
+lain dengan sumber yang sama memakai tabel itu tanpa parsing dan validasi
+ulang, lalu menyalinnya ke ``Data/typed`` miliknya.
+
+Membangun atau memeriksa semua dataset secara manual::
+
+    python -m dashboard.ingest
+    python -m dashboard.ingest --check
+"""
+import argparse
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from dashboard import cachestore
+from dashboard.config import DATA_DIR
+
+# Naikkan jika format berkas bertipe berubah agar salinan lama dibangun ulang
+INGEST_VERSION = 1
+
+TYPED_DIR = DATA_DIR / "typed"
+
+_META_KEY = b"tkdd.ingest"
+
+# Jumlah contoh baris yang disebut dalam pesan galat per masalah
+_CONTOH = 5
+
+
+class SchemaError(ValueError):
+    """Berkas dataset tidak sesuai skema yang dideklarasikan."""
+
+
+def source_stamp(path):
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def source_digest(path):
+    """Hash isi berkas sumber; sama di semua host yang memegang salinan berkas yang sama."""
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def schema_hash(schema):
+    """Hash katalog kolom ``schema``; berubah bila ID, label, tipe, atau aturan kolom berubah."""
+    spec = [schema.name, INGEST_VERSION, list(schema.keys), list(schema.required)]
+    spec += [[k.id, k.label, str(k.dtype), k.minimum, k.maximum, list(k.categories or ())] for k in schema.columns]
+    return hashlib.sha1(json.dumps(spec).encode()).hexdigest()
+
+
+def typed_path(schema):
+    return TYPED_DIR / f"{schema.name}.arrow"
+
+
+def read_source(schema):
+    """Baca berkas sumber apa adanya (tanpa inferensi tipe) dengan label sebagai nama kolom."""
+    if schema.path.suffix.lower() in (".xlsx", ".xlsm"):
+        # Nilai sel rumus (misalnya =D2/E2) diambil dari hasil terakhir yang tersimpan
+        return pd.read_excel(schema.path, dtype=object)
+    return pd.read_csv(schema.path, dtype=str, skipinitialspace=True)
+
+
+def _baris(mask):
+    # Nomor baris seperti di berkas sumber (baris 1 = header)
+    rows = (np.flatnonzero(mask) + 2).tolist()
+    suffix = f" (+{len(rows) - _CONTOH} lainnya)" if len(rows) > _CONTOH else ""
+    return f"baris {rows[:_CONTOH]}{suffix}"
+
+
+def _is_integer(kolom):
+    return kolom.dtype not in ("string", "category") and np.dtype(kolom.dtype).kind in "iu"
+
+
+def _convert(kolom, raw, problems):
+    """Ubah kolom mentah ke tipe ``kolom.dtype``; masalah dicatat ke ``problems``."""
+    present = raw.notna().to_numpy()
+    if kolom.dtype == "string":
+        values = raw.astype(object).where(raw.notna(), None)
+        values = values.map(lambda v: str(v).strip() if v is not None else None)
+        kosong = present & (values.to_numpy() == "")
+        if kosong.any():
+            problems.append(f"'{kolom.label}': teks kosong pada {_baris(kosong)}")
+        return values.astype(object)
+
+    if kolom.dtype == "category":
+        values = raw.astype(object).where(raw.notna(), None).map(lambda v: str(v).strip() if v is not None else None)
+        asing = present & ~values.isin(kolom.categories).to_numpy()
+        if asing.any():
+            contoh = sorted(set(values[asing]))[:_CONTOH]
+            problems.append(f"'{kolom.label}': kategori tidak dikenal {contoh} pada {_baris(asing)}")
+        return pd.Categorical(values.where(~asing, None), categories=list(kolom.categories), ordered=True)
+
+    numbers = pd.to_numeric(raw, errors="coerce")
+    values = numbers.to_numpy(dtype="float64")
+    rusak = present & np.isnan(values)
+    if rusak.any():
+        contoh = [str(v) for v in raw[rusak][:_CONTOH]]
+        problems.append(f"'{kolom.label}': bukan angka {contoh} pada {_baris(rusak)}")
+    with np.errstate(invalid="ignore"):
+        if kolom.minimum is not None and (values < kolom.minimum).any():
+            problems.append(f"'{kolom.label}': nilai < {kolom.minimum} pada {_baris(values < kolom.minimum)}")
+        if kolom.maximum is not None and (values > kolom.maximum).any():
+            problems.append(f"'{kolom.label}': nilai > {kolom.maximum} pada {_baris(values > kolom.maximum)}")
+
+    if _is_integer(kolom):
+        pecahan = ~np.isnan(values) & (values != np.round(values))
+        if pecahan.any():
+            problems.append(f"'{kolom.label}': bukan bilangan bulat pada {_baris(pecahan)}")
+        if np.isnan(values).any():
+            # Nilai kosong pada kolom bilangan bulat sudah dilaporkan di validate
+            return values
+    return values.astype(kolom.dtype)
+
+
+def validate(raw, schema):
+    """DataFrame bertipe berkolom ID pendek dari ``raw``; ``SchemaError`` memuat semua masalah."""
+    name = schema.path.name
+    missing = [k.label for k in schema.columns if k.label not in raw.columns]
+    if missing:
+        raise SchemaError(f"{name}: kolom tidak ditemukan: {missing}")
+    if raw.empty:
+        raise SchemaError(f"{name}: tidak ada baris data")
+
+    problems = []
+    columns = {}
+    for kolom in schema.columns:
+        columns[kolom.id] = _convert(kolom, raw[kolom.label], problems)
+        # Kolom bilangan bulat tidak bisa menyimpan NaN sehingga selalu wajib terisi
+        if kolom.id in schema.required or _is_integer(kolom):
+            kosong = raw[kolom.label].isna().to_numpy()
+            if kosong.any():
+                problems.append(f"'{kolom.label}': nilai kosong pada {_baris(kosong)}")
+    df = pd.DataFrame(columns)
+
+    if schema.keys:
+        ganda = df.duplicated(list(schema.keys), keep=False).to_numpy()
+        if ganda.any():
+            problems.append(f"kunci {list(schema.keys)} ganda pada {_baris(ganda)}")
+
+    if problems:
+        raise SchemaError(f"{name}: " + "; ".join(problems))
+    return df
+
+
+def _dengan_meta(table, meta):
+    return table.replace_schema_metadata({**(table.schema.metadata or {}), _META_KEY: json.dumps(meta).encode()})
+
+
+def to_table(df, schema):
+    """Tabel Arrow dari DataFrame bertipe beserta label dan cap sumber di metadata."""
+    import pyarrow as pa
+
+    meta = {
+        "version": INGEST_VERSION,
+        "schema": schema_hash(schema),
+        "source": schema.path.name,
+        "stamp": source_stamp(schema.path),
+        "labels": {k.id: k.label for k in schema.columns},
+    }
+    return _dengan_meta(pa.Table.from_pandas(df, preserve_index=False), meta)
+
+
+def _simpan(table, path):
+    import pyarrow as pa
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".arrow.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    tmp_path.replace(path)
+    return path
+
+
+def write_typed(df, schema, path=None):
+    """Tulis DataFrame bertipe sebagai Arrow IPC beserta label dan cap sumber di metadata."""
+    return _simpan(to_table(df, schema), path or typed_path(schema))
+
+
+def read_typed(path):
+    """Pasangan ``(pyarrow.Table, metadata)`` dari berkas Arrow yang di-memory-map."""
+    import pyarrow as pa
+
+    # Buffer tabel menunjuk langsung ke halaman berkas; peta memori tetap hidup selama tabel dipakai
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b"{}"))
+    return table, meta
+
+
+def is_fresh(meta, schema):
+    return (
+        meta.get("version") == INGEST_VERSION
+        and meta.get("schema") == schema_hash(schema)
+        and meta.get("stamp") == source_stamp(schema.path)
+    )
+
+
+def to_frame(table, meta):
+    """DataFrame pandas dengan label tampilan sebagai nama kolom."""
+    # split_blocks menghindari penggabungan blok sehingga kolom numerik bisa zero-copy
+    df = table.to_pandas(split_blocks=True)
+    return df.rename(columns=meta["labels"])
+
+
+def _versi_bersama(schema):
+    return f"{schema_hash(schema)}-{source_digest(schema.path)}"
+
+
+def _ipc_bytes(table):
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _dari_bersama(schema, store):
+    """DataFrame berlabel dari cache bersama (disalin juga ke berkas bertipe lokal), atau None."""
+    import pyarrow as pa
+
+    blob = store.get("dataset", schema.name, _versi_bersama(schema))
+    if blob is None:
+        return None
+    table = pa.ipc.open_file(pa.py_buffer(blob)).read_all()
+    meta = json.loads(table.schema.metadata[_META_KEY])
+    # Cap sumber diganti milik host ini agar salinan lokal dianggap segar pada muat berikutnya
+    meta["stamp"] = source_stamp(schema.path)
+    table = _dengan_meta(table, meta)
+    try:
+        table, meta = read_typed(_simpan(table, typed_path(schema)))
+    except OSError:
+        pass
+    return to_frame(table, meta)
+
+
+def ingest(schema):
+    """Baca, validasi, dan tulis berkas bertipe ``schema``; kembalikan DataFrame berlabel."""
+    df = validate(read_source(schema), schema)
+    table = to_table(df, schema)
+    try:
+        _simpan(table, typed_path(schema))
+    except OSError:
+        # Direktori tidak bisa ditulis: tetap pakai hasil validasi di memori
+        pass
+    store = cachestore.get_store()
+    if store is not None:
+        store.set("dataset", schema.name, _ipc_bytes(table), _versi_bersama(schema))
+    return df.rename(columns={k.id: k.label for k in schema.columns})
+
+
+def load(schema):
+    """DataFrame berlabel untuk ``schema``: berkas bertipe yang segar, cache bersama, atau diingesti ulang."""
+    path = typed_path(schema)
+    try:
+        table, meta = read_typed(path)
+    except (OSError, ValueError):
+        # pyarrow.ArrowInvalid turunan ValueError: berkas tidak ada atau rusak
+        table, meta = None, {}
+    if table is not None and is_fresh(meta, schema):
+        return to_frame(table, meta)
+    store = cachestore.get_store()
+    if store is not None:
+        df = _dari_bersama(schema, store)
+        if df is not None:
+            return df
+    return ingest(schema)
+
+
+def main(argv=None):
+    from dashboard.data import DATASETS, is_available
+
+    parser = argparse.ArgumentParser(description="Ingesti sumber dataset TKDD ke berkas Arrow bertipe.")
+    parser.add_argument("names", nargs="*", help="nama dataset (default: semua yang tersedia)")
+    parser.add_argument("--check", action="store_true", help="hanya validasi, tanpa menulis berkas")
+    args = parser.parse_args(argv)
+
+    names = args.names or [name for name in DATASETS if is_available(name)]
+    status = 0
+    for name in names:
+        schema = DATASETS[name]
+        try:
+            df = validate(read_source(schema), schema)
+        except SchemaError as exc:
+            print(f"GAGAL {name}: {exc}")
+            status = 1
+            continue
+        if args.check:
+            print(f"OK    {name}: {len(df)} baris, {df.shape[1]} kolom")
+        else:
+            path = write_typed(df, schema)
+            print(f"OK    {name}: {len(df)} baris -> {path} ({path.stat().st_size / 1024:.1f} KB)")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,429 @@
+"""Layanan model regresi OLS dengan hasil yang di-cache per versi dataset.
+
+Setiap spesifikasi (dataset, target, prediktor, jenis kovarians, transformasi
+log) hanya di-fit satu kali untuk setiap versi data. Hasilnya disimpan
+sebagai ``ModelResult`` berisi koefisien, t-statistik, p-value, matriks
+kovarians, dan ringkasan diagnostik yang bisa dipakai ulang oleh semua
+halaman dan sesi.
+
+Matriks desain (mentah dan terstandardisasi) juga dibangun sekali per
+versi data lewat ``design`` dan dipakai bersama oleh fit, diagnostik
+multikolinearitas (VIF, condition number), dan ``dashboard.selection``.
+
+Bila cache bersama aktif (``dashboard.cachestore``), ``ModelResult``
+disimpan di sana sebagai array NumPy dan teks dalam berkas ``.npz``
+(tanpa pickle, sehingga isi store tidak bisa menjalankan kode) dengan versi
+data sebagai versi entri sehingga replika lain tidak perlu mem-fit ulang.
+"""
+import dataclasses
+import hashlib
+import io
+import json
+import threading
+import zipfile
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import cachestore, slices, telemetry
+from dashboard.data import dataset_version, get_dataset
+
+PREDIKTOR_REALISASI = (
+    'IPM',
+    'Pagu TKDD',
+    'Jumlah Penduduk',
+    'Anggaran APBN per kapita',
+    'Persentase Penduduk Miskin',
+    'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku',
+    'Produk Domestik Regional Bruto per Kapita HB',
+    'Laju Pertumbuhan PDRB atas dasar konstan 2010',
+)
+
+PREDIKTOR_IPM = (
+    'Realisasi TKDD',
+    'Pagu TKDD',
+    'Jumlah Penduduk',
+    'Anggaran APBN per kapita',
+    'Persentase Penduduk Miskin',
+    'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku',
+    'Produk Domestik Regional Bruto per Kapita HB',
+    'Laju Pertumbuhan PDRB atas dasar konstan 2010',
+)
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    name: str
+    dataset: str
+    target: str
+    predictors: Tuple[str, ...]
+    cov_type: str = "nonrobust"
+    log_columns: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ModelResult:
+    spec: ModelSpec
+    version: str
+    params: pd.Series
+    bse: pd.Series
+    tvalues: pd.Series
+    pvalues: pd.Series
+    cov: pd.DataFrame
+    fitted: np.ndarray
+    resid: np.ndarray
+    nobs: int
+    rsquared: float
+    rsquared_adj: float
+    fvalue: float
+    f_pvalue: float
+    aic: float
+    bic: float
+    condition_number: float
+    # Diagnostik: label baris, leverage, residual terstudentisasi internal, jarak Cook
+    labels: Tuple[str, ...]
+    leverage: np.ndarray
+    resid_studentized: np.ndarray
+    cooks_distance: np.ndarray
+    vif: pd.Series
+    # Condition number matriks korelasi prediktor (bebas skala satuan)
+    condition_number_std: float
+
+    def significance_table(self, alpha=0.05):
+        """Tabel koefisien, t-statistik, p-value, dan keputusan uji pada taraf ``alpha``."""
+        params_df = pd.DataFrame({
+            'Koefisien': self.params,
+            't-statistik': self.tvalues,
+            'p-value': self.pvalues
+        })
+        params_df['Keputusan'] = np.where(params_df['p-value'].to_numpy() < alpha, 'Signifikan', 'Tidak Signifikan')
+        return params_df
+
+    def vif_table(self):
+        """Tabel VIF setiap prediktor beserta tingkat multikolinearitasnya."""
+        table = self.vif.to_frame('VIF')
+        table['Multikolinearitas'] = np.select(
+            [table['VIF'].to_numpy() >= 10, table['VIF'].to_numpy() >= 5], ['Tinggi', 'Sedang'], 'Rendah'
+        )
+        return table
+
+    def diagnostik_frame(self):
+        """Satu baris per observasi: nilai fitted, residual, leverage, dan jarak Cook."""
+        return pd.DataFrame({
+            'Provinsi': list(self.labels),
+            'Fitted': self.fitted,
+            'Residual': self.resid,
+            'Residual terstudentisasi': self.resid_studentized,
+            'Leverage': self.leverage,
+            "Cook's D": self.cooks_distance,
+        })
+
+
+SPECS = {
+    "realisasi_tkdd": ModelSpec(
+        name="realisasi_tkdd",
+        dataset="all",
+        target='Realisasi TKDD',
+        predictors=PREDIKTOR_REALISASI,
+    ),
+    "ipm": ModelSpec(
+        name="ipm",
+        dataset="all",
+        target='IPM',
+        predictors=PREDIKTOR_IPM,
+    ),
+}
+
+# Derajat bebas residual minimum agar fit, diagnostik, dan leave-one-out bermakna
+MIN_DF_RESID = 2
+
+_results = slices.CacheVersi()
+_designs = slices.CacheVersi()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Desain:
+    spec: ModelSpec
+    version: str
+    Y: pd.Series
+    # Dengan kolom konstanta, seperti masukan sm.OLS
+    X: pd.DataFrame
+    labels: Tuple[str, ...]
+    # Prediktor terstandardisasi (rata-rata 0, simpangan baku 1) dan statistiknya
+    Z: np.ndarray
+    x_mean: np.ndarray
+    x_std: np.ndarray
+    y_mean: float
+    y_std: float
+
+    @property
+    def predictors(self):
+        return tuple(self.X.columns.drop('const'))
+
+    def korelasi(self):
+        """Matriks korelasi prediktor dari kolom terstandardisasi."""
+        return self.Z.T @ self.Z / (len(self.Z) - 1)
+
+
+def design_matrix(spec):
+    """Pasangan ``(Y, X)`` untuk spesifikasi, dengan konstanta dan transformasi log."""
+    import statsmodels.api as sm
+
+    df = get_dataset(spec.dataset)
+    columns = [spec.target, *spec.predictors]
+    frame = df[columns].astype('float64')
+    for col in spec.log_columns:
+        frame[col] = np.log(frame[col])
+    Y = frame[spec.target]
+    # Konstanta selalu ditambahkan, juga bila irisan data kecil membuat prediktor bernilai tetap
+    X = sm.add_constant(frame[list(spec.predictors)], has_constant='add')
+    return Y, X
+
+
+def _design(spec, version):
+    Y, X = design_matrix(spec)
+    ok = Y.notna().to_numpy() & X.notna().all(axis=1).to_numpy()
+    Y, X = Y[ok], X[ok]
+    labels = get_dataset(spec.dataset).loc[Y.index, 'Provinsi'].astype(str)
+    raw = X.drop(columns='const').to_numpy()
+    x_mean, x_std = raw.mean(axis=0), raw.std(axis=0, ddof=1)
+    return Desain(
+        spec=spec,
+        version=version,
+        Y=Y,
+        X=X,
+        labels=tuple(labels),
+        Z=(raw - x_mean) / x_std,
+        x_mean=x_mean,
+        x_std=x_std,
+        y_mean=float(Y.mean()),
+        y_std=float(Y.std()),
+    )
+
+
+def design(spec):
+    """``Desain`` untuk ``spec`` (objek ``ModelSpec`` atau nama di ``SPECS``), dibangun sekali per versi data."""
+    if isinstance(spec, str):
+        spec = SPECS[spec]
+    version = dataset_version(spec.dataset)
+    key = (spec, version)
+    with _lock:
+        result = _designs.get(key)
+    telemetry.cache_event("desain model", "hit" if result is not None else "miss")
+    if result is None:
+        with telemetry.fase("transform"):
+            result = _design(spec, version)
+        with _lock:
+            result = _designs.setdefault(key, result)
+    return result
+
+
+def cukup_data(spec):
+    """True bila sampel (irisan data yang aktif) cukup besar untuk mem-fit ``spec``."""
+    desain = design(spec)
+    return len(desain.Y) - desain.X.shape[1] >= MIN_DF_RESID
+
+
+def _diagnostik(desain, model):
+    """Leverage, residual terstudentisasi, jarak Cook, VIF, dan condition number terstandar dari fit ``model``."""
+    n = int(model.nobs)
+    # Rank efektif desain (bisa kurang dari jumlah kolom pada irisan kecil)
+    p = n - int(model.df_resid)
+    resid = model.resid.to_numpy()
+    leverage = model.get_influence().hat_matrix_diag
+    with np.errstate(divide='ignore', invalid='ignore'):
+        studentized = resid / np.sqrt(model.mse_resid * (1 - leverage))
+        cooks = studentized ** 2 * leverage / (p * (1 - leverage))
+
+    # VIF semua prediktor sekaligus: diagonal invers matriks korelasi
+    corr = desain.korelasi()
+    eigen = np.linalg.eigvalsh(corr)
+    try:
+        vif = np.diag(np.linalg.inv(corr))
+    except np.linalg.LinAlgError:
+        vif = np.full(len(corr), np.inf)
+    return {
+        "fitted": model.fittedvalues.to_numpy(),
+        "resid": resid,
+        "labels": desain.labels,
+        "leverage": leverage,
+        "resid_studentized": studentized,
+        "cooks_distance": cooks,
+        "vif": pd.Series(vif, index=list(desain.predictors), name='VIF'),
+        "condition_number_std": float(np.sqrt(eigen.max() / eigen.min())) if eigen.min() > 0 else float('inf'),
+    }
+
+
+def _fit(spec, version):
+    """Fit OLS pada desain terstandar lalu kembalikan koefisien ke satuan asli.
+
+    Pada desain mentah (kolom rupiah ~1e13) pseudo-invers ``sm.OLS``
+    membuang arah yang kecil sehingga fit-nya kurang rank. Desain
+    ``[1, Z]`` berkondisi baik; koefisien mentah ``b = T a`` dan kovariansnya
+    ``T cov(a) T'`` (berlaku juga untuk kovarians robust). Tabel koefisien
+    dan semua diagnostik berasal dari fit yang sama.
+    """
+    import statsmodels.api as sm
+    from scipy import stats
+
+    desain = design(spec)
+    Y, X = desain.Y, desain.X
+    # Prediktor bernilai tetap (irisan kecil) tidak diskalakan; kolomnya nol dan koefisiennya 0
+    skala = np.where(desain.x_std > 0, desain.x_std, 1.0)
+    raw = X.drop(columns='const').to_numpy()
+    Z = pd.DataFrame(np.column_stack([np.ones(len(raw)), (raw - desain.x_mean) / skala]),
+                     index=X.index, columns=X.columns)
+    model = sm.OLS(Y, Z).fit(cov_type=spec.cov_type)
+
+    T = np.diag(np.concatenate([[1.0], 1 / skala]))
+    T[0, 1:] = -desain.x_mean / skala
+    params = pd.Series(T @ model.params.to_numpy(), index=X.columns)
+    cov = pd.DataFrame(T @ model.cov_params().to_numpy() @ T.T, index=X.columns, columns=X.columns)
+    bse = pd.Series(np.sqrt(np.diag(cov)), index=X.columns)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tvalues = params / bse
+    # Distribusi uji mengikuti statsmodels: t untuk kovarians biasa, normal untuk kovarians robust
+    sf = stats.t(model.df_resid).sf if model.use_t else stats.norm.sf
+    pvalues = pd.Series(2 * sf(np.abs(tvalues.to_numpy())), index=X.columns)
+    return ModelResult(
+        spec=spec,
+        version=version,
+        params=params,
+        bse=bse,
+        tvalues=tvalues,
+        pvalues=pvalues,
+        cov=cov,
+        nobs=int(model.nobs),
+        rsquared=float(model.rsquared),
+        rsquared_adj=float(model.rsquared_adj),
+        fvalue=float(model.fvalue),
+        f_pvalue=float(model.f_pvalue),
+        aic=float(model.aic),
+        bic=float(model.bic),
+        # Condition number desain mentah (seperti ringkasan statsmodels), tetap dilaporkan
+        condition_number=float(np.linalg.cond(X.to_numpy())),
+        **_diagnostik(desain, model),
+    )
+
+
+def _kunci_bersama(spec):
+    return hashlib.sha1(json.dumps(dataclasses.asdict(spec), sort_keys=True).encode()).hexdigest()
+
+
+# Kolom ModelResult per jenis untuk serialisasi ke cache bersama
+_SERI = ("params", "bse", "tvalues", "pvalues")
+_ARRAY = ("fitted", "resid", "leverage", "resid_studentized", "cooks_distance")
+_SKALAR = ("rsquared", "rsquared_adj", "fvalue", "f_pvalue", "aic", "bic", "condition_number", "condition_number_std")
+
+
+def ke_bytes(result):
+    """Serialisasi ``ModelResult`` ke ``.npz`` berisi array angka dan teks saja (tanpa spec dan versi)."""
+    buf = io.BytesIO()
+    np.savez(
+        buf,
+        names=np.array(result.params.index, dtype=str),
+        vif_names=np.array(result.vif.index, dtype=str),
+        labels=np.array(result.labels, dtype=str),
+        cov=result.cov.to_numpy(dtype='float64'),
+        vif=result.vif.to_numpy(dtype='float64'),
+        nobs=np.array(result.nobs),
+        **{name: getattr(result, name).to_numpy(dtype='float64') for name in _SERI},
+        **{name: np.asarray(getattr(result, name), dtype='float64') for name in _ARRAY},
+        **{name: np.array(getattr(result, name), dtype='float64') for name in _SKALAR},
+    )
+    return buf.getvalue()
+
+
+def dari_bytes(blob, spec, version):
+    """``ModelResult`` dari hasil ``ke_bytes``; ``ValueError`` bila isinya tidak sesuai format."""
+    try:
+        with np.load(io.BytesIO(blob), allow_pickle=False) as npz:
+            names = [str(n) for n in npz["names"]]
+            return ModelResult(
+                spec=spec,
+                version=version,
+                cov=pd.DataFrame(npz["cov"], index=names, columns=names),
+                nobs=int(npz["nobs"]),
+                labels=tuple(str(label) for label in npz["labels"]),
+                vif=pd.Series(npz["vif"], index=[str(n) for n in npz["vif_names"]], name='VIF'),
+                **{name: pd.Series(npz[name], index=names) for name in _SERI},
+                **{name: npz[name] for name in _ARRAY},
+                **{name: float(npz[name]) for name in _SKALAR},
+            )
+    except (KeyError, OSError, zipfile.BadZipFile) as exc:
+        raise ValueError(f"Entri model tidak valid: {exc}") from exc
+
+
+def _dari_bersama(store, spec, version):
+    blob = store.get("model", _kunci_bersama(spec), version)
+    if blob is None:
+        return None
+    try:
+        return dari_bytes(blob, spec, version)
+    except ValueError:
+        # Ditulis versi kode lain atau rusak: fit ulang dan timpa
+        return None
+
+
+def fit(spec):
+    """``ModelResult`` untuk ``spec`` (objek ``ModelSpec`` atau nama di ``SPECS``)."""
+    if isinstance(spec, str):
+        spec = SPECS[spec]
+    version = dataset_version(spec.dataset)
+    key = (spec, version)
+    with _lock:
+        result = _results.get(key)
+    if result is not None:
+        telemetry.cache_event("model", "hit")
+        return result
+
+    store = cachestore.get_store()
+    result = _dari_bersama(store, spec, version) if store is not None else None
+    if result is not None:
+        telemetry.cache_event("model", "bersama")
+    else:
+        telemetry.cache_event("model", "miss")
+        with telemetry.fase("model"):
+            result = _fit(spec, version)
+        if store is not None:
+            store.set("model", _kunci_bersama(spec), ke_bytes(result), version)
+    with _lock:
+        return _results.setdefault(key, result)
+
+
+def carry_over(change):
+    """Pindahkan hasil ``change.dataset`` ke versi baru; hanya model yang kolomnya berubah di-fit ulang."""
+    with _lock:
+        lama = [(spec, result) for (spec, version), result in _results.items()
+                if spec.dataset == change.dataset and version == change.old_version]
+    refit = []
+    for spec, result in lama:
+        if change.rows_same and not set(change.columns) & {spec.target, *spec.predictors}:
+            baru = dataclasses.replace(result, version=change.new_version)
+        else:
+            baru = _fit(spec, change.new_version)
+            refit.append(spec.name)
+        with _lock:
+            _results.pop((spec, change.old_version), None)
+            _results.setdefault((spec, change.new_version), baru)
+    store = cachestore.get_store()
+    if store is not None:
+        # Entri versi lama diganti hasil versi baru agar replika lain tidak perlu fit ulang
+        store.invalidate("model", change.old_version)
+        for spec, _ in lama:
+            with _lock:
+                baru = _results.get((spec, change.new_version))
+            store.set("model", _kunci_bersama(spec), ke_bytes(baru), change.new_version)
+    with _lock:
+        for key in [key for key in _designs if key[0].dataset == change.dataset and key[1] == change.old_version]:
+            _designs.pop(key)
+    return refit
+
+
+def clear_cache():
+    with _lock:
+        _results.clear()
+        _designs.clear()
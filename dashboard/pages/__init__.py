@@ -0,0 +1,45 @@
+"""Registri halaman dashboard.
+
+Setiap halaman adalah modul tersendiri dengan fungsi ``render(st,
+tampilkan_gambar)`` dan tuple ``REQUIRES`` berisi dependensi berat yang
+dipakainya. Modul halaman baru diimpor saat halaman itu pertama kali
+dipilih, sehingga proses Streamlit tidak perlu memuat geopandas,
+statsmodels, scipy, dan matplotlib hanya untuk menampilkan menu.
+"""
+import importlib
+
+# Judul menu -> nama modul di dalam paket ini (urutan = urutan menu)
+PAGES = {
+    "Perbandingan Pagu dan Realisasi TKDD": "perbandingan",
+    "Persentase Realisasi TKDD per Provinsi (2023)": "persentase",
+    "Faktor Realisasi TKDD": "faktor_realisasi",
+    "Hubungan Realisasi TKDD dan IPM": "hubungan_ipm",
+    "Analisis Faktor-faktor yang Mempengaruhi IPM": "faktor_ipm",
+}
+
+# Halaman yang hanya muncul di menu bila URL memuat ?diagnostik
+HIDDEN = {
+    "Instrumentasi Server": "instrumentasi",
+}
+
+
+def menu(diagnostik=False):
+    """Judul menu yang ditampilkan, termasuk halaman tersembunyi bila ``diagnostik``."""
+    return [*PAGES, *(HIDDEN if diagnostik else ())]
+
+
+def load(title):
+    """Modul halaman untuk judul menu ``title`` (diimpor saat pertama kali dipanggil)."""
+    return importlib.import_module(f"{__name__}.{PAGES.get(title) or HIDDEN[title]}")
+
+
+def preload(title):
+    """Impor modul halaman beserta seluruh dependensi beratnya tanpa merender."""
+    page = load(title)
+    for module in page.REQUIRES:
+        importlib.import_module(module)
+    return page
+
+
+def render(title, st, tampilkan_gambar):
+    load(title).render(st, tampilkan_gambar)
@@ -0,0 +1,33 @@
+"""Diagnostik multikolinearitas dan residual untuk halaman regresi.
+
+Semua angka diambil dari ``ModelResult`` di cache model (dihitung sekali
+per versi data bersama fit-nya).
+"""
+from dashboard import models
+
+# Di atas ambang ini hasil fit pada satuan asli rentan galat numerik
+BATAS_CONDITION_MENTAH = 1e12
+
+
+def tampilkan_diagnostik(st, tampilkan_gambar, model):
+    hasil = models.fit(model)
+    st.write("### Diagnostik Model")
+
+    kol1, kol2, kol3 = st.columns(3)
+    kol1.metric("VIF maksimum", f"{hasil.vif.max():.1f}")
+    kol2.metric("Condition number (terstandar)", f"{hasil.condition_number_std:.1f}")
+    kol3.metric("Condition number (satuan asli)", f"{hasil.condition_number:.2e}")
+
+    st.dataframe(hasil.vif_table().style.format({'VIF': '{:.2f}'}))
+    tinggi = hasil.vif_table().query("Multikolinearitas == 'Tinggi'").index.tolist()
+    if tinggi:
+        st.warning(f"Multikolinearitas tinggi (VIF ≥ 10): {', '.join(tinggi)}. Koefisien dan p-value "
+                   "prediktor ini tidak stabil; pertimbangkan mengeluarkan salah satunya.")
+    if hasil.condition_number > BATAS_CONDITION_MENTAH:
+        st.info("Condition number pada satuan asli sangat besar karena skala kolom rupiah (~1e13), bukan "
+                "hanya karena korelasi antarprediktor. Diagnostik di bawah dihitung dari desain terstandar.")
+
+    tampilkan_gambar("diagnostik_regresi", hasil.diagnostik_frame(), n_params=len(hasil.params),
+                     title=f"Diagnostik Residual: {hasil.spec.target}")
+    st.caption("Titik di luar kontur jarak Cook 0,5 atau 1 berpengaruh besar terhadap koefisien; "
+               "tiga provinsi dengan jarak Cook terbesar diberi label.")
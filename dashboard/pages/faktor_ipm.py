@@ -0,0 +1,160 @@
+"""Halaman faktor-faktor yang mempengaruhi IPM: scatter, korelasi, dan regresi."""
+from dashboard import models, panels
+from dashboard import stats as stats_cube
+from dashboard.data import get_dataset
+from dashboard.pages.diagnostik import tampilkan_diagnostik
+from dashboard.pages.seleksi import tampilkan_eksplorasi
+
+REQUIRES = ("matplotlib", "seaborn", "scipy.stats", "statsmodels.api")
+
+
+def render(st, tampilkan_gambar):
+    st.subheader("Analisis Faktor-faktor yang Mempengaruhi IPM")
+
+    data_clean_all = get_dataset("all")
+
+    # ========================
+    # 1. Scatter Plot Grid
+    st.write("### Scatter Plot: Faktor-faktor terhadap IPM")
+
+    variabels = [
+        'Pagu TKDD',
+        'Jumlah Penduduk',
+        'Anggaran APBN per kapita',
+        'Persentase Penduduk Miskin',
+        'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku',
+        'Produk Domestik Regional Bruto per Kapita HB',
+        'Laju Pertumbuhan PDRB atas dasar konstan 2010',
+        'Realisasi TKDD'
+    ]
+
+    # Hanya kolom yang digambar, agar gambar di cache tetap berlaku bila kolom lain diperbarui
+    garis = st.radio("Garis tren", list(panels.GARIS_TREN), horizontal=True, key="tren_faktor_ipm")
+    tampilkan_gambar("scatter_grid", data_clean_all[['IPM', *variabels]], variabels=variabels, target='IPM',
+                     fit=panels.GARIS_TREN[garis])
+    st.markdown("""
+### Penjelasan:
+
+1. **Pagu TKDD vs IPM**  
+   Tidak terlihat hubungan yang jelas antara besarnya pagu TKDD dengan IPM.  
+   Sebaran data acak menunjukkan bahwa **alokasi dana belum tentu berbanding lurus dengan kualitas pembangunan manusia**.
+
+2. **Jumlah Penduduk vs IPM**  
+   Tidak terdapat pola hubungan yang konsisten.  
+   Provinsi dengan jumlah penduduk besar bisa memiliki IPM tinggi maupun rendah, menunjukkan bahwa **faktor lain lebih dominan**.
+
+3. **Anggaran APBN per Kapita vs IPM**  
+   Terdapat kecenderungan **positif**: provinsi dengan **anggaran per kapita lebih tinggi** cenderung memiliki **IPM lebih baik**,  
+   meskipun **hubungan tidak terlalu kuat**.
+
+4. **Persentase Penduduk Miskin vs IPM**  
+   Menunjukkan **hubungan negatif yang cukup jelas**.  
+   Semakin tinggi tingkat kemiskinan, maka **IPM cenderung lebih rendah**, menegaskan bahwa **kemiskinan berdampak langsung terhadap kualitas hidup**.
+
+5. **PDRB Atas Dasar Harga Berlaku vs IPM**  
+   Ada **kecenderungan hubungan positif**, meskipun dengan **penyebaran data yang lebar**.  
+   Daerah dengan ekonomi besar cenderung memiliki **IPM yang lebih tinggi**.
+
+6. **PDRB per Kapita HB vs IPM**  
+   Hubungan **positif terlihat cukup kuat**.  
+   Semakin tinggi **PDRB per kapita**, maka semakin tinggi pula **IPM**, menunjukkan bahwa **kesejahteraan ekonomi individu sangat berkaitan dengan kualitas pembangunan manusia**.
+
+7. **Laju Pertumbuhan PDRB (konstan 2010) vs IPM**  
+   Tidak menunjukkan pola yang jelas.  
+   Meskipun ada pertumbuhan ekonomi, **tidak selalu diikuti oleh peningkatan IPM secara langsung**.
+
+8. **Realisasi TKDD vs IPM**  
+   Sebaran data cukup acak dan **tidak menunjukkan korelasi yang kuat**.  
+   Artinya, **besarnya realisasi dana transfer tidak selalu berkaitan dengan pencapaian IPM yang lebih baik**.
+
+---
+
+""")
+
+    # ========================
+    # 2. Korelasi terhadap IPM
+    st.write("### Korelasi terhadap IPM")
+
+    cols = ['Realisasi TKDD'] + variabels[:-1]  # Hindari duplikasi
+    corr_target = stats_cube.cube("all").korelasi_target('IPM', cols)
+
+    tampilkan_gambar("korelasi_heatmap", corr_target, title='Korelasi terhadap IPM')
+    st.markdown("""
+### Penjelasan:
+
+Berdasarkan **visualisasi korelasi terhadap IPM**, variabel yang menunjukkan hubungan paling kuat adalah:
+
+- **PDRB per Kapita Harga Berlaku** dengan nilai korelasi sebesar **0.46**
+- **PDRB Atas Dasar Harga Berlaku** sebesar **0.44**
+
+Hal ini mengindikasikan bahwa **daerah dengan tingkat output ekonomi yang tinggi**, khususnya dalam hal **pendapatan per kapita**, cenderung memiliki **kualitas pembangunan manusia yang lebih baik**.
+
+Sebaliknya, variabel:
+
+- **Persentase Penduduk Miskin** menunjukkan korelasi **negatif paling kuat**, yaitu sebesar **-0.69**.  
+  Ini menegaskan bahwa **semakin tinggi tingkat kemiskinan di suatu wilayah**, maka **semakin rendah pula capaian IPM-nya**.  
+  Korelasi negatif ini menjadi **bukti kuat bahwa kemiskinan masih menjadi faktor penghambat utama** dalam pembangunan manusia.
+
+---
+
+Kondisi berbeda ditunjukkan oleh pengaruh variabel berikut yang tergolong lemah.
+
+- **Realisasi TKDD**: korelasi positif lemah (**0.17**)  
+- **Pagu TKDD**: korelasi positif lemah (**0.15**)  
+
+Hal ini menunjukkan bahwa **besarnya dana transfer ke daerah tidak secara langsung berkorelasi kuat dengan peningkatan IPM**.
+
+Begitu pula:
+
+- **Jumlah Penduduk** dan **Laju Pertumbuhan PDRB Konstan 2010** menunjukkan **hubungan yang sangat lemah**.
+- **Anggaran APBN per Kapita** memiliki **korelasi negatif sebesar -0.13**, mengindikasikan bahwa **besarnya anggaran per orang belum tentu meningkatkan IPM**.  
+  Kemungkinan terdapat **faktor distribusi dan efisiensi anggaran** yang perlu ditelaah lebih lanjut.
+
+---
+
+""")
+
+    # ========================
+    # 3. Regresi Linier
+    if not models.cukup_data("ipm"):
+        st.warning("Jumlah provinsi pada filter ini terlalu sedikit untuk regresi linier berganda.")
+        return
+    st.write("### Regresi Linier Berganda: Prediktor terhadap IPM")
+
+    # Model di-fit sekali per versi data lalu diambil dari cache
+    params_df = models.fit("ipm").significance_table()
+
+    st.dataframe(params_df.style.format({
+        'Koefisien': '{:.4f}',
+        't-statistik': '{:.2f}',
+        'p-value': '{:.4f}'
+    }))
+    
+    st.markdown("""
+### Penjelasan Hasil Regresi Linear Berganda terhadap IPM
+
+Berdasarkan hasil regresi linear berganda terhadap **Indeks Pembangunan Manusia (IPM)**, hanya beberapa variabel yang menunjukkan pengaruh signifikan pada taraf signifikansi 5%. Variabel yang signifikan adalah **Jumlah Penduduk** dan **Persentase Penduduk Miskin**.
+
+Variabel yang paling signifikan adalah **Persentase Penduduk Miskin**, dengan p-value sangat kecil dan koefisien negatif. Hal ini menunjukkan bahwa peningkatan tingkat kemiskinan berdampak signifikan dalam menurunkan IPM suatu daerah. Oleh karena itu, **penurunan angka kemiskinan menjadi faktor kunci dalam mendorong pembangunan manusia**.
+
+Selain itu, variabel **Jumlah Penduduk** juga berpengaruh signifikan dengan koefisien negatif. Artinya, provinsi dengan jumlah penduduk yang lebih besar cenderung memiliki IPM yang lebih rendah. Ini dapat mengindikasikan bahwa tingginya jumlah penduduk menimbulkan tantangan dalam penyediaan layanan dasar seperti pendidikan, kesehatan, dan infrastruktur, sehingga menghambat peningkatan IPM.
+
+Sementara itu, variabel-variabel lain seperti:
+- Realisasi TKDD  
+- Pagu TKDD  
+- Anggaran APBN per Kapita  
+- PDRB Atas Dasar Harga Berlaku  
+- PDRB per Kapita Harga Berlaku  
+- Laju Pertumbuhan PDRB  
+
+tidak menunjukkan pengaruh yang signifikan terhadap IPM pada taraf signifikansi 5%. Ini mengindikasikan bahwa **besarnya anggaran atau pertumbuhan ekonomi tidak otomatis meningkatkan IPM**, apabila tidak disertai pemerataan dan efektivitas distribusi manfaat pembangunan.
+
+**Interpretasi Kuantitatif Variabel Signifikan:**
+
+1. **Setiap peningkatan 1% Persentase Penduduk Miskin** diperkirakan menurunkan IPM sebesar **0,454** poin. Hal ini menegaskan bahwa pengentasan kemiskinan sangat krusial dalam upaya meningkatkan kualitas pembangunan manusia.
+
+2. **Setiap peningkatan 1 orang dalam jumlah penduduk** diperkirakan menurunkan IPM sebesar **0.000000128** poin. Ini menunjukkan pentingnya pemerataan pembangunan agar peningkatan populasi tidak memperburuk kualitas hidup masyarakat.
+""")
+
+    tampilkan_diagnostik(st, tampilkan_gambar, "ipm")
+    tampilkan_eksplorasi(st, "ipm")
@@ -0,0 +1,142 @@
+"""Halaman faktor-faktor yang berhubungan dengan Realisasi TKDD: scatter, korelasi, dan regresi."""
+from dashboard import models, panels
+from dashboard import stats as stats_cube
+from dashboard.data import get_dataset
+from dashboard.pages.diagnostik import tampilkan_diagnostik
+from dashboard.pages.seleksi import tampilkan_eksplorasi
+
+REQUIRES = ("matplotlib", "seaborn", "scipy.stats", "statsmodels.api")
+
+
+def _angka(nilai, desimal=0):
+    """Angka dengan format Indonesia: titik pemisah ribuan, koma desimal."""
+    return f"{nilai:,.{desimal}f}".translate(str.maketrans(",.", ".,"))
+
+
+def render(st, tampilkan_gambar):
+    st.subheader("Analisis Hubungan Realisasi TKDD dengan Variabel Ekonomi")
+
+    data_clean_all = get_dataset("all")
+
+    # 1. Scatterplot Grid
+    st.write("### Scatter Plot: Realisasi TKDD terhadap Variabel Lain")
+    variabels = [
+        'IPM',
+        'Pagu TKDD',
+        'Jumlah Penduduk',
+        'Anggaran APBN per kapita',
+        'Persentase Penduduk Miskin',
+        'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku',
+        'Produk Domestik Regional Bruto per Kapita HB',
+        'Laju Pertumbuhan PDRB atas dasar konstan 2010'
+    ]
+
+    # Hanya kolom yang digambar, agar gambar di cache tetap berlaku bila kolom lain diperbarui
+    garis = st.radio("Garis tren", list(panels.GARIS_TREN), horizontal=True, key="tren_faktor_realisasi")
+    tampilkan_gambar("scatter_grid", data_clean_all[['Realisasi TKDD', *variabels]], variabels=variabels, target='Realisasi TKDD',
+                     fit=panels.GARIS_TREN[garis])
+    st.markdown("""
+### Penjelasan:
+
+**1. IPM vs Realisasi TKDD**  
+Tidak terlihat pola hubungan linier yang jelas antara Indeks Pembangunan Manusia (IPM) dan Realisasi TKDD. Ini menunjukkan bahwa besarnya realisasi transfer tidak berkaitan langsung dengan tinggi rendahnya IPM suatu daerah.
+
+**2. Pagu TKDD vs Realisasi TKDD**  
+Terlihat hubungan linier positif yang sangat kuat antara pagu dan realisasi. Artinya, semakin besar pagu TKDD yang direncanakan, semakin besar pula realisasi anggaran TKDD-nya. Ini menunjukkan proses distribusi yang proporsional terhadap alokasi awal.
+
+**3. Jumlah Penduduk vs Realisasi TKDD**  
+Terdapat kecenderungan bahwa daerah dengan jumlah penduduk lebih besar cenderung menerima realisasi TKDD yang lebih tinggi. Namun, sebaran cukup variatif dan tidak terlalu terpusat.
+
+**4. Anggaran APBN per Kapita vs Realisasi TKDD**  
+Tidak tampak korelasi yang jelas. Artinya, nilai APBN per kapita tidak serta-merta menentukan tingginya realisasi TKDD. Hal ini bisa mengindikasikan bahwa perhitungan transfer daerah tidak sepenuhnya berbasis per kapita.
+
+**5. Persentase Penduduk Miskin vs Realisasi TKDD**  
+Tidak terdapat hubungan yang kuat antara persentase kemiskinan dengan realisasi TKDD. Realisasi tetap tersebar di berbagai tingkat kemiskinan, mengindikasikan bahwa penyaluran dana tidak selalu ditentukan oleh tingkat kemiskinan.
+
+**6. Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku vs Realisasi TKDD**  
+Terdapat kecenderungan bahwa daerah dengan PDRB tinggi memiliki realisasi TKDD yang lebih besar, namun hubungan ini tampak lemah dan menyebar.
+
+**7. PDRB per Kapita HB vs Realisasi TKDD**  
+Hubungan antara PDRB per kapita dengan realisasi juga tidak kuat. Daerah dengan PDRB per kapita tinggi tidak selalu mendapat realisasi TKDD yang besar, mengindikasikan bahwa kemampuan ekonomi per individu tidak menjadi penentu utama.
+
+**8. Laju Pertumbuhan PDRB (konstan 2010) vs Realisasi TKDD**  
+Tidak tampak korelasi yang jelas antara pertumbuhan ekonomi dengan realisasi TKDD. Artinya, baik daerah dengan pertumbuhan tinggi maupun rendah bisa mendapatkan realisasi dana yang besar.
+
+
+
+---
+
+""")
+
+    # 2. Korelasi
+    st.write("### Korelasi terhadap Realisasi TKDD")
+    # Matriks korelasi diambil dari kubus statistik (dihitung sekali per versi data)
+    corr_target = stats_cube.cube("all").korelasi_target('Realisasi TKDD', variabels)
+
+    tampilkan_gambar("korelasi_heatmap", corr_target, title='Korelasi terhadap Realisasi TKDD')
+    st.markdown("""
+### Penjelasan:
+
+Berdasarkan visualisasi korelasi terhadap **Realisasi TKDD**, variabel yang menunjukkan hubungan paling kuat adalah **Pagu TKDD** dengan korelasi sempurna mendekati 1, menegaskan bahwa besarnya alokasi awal sangat menentukan realisasi anggaran.
+
+Selain itu, **PDRB atas dasar harga berlaku** dan **jumlah penduduk** juga memiliki korelasi positif yang cukup tinggi yaitu sebesar **0,72** dan **0,67**. Hal ini mengindikasikan bahwa daerah dengan kapasitas ekonomi dan jumlah penduduk besar cenderung mendapatkan realisasi dana yang lebih besar.
+
+Di sisi lain, variabel seperti **IPM**, **PDRB per kapita**, dan **laju pertumbuhan ekonomi** menunjukkan korelasi yang sangat lemah terhadap realisasi TKDD, menandakan bahwa faktor kesejahteraan dan pertumbuhan tidak terlalu berpengaruh dalam distribusi dana.
+
+Bahkan, variabel seperti **persentase penduduk miskin** dan **APBN per kapita** memiliki korelasi negatif, yang mengindikasikan bahwa wilayah dengan indikator kemiskinan tinggi justru tidak selalu mendapat realisasi anggaran yang proporsional — atau terdapat **mekanisme distribusi lain yang lebih dominan** daripada pertimbangan kesejahteraan.
+
+
+---
+
+""")
+
+    # 3. Regresi Linear
+    if not models.cukup_data("realisasi_tkdd"):
+        st.warning("Jumlah provinsi pada filter ini terlalu sedikit untuk regresi linier berganda.")
+        return
+    st.write("### Regresi Linier Berganda: Prediktor terhadap Realisasi TKDD")
+
+    # Model di-fit sekali per versi data lalu diambil dari cache
+    hasil = models.fit("realisasi_tkdd")
+    params_df = hasil.significance_table()
+
+    st.dataframe(params_df.style.format({
+        'Koefisien': '{:.4f}',
+        't-statistik': '{:.2f}',
+        'p-value': '{:.4f}'
+    }))
+    # Angka pada penjelasan diambil dari model yang sama agar selalu sesuai dengan tabel
+    koef = hasil.params
+    pdrb = 'Produk Domestik Regional Bruto (PDRB) Atas Dasar Harga Berlaku'
+    pdrb_kapita = 'Produk Domestik Regional Bruto per Kapita HB'
+    st.markdown(f"""
+### Penjelasan Hasil Regresi Linear Berganda terhadap Realisasi TKDD
+
+Berdasarkan hasil regresi linear berganda terhadap **Realisasi TKDD**, hanya beberapa variabel yang terbukti berpengaruh secara signifikan pada taraf signifikansi 5%.
+
+Variabel **Pagu TKDD** menunjukkan pengaruh paling dominan dengan koefisien positif dan sangat signifikan. Hal ini menegaskan bahwa **alokasi awal anggaran merupakan faktor utama yang menentukan besarnya realisasi TKDD**, karena pada dasarnya realisasi belanja mengikuti pola pagu yang telah ditetapkan sejak awal tahun anggaran.
+
+Selain itu, variabel **PDRB Atas Dasar Harga Berlaku** memiliki pengaruh yang signifikan namun berdampak negatif terhadap realisasi TKDD. Artinya, **semakin besar total nilai produksi barang dan jasa suatu daerah (tanpa memperhitungkan inflasi), justru semakin rendah realisasi TKDD**. Hal ini dapat dijelaskan oleh asumsi bahwa daerah dengan PDRB tinggi sudah memiliki kapasitas fiskal yang memadai sehingga mendapatkan alokasi transfer yang lebih terbatas.
+
+Sebaliknya, variabel **PDRB per Kapita Harga Berlaku** menunjukkan pengaruh yang signifikan dan berdampak positif terhadap realisasi TKDD. Artinya, **semakin tinggi produktivitas ekonomi rata-rata per individu**, maka realisasi dana transfer juga cenderung lebih besar. Hal ini bisa mencerminkan bahwa daerah dengan produktivitas per kapita tinggi memiliki kapasitas kelembagaan yang baik dalam menyerap anggaran.
+
+Sementara itu, variabel-variabel lain seperti:
+- Indeks Pembangunan Manusia (IPM)  
+- Jumlah Penduduk  
+- Anggaran APBN per Kapita  
+- Persentase Penduduk Miskin (p-value {_angka(hasil.pvalues['Persentase Penduduk Miskin'], 2)})  
+- Laju Pertumbuhan PDRB  
+
+tidak menunjukkan pengaruh signifikan terhadap realisasi TKDD. Artinya, setelah Pagu TKDD dan PDRB diperhitungkan, perubahan pada variabel-variabel tersebut tidak secara konsisten berkaitan dengan besarnya realisasi anggaran.
+
+**Interpretasi Kuantitatif Variabel Signifikan:**
+
+1. **Setiap peningkatan 1 rupiah pada Pagu TKDD** dapat meningkatkan Realisasi TKDD sebesar **{_angka(koef['Pagu TKDD'], 3)} rupiah**. Hal ini mencerminkan hubungan linier yang sangat kuat antara alokasi awal dan realisasi anggaran.
+
+2. **Setiap peningkatan 1 miliar rupiah pada PDRB Atas Dasar Harga Berlaku** berpotensi menurunkan Realisasi TKDD sebesar **{_angka(-koef[pdrb])} rupiah**. Ini menggambarkan bahwa daerah dengan kapasitas ekonomi tinggi mungkin mendapatkan alokasi lebih kecil karena telah dianggap mandiri secara fiskal.
+
+3. **Setiap peningkatan 1 rupiah pada PDRB Per Kapita HB** dapat meningkatkan Realisasi TKDD sebesar **{_angka(koef[pdrb_kapita])} rupiah**. Ini menunjukkan bahwa meskipun daerah tersebut tergolong mampu, peningkatan produktivitas individu tetap berkaitan dengan penyaluran dana transfer secara marginal.
+""")
+
+    tampilkan_diagnostik(st, tampilkan_gambar, "realisasi_tkdd")
+    tampilkan_eksplorasi(st, "realisasi_tkdd")
@@ -0,0 +1,104 @@
+"""Halaman hubungan Realisasi TKDD dan IPM: korelasi Pearson dan uji Chi-Square."""
+import pandas as pd
+
+from dashboard import inference
+from dashboard import stats as stats_cube
+from dashboard.data import get_dataset
+
+REQUIRES = ("matplotlib", "seaborn", "scipy.stats")
+
+
+def tampilkan_resampling(st, hasil):
+    # Hasil bootstrap/permutasi di samping hasil asimtotik, di-cache per versi data
+    with st.expander("Inferensi resampling (bootstrap dan permutasi)", expanded=True):
+        ringkasan = {k: v if isinstance(v, str) else f"{v:.4f}" for k, v in hasil.ringkasan().items()}
+        st.table(pd.DataFrame({"Nilai": ringkasan}))
+        st.caption(f"n = {hasil.n}, seed = {hasil.spec.seed}. p-value permutasi dan eksak tidak "
+                   "bergantung pada asumsi sampel besar sehingga lebih dapat dipercaya untuk n kecil.")
+
+
+def render(st, tampilkan_gambar):
+    from scipy.stats import chi2_contingency
+
+    st.subheader("Hubungan Realisasi TKDD dan IPM")
+
+    data_clean_all = get_dataset("all")
+    if len(data_clean_all) < 3:
+        st.warning("Jumlah provinsi pada filter ini terlalu sedikit untuk uji korelasi dan Chi-Square.")
+        return
+
+    # ========================
+    # Scatter Plot + Pearson
+    st.write("### Scatter Plot: IPM vs Realisasi TKDD")
+
+    corr, pval = stats_cube.cube("all").pearson_test('IPM', 'Realisasi TKDD')
+
+    tampilkan_gambar("ipm_scatter", data_clean_all[['Provinsi', 'IPM', 'Realisasi TKDD']], corr=corr, pval=pval)
+    tampilkan_resampling(st, inference.hasil("ipm_realisasi"))
+    st.markdown("""
+### Penjelasan:
+
+Berdasarkan **scatter plot antara Indeks Pembangunan Manusia (IPM) dan Realisasi TKDD**, terlihat bahwa hubungan keduanya **bersifat lemah dan tidak signifikan secara statistik**.
+
+- Nilai **koefisien korelasi Pearson sebesar 0,17** menunjukkan adanya hubungan positif yang sangat lemah.  
+  Artinya, kenaikan IPM **cenderung diikuti** oleh kenaikan Realisasi TKDD, tetapi hubungan ini **tidak kuat dan tidak konsisten**.
+- Hal ini diperkuat oleh nilai **p-value sebesar 0,3541**, yang **jauh di atas taraf signifikansi 5%**, sehingga tidak cukup bukti untuk menyimpulkan adanya korelasi signifikan.
+
+---
+
+### Interpretasi:
+
+- **Sebaran titik data menyebar** tanpa pola linier yang jelas.
+- Garis regresi memang menunjukkan kecenderungan naik, tetapi **area bayangan merah (confidence interval) yang lebar** menandakan ketidakpastian prediksi yang tinggi.
+- Dengan demikian, **IPM bukan prediktor yang kuat** terhadap besarnya Realisasi TKDD, dan **kemungkinan besar tidak menjadi dasar utama dalam alokasi dana transfer ke daerah**.
+
+
+---
+
+""")
+
+
+    # ========================
+    # Uji Chi-Square
+    st.write("### Uji Chi-Square: Kategori IPM vs Persentase Realisasi TKDD")
+
+    # Kategori IPM sudah berurutan (Sangat Tinggi, Tinggi, Sedang) sejak data dimuat
+    kontingensi = pd.crosstab(data_clean_all['Kategori IPM'], data_clean_all['Kategori Persentase Realisasi TKDD'])
+    kontingensi = kontingensi.loc[kontingensi.sum(axis=1) > 0, kontingensi.sum(axis=0) > 0]
+    if min(kontingensi.shape) < 2:
+        st.dataframe(kontingensi)
+        st.warning("Uji Chi-Square membutuhkan minimal dua kategori IPM dan dua kategori realisasi "
+                   "pada filter wilayah ini.")
+        return
+
+    chi2, p, dof, expected = chi2_contingency(kontingensi)
+
+    st.write("#### Tabel Kontingensi")
+    st.dataframe(kontingensi)
+
+    st.write("#### Hasil Uji Chi-Square")
+    st.markdown(f"""
+    - **Chi-Square Statistic** : `{chi2:.4f}`  
+    - **Degrees of Freedom**   : `{dof}`  
+    - **P-Value**              : `{p:.4f}`
+    """)
+    tampilkan_resampling(st, inference.hasil("kategori_ipm_realisasi"))
+
+    alpha = 0.05
+    if p < alpha:
+        st.success("Keputusan: Tolak H0 → Terdapat hubungan antara Kategori IPM dan Kategori Persentase Realisasi TKDD.")
+    else:
+        st.warning("Keputusan: Gagal tolak H0 → Tidak terdapat hubungan antara Kategori IPM dan Kategori Persentase Realisasi TKDD.")
+    
+    st.markdown("""
+### Penjelasan:
+
+Berdasarkan hasil **analisis tabel kontingensi dan uji Chi-Square**, diperoleh bahwa **tidak terdapat hubungan yang signifikan** antara **kategori Indeks Pembangunan Manusia (IPM)** dan **kategori persentase realisasi TKDD** pada taraf signifikansi 5%.
+
+- Nilai **p-value sebesar 0,4345**, yang **jauh di atas batas 5%**, menunjukkan **gagal menolak H₀**.
+- Artinya, tingkat IPM suatu daerah **tidak berpengaruh signifikan** terhadap besar kecilnya persentase realisasi TKDD yang diterima, baik dalam kategori **90–100%** maupun **lebih dari 100%**.
+
+---
+
+Hal ini menunjukkan bahwa **alokasi dan realisasi dana transfer pusat ke daerah belum mempertimbangkan secara langsung aspek pembangunan manusia**. Kemungkinan besar, terdapat **faktor-faktor lain di luar IPM** yang lebih dominan dalam memengaruhi besar kecilnya **serapan anggaran TKDD** di setiap daerah.
+""")
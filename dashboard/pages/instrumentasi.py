@@ -0,0 +1,108 @@
+"""Halaman tersembunyi: waktu per fase tiap halaman, hit rate cache, dan memori per sesi."""
+import json
+
+import pandas as pd
+
+from dashboard import cachestore, telemetry
+
+REQUIRES = ()
+
+MB = 1024 * 1024
+
+
+def _tabel_fase(data):
+    fase = pd.DataFrame(data["fase"], columns=["halaman", "fase", "jumlah", "wall", "cpu"])
+    halaman = pd.DataFrame(data["halaman"], columns=["halaman", "jumlah", "wall", "cpu", "wall_maks"])
+    # Rata-rata detik per render halaman, dipecah per fase
+    per_render = fase.merge(halaman[["halaman", "jumlah"]], on="halaman", suffixes=("", "_render"))
+    per_render["wall"] /= per_render["jumlah_render"]
+    tabel = per_render.pivot_table(index="halaman", columns="fase", values="wall", aggfunc="sum", fill_value=0.0)
+    tabel = tabel.reindex(columns=[f for f in telemetry.FASE if f in tabel.columns])
+    ringkas = halaman.set_index("halaman")
+    ringkas = pd.DataFrame({
+        "Render": ringkas["jumlah"],
+        "Rata-rata (s)": ringkas["wall"] / ringkas["jumlah"],
+        "CPU rata-rata (s)": ringkas["cpu"] / ringkas["jumlah"],
+        "Terlama (s)": ringkas["wall_maks"],
+    })
+    return ringkas.join(tabel)
+
+
+def _tabel_cache(data):
+    rows = []
+    for name, counts in sorted(data["cache"].items()):
+        total = sum(counts.values())
+        rows.append({
+            "Cache": name,
+            "Hit": counts.get("hit", 0),
+            "Disk": counts.get("disk", 0),
+            "Bersama": counts.get("bersama", 0),
+            "Replika lain": counts.get("replika", 0),
+            "Miss": counts.get("miss", 0),
+            "Hit rate": (total - counts.get("miss", 0)) / total if total else float("nan"),
+        })
+    kolom = ["Cache", "Hit", "Disk", "Bersama", "Replika lain", "Miss", "Hit rate"]
+    return pd.DataFrame(rows, columns=kolom).set_index("Cache")
+
+
+def render(st, tampilkan_gambar):
+    st.subheader("Instrumentasi Server")
+    data = telemetry.snapshot()
+
+    kol1, kol2, kol3 = st.columns(3)
+    kol1.metric("RSS proses", f"{data['rss'] / MB:.0f} MB")
+    kol2.metric("RSS puncak proses", f"{data['rss_puncak'] / MB:.0f} MB")
+    kol3.metric("Sesi tercatat", len(data["sesi"]))
+
+    st.write("### Waktu per halaman dan fase (detik, rata-rata per render)")
+    if data["halaman"]:
+        tabel = _tabel_fase(data)
+        st.dataframe(tabel.style.format("{:.3f}", subset=list(tabel.columns[1:])))
+    else:
+        st.info("Belum ada render halaman yang tercatat.")
+
+    st.write("### Pemanasan")
+    pemanasan = data.get("warmup")
+    if pemanasan is None:
+        st.info("Pemanasan belum dimulai di proses ini (TKDD_WARMUP=0?).")
+    else:
+        keadaan = "siap" if pemanasan["siap"] else ("berjalan" if pemanasan["berjalan"] else "gagal")
+        st.caption(f"Status: {keadaan}, {pemanasan['durasi']:.1f} s")
+        if pemanasan["halaman"]:
+            st.dataframe(pd.DataFrame(pemanasan["halaman"]).rename(columns={
+                "judul": "Halaman", "detik": "Waktu (s)", "galat": "Galat"}).set_index("Halaman"))
+
+    st.write("### Cache")
+    st.dataframe(_tabel_cache(data).style.format({"Hit rate": "{:.0%}"}))
+    rasio = telemetry.rasio_replika(data)
+    store = cachestore.get_store()
+    if rasio is not None and store is not None:
+        st.caption(f"Cache bersama {type(store).__name__}, replika {store.replika}: "
+                   f"{rasio:.0%} akses dilayani entri tulisan replika lain.")
+
+    st.write("### Sesi")
+    sesi = pd.DataFrame.from_dict(data["sesi"], orient="index")
+    if len(sesi):
+        sesi["rss_puncak"] = sesi["rss_puncak"] / MB
+        sesi["terakhir"] = pd.to_datetime(sesi["terakhir"], unit="s")
+        st.dataframe(sesi.rename(columns={"render": "Render", "rss_puncak": "RSS puncak (MB)",
+                                          "terakhir": "Render terakhir"}))
+
+    with st.expander("Render terakhir"):
+        st.dataframe(pd.DataFrame([
+            {"halaman": r["halaman"], "sesi": r["sesi"][:8], "wall": r["wall"], "cpu": r["cpu"],
+             **{f: r["fase"].get(f, {}).get("wall", 0.0) for f in telemetry.FASE}}
+            for r in reversed(data["riwayat"])
+        ]))
+
+    teks = telemetry.prometheus(data)
+    with st.expander("Format Prometheus"):
+        st.code(teks, language="text")
+    kol1, kol2 = st.columns(2)
+    kol1.download_button("Unduh metrik (Prometheus)", teks, file_name="tkdd.prom", mime="text/plain")
+    kol2.download_button("Unduh metrik (JSON)", json.dumps(data, ensure_ascii=False, default=str),
+                         file_name="tkdd-metrics.json", mime="application/json")
+    if telemetry.LOG_PATH:
+        st.caption(f"Log JSON per render ditulis ke {telemetry.LOG_PATH}")
+    else:
+        st.caption("Isi TKDD_METRICS_LOG untuk menulis log JSON per render.")
@@ -0,0 +1,30 @@
+"""Widget filter wilayah di sidebar yang disinkronkan dengan parameter URL.
+
+Nilai awal widget dibaca dari URL (``?pulau=jawa&ipm=tinggi``), dan setiap
+perubahan ditulis kembali ke URL sehingga tampilan yang sudah difilter bisa
+dibagikan atau dibandingkan di tab lain.
+"""
+from dashboard import slices
+
+
+def pilih_irisan(st):
+    awal = slices.Irisan.dari_query(st.query_params.to_dict())
+    pilihan = {}
+    with st.sidebar.expander("Filter Wilayah", expanded=not awal.kosong):
+        for name, facet in slices.FACETS.items():
+            # URL hanya dipakai sebagai nilai awal; default widget tidak diubah antar-rerun
+            # agar identitas widget (dan pilihan pengguna) tetap sama
+            key = f"irisan_{name}"
+            if key not in st.session_state:
+                st.session_state[key] = awal.nilai(name)
+            pilihan[name] = st.multiselect(facet.label, list(facet.values), key=key, placeholder="Semua")
+    irisan = slices.Irisan.dari_pilihan(pilihan)
+
+    query = irisan.query()
+    for name in slices.FACETS:
+        if name in query:
+            if st.query_params.get(name) != query[name]:
+                st.query_params[name] = query[name]
+        elif name in st.query_params:
+            del st.query_params[name]
+    return irisan
@@ -0,0 +1,128 @@
+"""Halaman perbandingan Pagu dan Realisasi TKDD: grouped bar, stacked bar 100%, dan peta."""
+from dashboard import data, hierarchy, slices
+from dashboard.boundaries import BoundaryStoreError
+from dashboard.geometry import boundaries_for, join_provinsi
+from dashboard.pages.wilayah import pilih_tampilan_wilayah
+
+# Dependensi berat yang baru dimuat saat halaman dirender (dengan backend Matplotlib);
+# geopandas/shapely ikut dimuat ketika batas wilayah dibaca
+REQUIRES = ("matplotlib", "seaborn", "geopandas")
+
+
+def render(st, tampilkan_gambar):
+    st.subheader("Perbandingan Pagu dan Realisasi TKDD Antar Provinsi")
+
+    # Data sudah teragregasi, terurut menurut persentase realisasi, dan berisi Pagu/Realisasi (%)
+    dataset, level, tahun, df_sorted = pilih_tampilan_wilayah(st)
+
+    # ========== 1. Clustered Bar Chart ==========
+    tampilkan_gambar("grouped_bar", df_sorted, label_col=level)
+
+    st.markdown("""
+    ### Penjelasan Visualisasi Pagu dan Realisasi TKDD
+
+    Berdasarkan **grouped bar chart** perbandingan antara **Pagu TKDD** dan **Realisasi TKDD** di setiap provinsi di Indonesia tahun **2023**, terlihat bahwa sebagian besar provinsi mampu merealisasikan dana TKDD dengan cukup baik, di mana nilai realisasi mendekati atau bahkan sedikit melampaui pagu yang telah ditetapkan.
+
+    Hal ini mencerminkan **efektivitas penyerapan anggaran** di banyak daerah, terutama di provinsi-provinsi besar seperti:
+    - **Jawa Barat**
+    - **Jawa Timur**
+    - **Jawa Tengah**
+    - **Sumatera Utara**
+
+    yang juga mendapatkan alokasi dana tertinggi.
+
+    Namun demikian, terdapat beberapa provinsi yang menunjukkan **selisih cukup besar** antara pagu dan realisasi, seperti:
+    - **DKI Jakarta**
+    - **Kalimantan Selatan**
+    - Beberapa provinsi baru di **Papua**
+
+    Kondisi ini dapat mengindikasikan adanya kendala dalam serapan anggaran, yang mungkin disebabkan oleh:
+    - Kapasitas kelembagaan yang masih terbatas
+    - Kondisi geografis yang sulit dijangkau
+    - Proses administrasi yang belum optimal
+
+    Di sisi lain, terdapat provinsi yang realisasinya **melebihi pagu**, seperti:
+    - **Aceh**
+    - **Sumatera Selatan**
+
+    yang menunjukkan adanya kemungkinan **penyesuaian atau tambahan anggaran di tengah tahun**.
+
+    **Kesimpulan:**  
+    Besarnya pagu tidak selalu berbanding lurus dengan realisasi. Oleh karena itu, efektivitas penggunaan anggaran tetap menjadi isu penting dalam **pemerataan pembangunan di tingkat daerah**.
+    """)
+
+    # ========== 2. Stacked Bar Chart 100% ==========
+    st.subheader("Perbandingan Pagu dan Realisasi TKDD untuk Setiap Wilayah")
+
+    tampilkan_gambar("stacked_bar", df_sorted, label_col=level)
+
+    st.markdown("""
+    ### Penjelasan Visualisasi Proporsi Pagu dan Realisasi TKDD
+
+    Berdasarkan *stacked bar chart* yang menunjukkan perbandingan persentase Pagu TKDD dan Realisasi TKDD per provinsi tahun 2023, didapatkan gambaran mengenai proporsi serapan anggaran di seluruh provinsi Indonesia.
+
+    Terlihat bahwa sebagian besar provinsi memiliki rasio realisasi terhadap pagu yang cukup seimbang, di mana proporsi realisasi mendekati atau hanya sedikit di bawah alokasi pagu.
+
+    Tidak terdapat perbedaan ekstrem antarprovinsi dalam hal proporsi serapan, yang mengindikasikan bahwa secara umum, pemerintah daerah mampu menyerap dana TKDD secara relatif konsisten di berbagai wilayah.
+
+    Namun demikian, masih terdapat beberapa provinsi yang menunjukkan porsi realisasi sedikit lebih rendah dibandingkan pagu, terutama di beberapa provinsi Papua dan Kalimantan. Hal ini bisa disebabkan oleh keterbatasan kapasitas fiskal, hambatan geografis, atau tantangan dalam implementasi program.
+
+    Sebaliknya, terdapat juga provinsi yang menunjukkan keseimbangan hampir sempurna atau bahkan realisasi yang sedikit lebih tinggi dari pagu. Ini mencerminkan efisiensi pelaksanaan anggaran atau adanya penyesuaian alokasi di tengah tahun.
+
+    **Kesimpulan:**  
+    Meskipun alokasi anggaran bervariasi antarprovinsi, tingkat serapan dana cenderung relatif seragam. Namun, tetap terdapat ruang untuk perbaikan, terutama di wilayah dengan tantangan geografis dan fiskal, guna meningkatkan efektivitas pelaksanaan anggaran secara nasional.
+    """)
+    # ========== 3. Peta Realisasi TKDD ==========  
+    st.subheader(f"Peta Sebaran Persentase Realisasi TKDD per Provinsi ({tahun})")
+
+    # Load batas wilayah dari penyimpanan lokal (GeoParquet, sekali per proses),
+    # dengan tingkat penyederhanaan yang sesuai ukuran peta 14x10 inci
+    try:
+        gdf = boundaries_for(figsize=(14, 10))
+    except BoundaryStoreError as exc:
+        gdf = None
+        st.warning(f"Peta tidak dapat ditampilkan: {exc}")
+
+    if gdf is not None:
+        # Peta selalu memakai agregat tingkat provinsi untuk tahun terpilih
+        merged, hasil = join_provinsi(gdf, hierarchy.panel(dataset, 'Provinsi')[tahun])
+        if hasil.tanpa_peta:
+            st.warning(f"Provinsi di data yang tidak ditemukan di peta: {', '.join(hasil.tanpa_peta)}")
+        # Dengan filter wilayah aktif, provinsi di luar irisan memang tidak punya data
+        if hasil.tanpa_data and data.irisan() is None:
+            st.info(f"Wilayah peta tanpa data tahun {tahun}: {', '.join(hasil.tanpa_data)}")
+
+        # Plot
+        tampilkan_gambar("choropleth", merged, tahun=tahun)
+
+    st.markdown("""
+### Penjelasan Peta Realisasi TKDD
+
+Peta realisasi TKDD tahun 2023 menunjukkan bahwa sebagian besar provinsi di Indonesia mampu merealisasikan anggaran TKDD dengan baik, bahkan beberapa provinsi seperti **Kalimantan Tengah** dan **Kalimantan Selatan** mencatat realisasi di atas 110% dari pagu. Hal ini mencerminkan adanya tambahan kebutuhan atau optimalisasi anggaran di wilayah tersebut.
+
+Sebaliknya, beberapa provinsi di kawasan timur, khususnya **Papua**, memiliki tingkat realisasi yang relatif lebih rendah, meskipun umumnya tetap di atas 95%. **Sulawesi Utara** tidak memiliki data yang tersedia, sehingga tidak dianalisis lebih lanjut.
+
+Secara keseluruhan, peta ini menunjukkan bahwa realisasi TKDD cukup merata, namun masih terdapat variasi antarwilayah yang mencerminkan perbedaan kapasitas fiskal, kebutuhan pembangunan, dan efisiensi pelaksanaan anggaran.
+""")
+
+    # ========== 4. Perbandingan Antarkelompok ==========
+    st.subheader("Perbandingan Antarkelompok Provinsi")
+
+    # Facet pembanding ikut disimpan di URL (?banding=pulau) bersama filter wilayah
+    pilihan = list(slices.FACETS)
+    if "banding" not in st.session_state:
+        awal = st.query_params.get("banding")
+        st.session_state["banding"] = awal if awal in pilihan else pilihan[0]
+    facet = st.selectbox("Kelompokkan menurut", pilihan, key="banding",
+                         format_func=lambda name: slices.FACETS[name].label)
+    if st.query_params.get("banding") != facet:
+        st.query_params["banding"] = facet
+
+    tabel = slices.ringkasan("tkdd", data.get_dataset("tkdd"), data.dataset_version("tkdd"), facet)
+    st.dataframe(tabel.style.format({
+        'Pagu TKDD': '{:,.0f}',
+        'Realisasi TKDD': '{:,.0f}',
+        'Persentase Realisasi TKDD': '{:.2f}%',
+        'Rata-rata IPM': '{:.2f}',
+    }), hide_index=True)
+    tampilkan_gambar("grouped_bar", tabel, label_col='Kelompok')
@@ -0,0 +1,23 @@
+"""Halaman persentase realisasi TKDD per wilayah."""
+from dashboard.pages.wilayah import pilih_tampilan_wilayah
+
+REQUIRES = ("matplotlib", "seaborn")
+
+
+def render(st, tampilkan_gambar):
+    dataset, level, tahun, df_sorted = pilih_tampilan_wilayah(st)
+    st.subheader(f"Persentase Realisasi TKDD per {level} ({tahun})")
+
+    tampilkan_gambar("realisasi_barh", df_sorted, label_col=level, tahun=tahun)
+    st.markdown("""
+### Penjelasan Visualisasi Persentase Realisasi TKDD per Provinsi
+
+Berdasarkan visualisasi persentase realisasi TKDD per provinsi tahun 2023, provinsi dengan tingkat realisasi tertinggi adalah **Kalimantan Timur** yang mencapai **111,0%** dari pagu anggaran. Disusul oleh **Kalimantan Selatan (110,6%)** dan **Kepulauan Riau (109,8%)**. Tingginya tingkat realisasi di provinsi-provinsi ini menunjukkan kemampuan mereka dalam menyerap anggaran secara optimal bahkan melampaui target yang ditetapkan, yang bisa mencerminkan tingginya kebutuhan fiskal atau efisiensi dalam pengelolaan anggaran.
+
+Sementara itu, beberapa provinsi menunjukkan tingkat realisasi yang jauh lebih rendah dibandingkan provinsi lainnya. Provinsi dengan realisasi terendah adalah **Papua** dengan capaian **94,3%**, diikuti oleh **Papua Selatan (94,6%)** dan **Papua Pegunungan (94,7%)**. Tingkat realisasi yang rendah ini dapat mengindikasikan adanya kendala dalam pelaksanaan program, keterbatasan infrastruktur, atau hambatan administratif yang mempengaruhi serapan anggaran di wilayah-wilayah tersebut.
+
+Menariknya, terdapat juga provinsi yang merealisasikan anggarannya tepat **100%** sesuai dengan pagu yang dialokasikan, yaitu **Sumatera Utara**. Pencapaian ini mencerminkan perencanaan dan pelaksanaan anggaran yang presisi dan stabil, tanpa kelebihan maupun kekurangan dana yang signifikan.
+
+**Kesimpulan:**  
+Perbandingan ini menunjukkan bahwa meskipun mayoritas provinsi mampu merealisasikan dana TKDD mendekati atau bahkan melebihi pagu, terdapat variasi antarwilayah yang perlu diperhatikan untuk meningkatkan pemerataan efektivitas serapan anggaran di seluruh Indonesia.
+""")
@@ -0,0 +1,39 @@
+"""Penjelajah pemilihan model untuk halaman regresi.
+
+Semua subset prediktor dan sampel leave-one-out per provinsi sudah
+dihitung sekaligus di ``dashboard.selection``, jadi mengganti kriteria
+atau provinsi yang dikeluarkan hanya memfilter tabel.
+"""
+from dashboard import selection
+
+
+def tampilkan_eksplorasi(st, model):
+    hasil = selection.eksplorasi(model)
+    st.write("### Eksplorasi Pemilihan Model")
+    st.caption(f"{2 ** len(hasil.predictors)} kombinasi prediktor dievaluasi untuk sampel penuh "
+               f"dan untuk setiap sampel tanpa satu provinsi ({len(hasil.provinsi)} provinsi).")
+
+    kol1, kol2, kol3 = st.columns(3)
+    kriteria = kol1.selectbox("Kriteria", list(selection.KRITERIA), key=f"kriteria_{model}")
+    top = kol2.slider("Jumlah model", 5, 30, 10, key=f"top_{model}")
+    tanpa = kol3.selectbox("Keluarkan provinsi", ["(tidak ada)", *sorted(hasil.provinsi)], key=f"tanpa_{model}")
+    tanpa = None if tanpa == "(tidak ada)" else tanpa
+
+    peringkat = hasil.peringkat(kriteria, top, tanpa)
+    st.dataframe(peringkat.style.format({'R²': '{:.4f}', 'R² adj': '{:.4f}', 'AIC': '{:.2f}', 'BIC': '{:.2f}'}),
+                 hide_index=True)
+
+    terbaik = int(peringkat.index[0])
+    st.write("#### Koefisien model terbaik" + (f" (tanpa {tanpa})" if tanpa else ""))
+    st.dataframe(hasil.koefisien(terbaik, tanpa).to_frame('Koefisien').style.format('{:.4f}'))
+
+    st.write("#### Stabilitas leave-one-out")
+    st.caption(f"Proporsi sampel tanpa satu provinsi yang model terbaiknya (menurut {kriteria}) memuat prediktor.")
+    st.dataframe(hasil.frekuensi_prediktor(kriteria).to_frame().style.format('{:.0%}'))
+    stabilitas = hasil.stabilitas(kriteria)
+    berubah = stabilitas[~stabilitas['Sama dengan sampel penuh']]
+    if berubah.empty:
+        st.success("Model terbaik tidak berubah ketika provinsi mana pun dikeluarkan.")
+    else:
+        st.info(f"Model terbaik berubah ketika {len(berubah)} provinsi dikeluarkan:")
+        st.dataframe(berubah[['Model terbaik', 'k']])
@@ -0,0 +1,33 @@
+"""Pilihan tingkat wilayah, tahun, dan drill-down untuk halaman TKDD.
+
+Agregasi per tahun sudah dihitung sekali di ``dashboard.hierarchy``; jika
+jumlah wilayah terlalu banyak, grafik menampilkan N teratas/terbawah
+ditambah satu batang "Lainnya".
+"""
+from dashboard import hierarchy
+from dashboard.data import is_available
+
+
+def pilih_tampilan_wilayah(st):
+    dataset, level = "tkdd", "Provinsi"
+    if is_available("tkdd_kabkota"):
+        level = st.sidebar.selectbox("Tingkat Wilayah", list(hierarchy.LEVELS))
+        if level == hierarchy.KOLOM_KABKOTA:
+            dataset = "tkdd_kabkota"
+
+    panel = hierarchy.panel(dataset, level)
+    tahun_tersedia = sorted(panel)
+    tahun = tahun_tersedia[-1]
+    if len(tahun_tersedia) > 1:
+        tahun = st.sidebar.selectbox("Tahun", tahun_tersedia, index=len(tahun_tersedia) - 1)
+    df_sorted = panel[tahun]
+
+    if level == hierarchy.KOLOM_KABKOTA:
+        provinsi = st.sidebar.selectbox("Drill-down Provinsi", ["Semua Provinsi"] + sorted(df_sorted['Provinsi'].unique()))
+        if provinsi != "Semua Provinsi":
+            df_sorted = hierarchy.drill_down(df_sorted, provinsi)
+
+    if len(df_sorted) > hierarchy.MAX_BARS:
+        n = st.sidebar.slider("Tampilkan N wilayah teratas dan terbawah", 5, hierarchy.MAX_BARS // 2, 10)
+        df_sorted = hierarchy.top_bottom(df_sorted, n, level)
+    return dataset, level, tahun, df_sorted
@@ -0,0 +1,200 @@
+"""Mesin small multiples untuk grid scatter plot variabel vs target.
+
+Masukannya frame format panjang (satu baris per provinsi x variabel).
+Batas sumbu setiap panel dihitung sekali dengan ``groupby``, semua sumbu
+dibuat dalam satu panggilan ``subplots``, dan titik setiap panel
+ditambahkan langsung sebagai satu ``PathCollection`` tanpa lapisan
+seaborn. Garis regresi OLS dan kurva LOWESS opsional dihitung untuk semua
+panel sekaligus dengan operasi array, sehingga grid 30+ panel tetap murah.
+"""
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.figure import Figure
+from matplotlib.markers import MarkerStyle
+from matplotlib.transforms import IdentityTransform
+
+VAR_COL = 'Variabel'
+VALUE_COL = 'Nilai'
+
+# Ukuran panel sama dengan grid 3x3 lama berukuran 20x20 inci
+PANEL_SIZE = (20 / 3, 20 / 3)
+
+# Margin dan jarak antarpanel dalam inci. Tetap, bukan tight_layout, karena
+# tata letak otomatis mengukur teks setiap sumbu dan mendominasi waktu gambar
+MARGIN_INCI = {"left": 1.0, "right": 0.25, "top": 0.45, "bottom": 0.7}
+JARAK_INCI = (1.0, 1.0)
+
+# Jumlah elemen maksimum array bobot LOWESS per blok titik evaluasi (~32 MB float64)
+BLOK_ELEMEN = 1 << 22
+
+# Pilihan garis tren untuk widget di halaman
+GARIS_TREN = {
+    "Tanpa garis": None,
+    "Regresi linier (OLS)": "ols",
+    "LOWESS": "lowess",
+}
+
+
+def melt(data, variabels, target):
+    """Frame panjang ``[target, Variabel, Nilai]`` dari frame lebar."""
+    return data[[target, *variabels]].melt(id_vars=[target], var_name=VAR_COL, value_name=VALUE_COL)
+
+
+def _codes(long, order):
+    codes = pd.Categorical(long[VAR_COL], categories=order).codes
+    x = long[VALUE_COL].to_numpy(dtype='float64')
+    return codes, x
+
+
+def panel_limits(long, target, order, margin=0.05):
+    """Array ``(n_panel, 4)`` berisi xmin, xmax, ymin, ymax tiap panel dengan margin."""
+    stats = long.groupby(VAR_COL, observed=True, sort=False)[VALUE_COL].agg(['min', 'max']).reindex(order)
+    xmin, xmax = stats['min'].to_numpy(dtype='float64'), stats['max'].to_numpy(dtype='float64')
+    y = long[target].to_numpy(dtype='float64')
+    ymin, ymax = np.nanmin(y), np.nanmax(y)
+
+    # Rentang nol (semua nilai sama) tetap diberi lebar agar titik terlihat
+    dx = np.where(xmax > xmin, xmax - xmin, np.maximum(np.abs(xmax), 1.0))
+    dy = ymax - ymin if ymax > ymin else max(abs(ymax), 1.0)
+    return np.column_stack([
+        xmin - margin * dx, xmax + margin * dx,
+        np.full_like(xmin, ymin - margin * dy), np.full_like(xmin, ymax + margin * dy),
+    ])
+
+
+def ols_lines(codes, x, y, limits):
+    """Segmen garis OLS tiap panel pada rentang sumbu x, bentuk ``(n_panel, 2, 2)``."""
+    n_panel = len(limits)
+    ok = (codes >= 0) & ~np.isnan(x) & ~np.isnan(y)
+    c, x, y = codes[ok], x[ok], y[ok]
+    n = np.bincount(c, minlength=n_panel)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mx = np.bincount(c, x, n_panel) / n
+        my = np.bincount(c, y, n_panel) / n
+        sxy = np.bincount(c, (x - mx[c]) * (y - my[c]), n_panel)
+        sxx = np.bincount(c, (x - mx[c]) ** 2, n_panel)
+        slope = sxy / sxx
+    intercept = my - slope * mx
+    xs = limits[:, :2]
+    ys = intercept[:, None] + slope[:, None] * xs
+    return np.stack([xs, ys], axis=-1)
+
+
+def lowess_curves(codes, x, y, limits, frac=2 / 3):
+    """Kurva LOWESS (regresi linier lokal berbobot tricube, satu iterasi) untuk semua panel.
+
+    Data setiap panel ditempatkan pada array ``(n_panel, n_max)`` bermasker
+    sehingga bobot dan regresi lokal dihitung dengan broadcasting, per blok
+    titik evaluasi agar memori tetap O(n_panel x blok x n_max). Hasil
+    berbentuk ``(n_panel, n_max, 2)``.
+    """
+    n_panel = len(limits)
+    ok = (codes >= 0) & ~np.isnan(x) & ~np.isnan(y)
+    c, x, y = codes[ok], x[ok], y[ok]
+    n = np.bincount(c, minlength=n_panel)
+    n_max = max(int(n.max(initial=0)), 1)
+
+    # Susun ulang per panel: posisi setiap titik di dalam panelnya
+    urut = np.argsort(c, kind='stable')
+    c, x, y = c[urut], x[urut], y[urut]
+    pos = np.arange(len(c)) - np.repeat(np.cumsum(n) - n, n)
+    X = np.full((n_panel, n_max), np.nan)
+    Y = np.full((n_panel, n_max), np.nan)
+    X[c, pos], Y[c, pos] = x, y
+    valid = ~np.isnan(X)
+
+    # Kurva dievaluasi di nilai x data (terurut) seperti statsmodels, sehingga
+    # tidak ada ekstrapolasi liar di celah data; sisa padding memakai x terakhir
+    grid = np.sort(X, axis=1)                                                # (P, N)
+    terakhir = grid[np.arange(n_panel), np.maximum(n - 1, 0)]
+    grid = np.where(np.isnan(grid), terakhir[:, None], grid)
+    # Lebar jendela: jarak ke tetangga ke-k, k = floor(frac * n) seperti statsmodels
+    k = np.clip(np.floor(frac * n + 1e-10).astype(int), 2, n_max) - 1
+    Xv, Yv = np.where(valid, X, 0.0)[:, None, :], np.where(valid, Y, 0.0)[:, None, :]
+    fitted = np.empty_like(grid)
+    # Titik evaluasi diproses per blok agar array bobot (P, blok, N) tetap
+    # sekitar BLOK_ELEMEN elemen, bukan (P, N, N) untuk grid besar
+    blok = max(BLOK_ELEMEN // (n_panel * n_max), 1)
+    for mulai in range(0, n_max, blok):
+        g = grid[:, mulai:mulai + blok]
+        dist = np.abs(X[:, None, :] - g[:, :, None])                         # (P, blok, N)
+        dist = np.where(valid[:, None, :], dist, np.inf)
+        h = np.take_along_axis(np.sort(dist, axis=-1), k[:, None, None], axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w = np.clip(1 - (dist / h) ** 3, 0, None) ** 3
+            w = np.where(valid[:, None, :], w, 0.0)
+            sw = w.sum(-1)
+            mx = (w * Xv).sum(-1) / sw
+            my = (w * Yv).sum(-1) / sw
+            sxx = (w * (Xv - mx[..., None]) ** 2).sum(-1)
+            sxy = (w * (Xv - mx[..., None]) * (Yv - my[..., None])).sum(-1)
+            slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        fitted[:, mulai:mulai + blok] = my + slope * (g - mx)
+    fitted[n < 3] = np.nan
+    return np.stack([grid, fitted], axis=-1)
+
+
+def _gridspec(ncols, nrows, panel_size):
+    width, height = panel_size[0] * ncols, panel_size[1] * nrows
+    left, right = MARGIN_INCI["left"] / width, 1 - MARGIN_INCI["right"] / width
+    bottom, top = MARGIN_INCI["bottom"] / height, 1 - MARGIN_INCI["top"] / height
+    ax_w = (width - MARGIN_INCI["left"] - MARGIN_INCI["right"] - (ncols - 1) * JARAK_INCI[0]) / ncols
+    ax_h = (height - MARGIN_INCI["top"] - MARGIN_INCI["bottom"] - (nrows - 1) * JARAK_INCI[1]) / nrows
+    return {"left": left, "right": right, "bottom": bottom, "top": top,
+            "wspace": JARAK_INCI[0] / ax_w, "hspace": JARAK_INCI[1] / ax_h}
+
+
+def scatter_panels(long, target, order=None, ncols=3, fit=None, panel_size=PANEL_SIZE,
+                   color='C0', fit_color='red', markersize=None):
+    """Satu ``Figure`` berisi scatter plot ``Nilai`` vs ``target`` untuk setiap ``Variabel``.
+
+    ``fit`` bisa ``None``, ``'ols'``, atau ``'lowess'``. Panel kosong pada
+    baris terakhir dihapus.
+    """
+    import matplotlib
+
+    order = list(order) if order is not None else list(pd.unique(long[VAR_COL]))
+    n_panel = len(order)
+    nrows = -(-n_panel // ncols)
+    codes, x = _codes(long, order)
+    y = long[target].to_numpy(dtype='float64')
+    limits = panel_limits(long, target, order)
+
+    fig = Figure(figsize=(panel_size[0] * ncols, panel_size[1] * nrows))
+    axes = fig.subplots(nrows, ncols, squeeze=False, gridspec_kw=_gridspec(ncols, nrows, panel_size)).ravel()
+    for ax in axes[n_panel:]:
+        fig.delaxes(ax)
+
+    markersize = markersize or matplotlib.rcParams['lines.markersize']
+    marker = MarkerStyle('o').get_path().transformed(MarkerStyle('o').get_transform())
+    urut = np.argsort(codes, kind='stable')
+    batas = np.searchsorted(codes[urut], np.arange(n_panel + 1))
+    xy = np.column_stack([x, y])[urut]
+
+    for i, ax in enumerate(axes[:n_panel]):
+        titik = xy[batas[i]:batas[i + 1]]
+        titik = PathCollection(
+            [marker], sizes=[markersize ** 2], offsets=titik, offset_transform=ax.transData,
+            facecolors=color, edgecolors='white', linewidths=0.08 * markersize, zorder=2,
+        )
+        # Ukuran penanda dalam poin layar, seperti Axes.scatter
+        titik.set_transform(IdentityTransform())
+        ax.add_collection(titik, autolim=False)
+        ax.set_xlim(limits[i, 0], limits[i, 1])
+        ax.set_ylim(limits[i, 2], limits[i, 3])
+        ax.set_title(f'{order[i]} vs {target}')
+        ax.set_xlabel(order[i])
+        ax.set_ylabel(target)
+
+    if fit is not None:
+        if fit == 'ols':
+            lines = ols_lines(codes, x, y, limits)
+        elif fit == 'lowess':
+            lines = lowess_curves(codes, x, y, limits)
+        else:
+            raise ValueError(f"fit harus None, 'ols', atau 'lowess', bukan {fit!r}")
+        for i, ax in enumerate(axes[:n_panel]):
+            ax.add_collection(LineCollection([lines[i]], colors=fit_color, linewidths=1.5, zorder=3), autolim=False)
+
+    return fig
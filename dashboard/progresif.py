@@ -0,0 +1,68 @@
+"""Render halaman bertahap: teks dan tabel tampil dulu, grafik menyusul.
+
+Dalam mode ini ``tampilkan_gambar`` tidak menunggu grafik selesai. Grafik
+yang dirender di server (PNG Matplotlib) mendapat placeholder ``st.empty()``
+di posisinya dan dirender di thread pool pekerja, sementara skrip halaman
+berlanjut sehingga markdown dan tabel di bawahnya langsung terkirim ke
+browser. Setelah skrip halaman selesai, ``selesaikan`` mengisi placeholder
+menurut urutan grafik yang selesai lebih dulu.
+
+Pekerja hanya menghasilkan byte gambar lewat cache gambar dan tidak
+memanggil ``st``; semua perintah Streamlit tetap di thread skrip. Konteks
+(irisan data, render halaman untuk telemetri) disalin ke setiap tugas.
+Grafik Vega-Lite dirender browser sehingga tetap ditampilkan langsung.
+"""
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from dashboard import telemetry
+from dashboard.backends import BACKENDS, get_backend
+
+DEFAULT_WORKERS = int(os.environ.get("TKDD_FIGURE_WORKERS", "4"))
+
+# Nilai awal toggle di sidebar
+AKTIF = os.environ.get("TKDD_PROGRESSIVE", "1") != "0"
+
+_pool = None
+_lock = threading.Lock()
+
+
+def _executor():
+    # Satu pool untuk semua sesi di proses ini
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix="grafik")
+        return _pool
+
+
+class RenderBertahap:
+    """Antrian grafik satu rerun halaman."""
+
+    def __init__(self, st, backend=None):
+        self.st = st
+        self.backend = get_backend(backend)
+        # future -> placeholder
+        self._tugas = {}
+
+    def tampilkan(self, chart, data, **params):
+        """Pengganti ``tampilkan_gambar``: pasang placeholder dan jadwalkan render grafik."""
+        if not self.backend.renders_on_server(chart):
+            self.backend.show(self.st, chart, data, **params)
+            return
+        slot = self.st.empty()
+        slot.caption("Memuat grafik...")
+        # Satu salinan konteks per tugas: konteks yang sama tidak boleh dimasuki dua thread sekaligus
+        konteks = contextvars.copy_context()
+        future = _executor().submit(konteks.run, BACKENDS["matplotlib"].render, chart, data, **params)
+        self._tugas[future] = slot
+
+    def selesaikan(self):
+        """Isi placeholder menurut urutan grafik selesai; galat render diteruskan ke skrip."""
+        tugas, self._tugas = self._tugas, {}
+        for future in as_completed(tugas):
+            image = future.result()
+            with telemetry.fase("serialize"):
+                tugas[future].image(image, use_column_width=True)
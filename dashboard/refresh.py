@@ -0,0 +1,281 @@
+"""Pembaruan data inkremental tanpa restart.
+
+Berkas sumber dataset yang sudah dimuat dipantau lewat polling ukuran dan
+mtime (tanpa layanan eksternal, jadi tetap jalan offline). Berkas baru
+juga bisa ditaruh di folder ``Data/masuk``: berkas yang namanya sama
+dengan sumber dataset divalidasi dulu, lalu menggantikan sumbernya.
+Dengan ``TKDD_ETL=1``, workbook mentah yang berubah dibersihkan oleh
+``dashboard.etl`` dan CSV hasilnya dikirim ke folder itu juga.
+
+Saat sumber berubah, baris lama dan baru dibandingkan lewat hash per
+baris berdasarkan kolom kunci (misalnya Provinsi). Hanya bagian yang
+terdampak yang dihitung ulang:
+
+* kolom turunan hanya untuk baris yang berubah;
+* entri matriks korelasi hanya untuk kolom yang berubah;
+* model regresi dan eksplorasi subsetnya hanya bila target/prediktornya berubah;
+* hasil resampling dibuang hanya bila kolom ujinya berubah;
+* panel agregat hanya untuk tahun yang berubah.
+
+Gambar di cache dikunci dengan isi datanya sehingga grafik yang datanya
+tidak berubah tetap diambil dari cache. Versi dataset naik dan sesi yang
+terbuka menerimanya lewat ``check()`` yang dipanggil berkala dari app.py.
+
+Memantau dari terminal::
+
+    python -m dashboard.refresh --watch
+"""
+import argparse
+import dataclasses
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import data, etl, ingest
+from dashboard.config import DATA_DIR
+
+POLL_SECONDS = float(os.environ.get("TKDD_REFRESH_SECONDS", "30"))
+
+DROP_DIR = DATA_DIR / "masuk"
+
+_generation = 0
+_last_poll = 0.0
+_errors = {}
+_failed = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Perubahan:
+    dataset: str
+    old_version: str
+    new_version: str
+    key_columns: Tuple[str, ...]
+    added: Tuple[tuple, ...]
+    removed: Tuple[tuple, ...]
+    changed: Tuple[tuple, ...]
+    # Kolom yang nilainya berbeda pada baris yang ada di kedua versi
+    columns: Tuple[str, ...]
+
+    @property
+    def rows_same(self):
+        return not self.added and not self.removed
+
+    def key_values(self, column):
+        """Nilai kolom kunci ``column`` dari semua baris yang berubah, ditambah, atau dihapus."""
+        i = self.key_columns.index(column)
+        return {key[i] for key in (*self.added, *self.removed, *self.changed)}
+
+    def ringkasan(self):
+        return (f"{self.dataset}: {len(self.changed)} baris berubah, {len(self.added)} ditambah, "
+                f"{len(self.removed)} dihapus; kolom {list(self.columns)}")
+
+
+def _as_tuples(index):
+    return tuple(key if isinstance(key, tuple) else (key,) for key in index)
+
+
+def _row_hashes(df):
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def row_diff(old, new, key_columns):
+    """Tuple ``(added, removed, changed, columns)`` antara dua versi berdasarkan hash per baris."""
+    key_columns = list(key_columns)
+    o, n = old.set_index(key_columns), new.set_index(key_columns)
+    if list(o.columns) != list(n.columns):
+        o, n = o.reindex(columns=n.columns), n
+        columns = tuple(n.columns)
+    else:
+        columns = None
+    old_hash = pd.Series(_row_hashes(o), index=o.index)
+    new_hash = pd.Series(_row_hashes(n), index=n.index)
+
+    common = n.index.intersection(o.index)
+    changed = common[old_hash[common].to_numpy() != new_hash[common].to_numpy()]
+    if columns is None:
+        a, b = o.loc[changed], n.loc[changed]
+        columns = tuple(col for col in n.columns if not (a[col].eq(b[col]) | (a[col].isna() & b[col].isna())).all())
+    return (
+        _as_tuples(n.index.difference(o.index)),
+        _as_tuples(o.index.difference(n.index)),
+        _as_tuples(changed),
+        columns,
+    )
+
+
+def _derive(schema, old, base, key_columns):
+    """Frame turunan untuk ``base``; kolom turunan hanya dihitung untuk baris yang berubah bila bisa."""
+    if schema.derive is None:
+        return base
+    same_rows = len(old) == len(base) and all(
+        np.array_equal(old[col].to_numpy(), base[col].to_numpy()) for col in key_columns
+    )
+    if not same_rows:
+        return schema.derive(base)
+
+    # Urutan baris sama: bandingkan hash baris per posisi, turunkan ulang baris yang berbeda saja
+    pos = np.flatnonzero(_row_hashes(old[list(base.columns)]) != _row_hashes(base))
+    patch = schema.derive(base.iloc[pos])
+    extra = {}
+    for col in old.columns.difference(base.columns, sort=False):
+        values = old[col].to_numpy(copy=True)
+        values[pos] = patch[col].to_numpy()
+        extra[col] = values
+    return base.assign(**extra)
+
+
+def apply(name):
+    """Muat ulang dataset ``name`` secara inkremental; ``Perubahan`` atau None bila isinya sama."""
+    schema = data.DATASETS[name]
+    old = data.loaded().get(name)
+    if old is None:
+        return None
+    stamp = ingest.source_stamp(schema.path)
+    base = ingest.load(schema)
+    key_columns = [data.KOLOM[k].label for k in schema.keys]
+
+    new = _derive(schema, old, base, key_columns)
+    added, removed, changed, columns = row_diff(old, new, key_columns)
+    old_version = data.dataset_version(name)
+    new_version = data.install(name, new, stamp)
+    if not (added or removed or changed):
+        return None
+
+    change = Perubahan(
+        dataset=name,
+        old_version=old_version,
+        new_version=new_version,
+        key_columns=tuple(key_columns),
+        added=added,
+        removed=removed,
+        changed=changed,
+        columns=columns if not (added or removed) else tuple(new.columns),
+    )
+    _carry_over(change, new)
+    return change
+
+
+def _carry_over(change, df):
+    # Modul turunan diimpor di sini agar refresh tidak memaksa memuat semuanya di awal
+    from dashboard import hierarchy, inference, models, selection, stats
+
+    hierarchy.carry_over(change, df)
+    stats.carry_over(change, df)
+    models.carry_over(change)
+    selection.carry_over(change)
+    inference.carry_over(change)
+
+
+def ambil_drop():
+    """Validasi berkas di ``Data/masuk`` lalu pindahkan ke lokasi sumbernya; kembalikan nama dataset."""
+    if not DROP_DIR.is_dir():
+        return []
+    sources = {schema.path.name: schema for schema in data.DATASETS.values()}
+    diterima = []
+    for path in sorted(DROP_DIR.iterdir()):
+        schema = sources.get(path.name)
+        if schema is None:
+            continue
+        calon = dataclasses.replace(schema, path=path)
+        try:
+            ingest.validate(ingest.read_source(calon), calon)
+        except (ingest.SchemaError, OSError, ValueError) as exc:
+            _errors[schema.name] = str(exc)
+            path.replace(path.with_name(path.name + ".ditolak"))
+            continue
+        path.replace(schema.path)
+        diterima.append(schema.name)
+    return diterima
+
+
+def poll():
+    """Satu putaran pemantauan; kembalikan daftar ``Perubahan`` yang diterapkan."""
+    with _lock:
+        return _poll()
+
+
+def _poll():
+    # Dipanggil dengan _lock sudah dipegang
+    global _generation, _last_poll
+
+    _last_poll = time.monotonic()
+    ambil_drop()
+    try:
+        # Hasil ETL (bila TKDD_ETL=1) dikirim ke folder masuk dan diambil di putaran yang sama
+        if etl.perbarui(DROP_DIR) is not None:
+            _errors.pop("mentah", None)
+            ambil_drop()
+    except ingest.SchemaError as exc:
+        _errors["mentah"] = str(exc)
+    changes = []
+    for name in data.loaded():
+        path = data.DATASETS[name].path
+        try:
+            stamp = ingest.source_stamp(path)
+        except OSError:
+            continue
+        if stamp == data.source_stamp(name) or stamp == _failed.get(name):
+            continue
+        try:
+            change = apply(name)
+        except ingest.SchemaError as exc:
+            # Versi lama tetap dipakai sampai sumbernya diperbaiki
+            _errors[name] = str(exc)
+            _failed[name] = stamp
+            continue
+        _errors.pop(name, None)
+        _failed.pop(name, None)
+        if change is not None:
+            changes.append(change)
+    if changes:
+        _generation += 1
+    return changes
+
+
+def check():
+    """Nomor generasi data saat ini; sumber dipantau paling sering sekali per ``POLL_SECONDS``."""
+    if time.monotonic() - _last_poll < POLL_SECONDS:
+        return _generation
+    # Sesi lain sedang memantau: pakai generasi yang ada tanpa menunggu
+    if not _lock.acquire(blocking=False):
+        return _generation
+    try:
+        if time.monotonic() - _last_poll >= POLL_SECONDS:
+            _poll()
+    finally:
+        _lock.release()
+    return _generation
+
+
+def errors():
+    """Dict ``{dataset: pesan}`` sumber yang ditolak pada pemantauan terakhir."""
+    return dict(_errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pantau sumber dataset TKDD dan terapkan perubahan secara inkremental.")
+    parser.add_argument("--watch", action="store_true", help="terus memantau (default: satu putaran)")
+    parser.add_argument("--interval", type=float, default=POLL_SECONDS)
+    args = parser.parse_args(argv)
+
+    for name in data.DATASETS:
+        if data.is_available(name):
+            data.get_dataset(name)
+    while True:
+        for change in poll():
+            print(change.ringkasan())
+        for name, pesan in errors().items():
+            print(f"DITOLAK {name}: {pesan}")
+        if not args.watch:
+            return 0
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Indeks kunci wilayah: nama provinsi dan kabupaten/kota -> kode BPS.
+
+Nama wilayah di data TKDD, IPM, dan GeoJSON ditulis dengan ejaan yang
+berbeda-beda ("DI YOGYAKARTA", "Kep. Riau", "PROVINSI ACEH"). Setiap nama
+dinormalisasi, dicocokkan dengan daftar kode provinsi BPS dan aliasnya,
+dan bila tidak ada yang sama persis, dicocokkan secara fuzzy dengan
+``difflib``. Hasilnya di-memo, jadi setiap nama unik hanya dicocokkan
+sekali per proses; kolom ribuan baris cukup di-``factorize`` lalu
+dipetakan lewat array nama unik.
+
+Kode kabupaten/kota resmi BPS (empat digit) tidak dibundel. Sebagai
+gantinya kode diturunkan secara stabil dari kode provinsi dan CRC32 nama
+yang dinormalisasi, sehingga tetap sama antarmuat dan antartahun.
+
+Nama yang tidak cocok dilaporkan dengan ``RegionKeyWarning``::
+
+    python -m dashboard.regions "Kep. Riau" "Sulawesi Utra" "Atlantis"
+"""
+import argparse
+import difflib
+import re
+import threading
+import unicodedata
+import warnings
+import zlib
+
+import numpy as np
+import pandas as pd
+
+KODE_PROVINSI = 'Kode Provinsi'
+KODE_KABKOTA = 'Kode Kabupaten/Kota'
+
+# Kode provinsi BPS (Permendagri 2022, 38 provinsi)
+PROVINSI = {
+    11: "ACEH",
+    12: "SUMATERA UTARA",
+    13: "SUMATERA BARAT",
+    14: "RIAU",
+    15: "JAMBI",
+    16: "SUMATERA SELATAN",
+    17: "BENGKULU",
+    18: "LAMPUNG",
+    19: "KEPULAUAN BANGKA BELITUNG",
+    21: "KEPULAUAN RIAU",
+    31: "DKI JAKARTA",
+    32: "JAWA BARAT",
+    33: "JAWA TENGAH",
+    34: "DAERAH ISTIMEWA YOGYAKARTA",
+    35: "JAWA TIMUR",
+    36: "BANTEN",
+    51: "BALI",
+    52: "NUSA TENGGARA BARAT",
+    53: "NUSA TENGGARA TIMUR",
+    61: "KALIMANTAN BARAT",
+    62: "KALIMANTAN TENGAH",
+    63: "KALIMANTAN SELATAN",
+    64: "KALIMANTAN TIMUR",
+    65: "KALIMANTAN UTARA",
+    71: "SULAWESI UTARA",
+    72: "SULAWESI TENGAH",
+    73: "SULAWESI SELATAN",
+    74: "SULAWESI TENGGARA",
+    75: "GORONTALO",
+    76: "SULAWESI BARAT",
+    81: "MALUKU",
+    82: "MALUKU UTARA",
+    91: "PAPUA BARAT",
+    92: "PAPUA BARAT DAYA",
+    94: "PAPUA",
+    95: "PAPUA SELATAN",
+    96: "PAPUA TENGAH",
+    97: "PAPUA PEGUNUNGAN",
+}
+
+# Ejaan lain (setelah normalisasi) yang ditemui di sumber data
+ALIAS = {
+    "DI YOGYAKARTA": 34,
+    "D I YOGYAKARTA": 34,
+    "DIY": 34,
+    "YOGYAKARTA": 34,
+    "NANGGROE ACEH DARUSSALAM": 11,
+    "NAD": 11,
+    "DAERAH KHUSUS IBUKOTA JAKARTA": 31,
+    "DKI": 31,
+    "JAKARTA": 31,
+    "BANGKA BELITUNG": 19,
+    "BABEL": 19,
+    "KEPRI": 21,
+    "SUMUT": 12,
+    "SUMBAR": 13,
+    "SUMSEL": 16,
+    "JABAR": 32,
+    "JATENG": 33,
+    "JATIM": 35,
+    "NTB": 52,
+    "NTT": 53,
+    "KALBAR": 61,
+    "KALTENG": 62,
+    "KALSEL": 63,
+    "KALTIM": 64,
+    "KALTARA": 65,
+    "SULUT": 71,
+    "SULTENG": 72,
+    "SULSEL": 73,
+    "SULTRA": 74,
+    "SULBAR": 76,
+    "MALUT": 82,
+    "IRIAN JAYA BARAT": 91,
+    "IRIAN JAYA": 94,
+}
+
+# Singkatan yang diperluas per kata saat normalisasi
+SINGKATAN = {
+    "KEP": "KEPULAUAN",
+    "KAB": "KABUPATEN",
+    "KOT": "KOTA",
+    "PROP": "PROVINSI",
+    "PROV": "PROVINSI",
+}
+
+# Kemiripan minimum (rasio difflib) untuk pencocokan fuzzy
+CUTOFF = 0.85
+
+TIDAK_COCOK = -1
+
+
+class RegionKeyWarning(UserWarning):
+    """Nama wilayah yang tidak dapat dipetakan ke kode BPS."""
+
+
+def normalize(name):
+    """Nama dalam huruf besar ASCII tanpa tanda baca, singkatan diperluas, tanpa awalan "PROVINSI"."""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    tokens = [SINGKATAN.get(token, token) for token in re.sub(r"[^A-Z0-9]+", " ", text.upper()).split()]
+    if len(tokens) > 1 and tokens[0] == "PROVINSI":
+        tokens = tokens[1:]
+    return " ".join(tokens)
+
+
+def kode_kabkota(kode_provinsi, nama):
+    """Kode kabupaten/kota turunan: ``kode provinsi * 10^10 + CRC32(nama ternormalisasi)``."""
+    return int(kode_provinsi) * 10 ** 10 + zlib.crc32(normalize(nama).encode())
+
+
+class RegionIndex:
+    """Pemetaan nama -> kode BPS yang dibangun sekali dan di-memo per nama unik."""
+
+    def __init__(self, provinsi=PROVINSI, alias=ALIAS, cutoff=CUTOFF):
+        self.nama = dict(provinsi)
+        self._kunci = {normalize(name): kode for kode, name in provinsi.items()}
+        for name, kode in alias.items():
+            self._kunci.setdefault(normalize(name), kode)
+        self._pilihan = list(self._kunci)
+        self.cutoff = cutoff
+        self._memo = {}
+        # Nama yang cocok lewat fuzzy ({nama: nama baku}) dan yang tidak cocok ({nama: sumber})
+        self.fuzzy = {}
+        self.tidak_cocok = {}
+        self._lock = threading.Lock()
+
+    def _cari(self, name):
+        key = normalize(name)
+        kode = self._kunci.get(key)
+        if kode is not None:
+            return kode, False
+        mirip = difflib.get_close_matches(key, self._pilihan, n=1, cutoff=self.cutoff)
+        if mirip:
+            return self._kunci[mirip[0]], True
+        return TIDAK_COCOK, False
+
+    def kode(self, name):
+        """Kode provinsi BPS untuk satu nama, ``TIDAK_COCOK`` (-1) bila tidak ada yang mirip."""
+        with self._lock:
+            kode = self._memo.get(name)
+        if kode is None:
+            kode, fuzzy = self._cari(name)
+            with self._lock:
+                self._memo[name] = kode
+                if fuzzy:
+                    self.fuzzy[name] = self.nama[kode]
+        return kode
+
+    def encode(self, values, sumber="data"):
+        """Array kode ``int64`` untuk kolom nama provinsi; nama yang tidak cocok diperingatkan.
+
+        Setiap nama unik hanya dicocokkan sekali (``factorize``), lalu kodenya
+        disebarkan ke semua baris dengan pengindeksan array.
+        """
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+        kode_unik = np.fromiter((self.kode(name) for name in uniques), dtype='int64', count=len(uniques))
+        hasil = np.append(kode_unik, TIDAK_COCOK)[codes]
+        gagal = [name for name, kode in zip(uniques, kode_unik) if kode == TIDAK_COCOK]
+        if gagal:
+            with self._lock:
+                self.tidak_cocok.update(dict.fromkeys(gagal, sumber))
+            warnings.warn(
+                f"{len(gagal)} nama wilayah di {sumber} tidak cocok dengan kode BPS: {', '.join(map(str, gagal))}",
+                RegionKeyWarning, stacklevel=2,
+            )
+        return hasil
+
+    def encode_kabkota(self, kode_provinsi, values):
+        """Array kode kabupaten/kota turunan; nama unik per provinsi di-hash sekali."""
+        pasangan = pd.MultiIndex.from_arrays([np.asarray(kode_provinsi), pd.Series(values, dtype=object)])
+        codes, uniques = pasangan.factorize()
+        kode_unik = np.array([kode_kabkota(prov, nama) for prov, nama in uniques], dtype='int64')
+        # Ejaan berbeda dari nama yang sama boleh berbagi kode, dua nama berbeda tidak
+        nama_per_kode = pd.Series([normalize(nama) for _, nama in uniques]).groupby(kode_unik).nunique()
+        if (nama_per_kode > 1).any():
+            ganda = [nama for (_, nama), kode in zip(uniques, kode_unik) if nama_per_kode[kode] > 1]
+            raise ValueError(f"Kode kabupaten/kota bertabrakan untuk: {', '.join(map(str, ganda))}")
+        return kode_unik[codes]
+
+    def laporan(self):
+        """DataFrame nama yang dicocokkan fuzzy atau tidak cocok sama sekali."""
+        with self._lock:
+            rows = [{'Nama': name, 'Status': 'fuzzy', 'Nama baku': baku} for name, baku in self.fuzzy.items()]
+            rows += [{'Nama': name, 'Status': f'tidak cocok ({sumber})', 'Nama baku': None}
+                     for name, sumber in self.tidak_cocok.items()]
+        return pd.DataFrame(rows, columns=['Nama', 'Status', 'Nama baku'])
+
+
+INDEX = RegionIndex()
+
+
+def kolom_kode(df, keys):
+    """Kolom kode untuk kunci wilayah ``keys`` (``'Provinsi'`` dan opsional kabupaten/kota)."""
+    kode = {KODE_PROVINSI: INDEX.encode(df['Provinsi'])}
+    if len(keys) > 1:
+        kode[KODE_KABKOTA] = INDEX.encode_kabkota(kode[KODE_PROVINSI], df[keys[-1]])
+    return kode
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cocokkan nama wilayah dengan kode provinsi BPS.")
+    parser.add_argument("nama", nargs="+")
+    args = parser.parse_args(argv)
+
+    kode = INDEX.encode(args.nama, sumber="argumen")
+    for name, k in zip(args.nama, kode):
+        baku = INDEX.nama.get(int(k), "-")
+        print(f"{name:<32} {k:>4}  {baku}{'  (fuzzy)' if name in INDEX.fuzzy else ''}")
+    return 0 if (kode != TIDAK_COCOK).all() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+"""Laporan batch tanpa Streamlit: semua grafik halaman ke PNG/SVG/PDF.
+
+Grafik setiap halaman dibangun dengan pembuat gambar yang sama dengan
+dashboard (``dashboard.charts``) untuk setiap kombinasi tahun dan wilayah,
+lalu dirender paralel di process pool dengan backend Agg. Hasilnya
+disusun per tahun, wilayah, dan halaman beserta ``manifest.json`` berisi
+versi dataset, parameter, ukuran, dan checksum setiap berkas, serta
+grafik yang dilewati beserta alasannya (misalnya peta tanpa batas wilayah).
+
+Halaman TKDD (perbandingan, persentase) dibuat untuk setiap tahun dan
+wilayah; halaman analisis (faktor, IPM) memakai dataset nasional sehingga
+cukup dibuat sekali::
+
+    python -m dashboard.report
+    python -m dashboard.report --dataset tkdd_kabkota --semua-wilayah --format png pdf
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+
+from dashboard import hierarchy
+from dashboard.config import OUTPUT_DIR
+
+REPORT_DIR = OUTPUT_DIR / "laporan"
+FORMATS = ("png", "svg", "pdf")
+NASIONAL = "nasional"
+
+# Halaman yang berbeda per tahun dan wilayah, dan halaman analisis nasional
+HALAMAN_WILAYAH = ("perbandingan", "persentase")
+HALAMAN_ANALISIS = ("faktor_realisasi", "hubungan_ipm", "faktor_ipm")
+
+# Sama dengan nilai awal slider top-N di halaman
+TOP_N = 10
+
+
+@dataclass
+class Job:
+    halaman: str
+    chart: str
+    data: object
+    params: Dict = field(default_factory=dict)
+    tahun: object = None
+    wilayah: str = NASIONAL
+
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-")
+
+
+def _tampilan_wilayah(dataset, level, tahun, provinsi=None):
+    # Sama dengan pilih_tampilan_wilayah di halaman, tanpa widget
+    df_sorted = hierarchy.panel(dataset, level)[tahun]
+    if provinsi is not None:
+        df_sorted = hierarchy.drill_down(df_sorted, provinsi)
+    if len(df_sorted) > hierarchy.MAX_BARS:
+        df_sorted = hierarchy.top_bottom(df_sorted, TOP_N, level)
+    return df_sorted
+
+
+def batas_peta():
+    """Pasangan ``(GeoDataFrame, None)`` batas wilayah untuk peta, atau ``(None, alasan)`` bila tidak tersedia."""
+    from dashboard.boundaries import BoundaryStoreError
+    from dashboard.geometry import boundaries_for
+
+    try:
+        return boundaries_for(figsize=(14, 10)), None
+    except BoundaryStoreError as exc:
+        return None, str(exc)
+
+
+def wilayah_jobs(dataset, level, tahun, provinsi=None, peta=None):
+    """Grafik halaman perbandingan dan persentase untuk satu tahun dan wilayah.
+
+    ``peta`` adalah batas wilayah dari ``batas_peta`` (dimuat sekali oleh
+    pemanggil); None berarti tanpa peta.
+    """
+    from dashboard.geometry import merge_provinsi
+
+    df_sorted = _tampilan_wilayah(dataset, level, tahun, provinsi)
+    wilayah = NASIONAL if provinsi is None else slug(provinsi)
+    common = {"tahun": tahun, "wilayah": wilayah}
+    jobs = [
+        Job("perbandingan", "grouped_bar", df_sorted, {"label_col": level}, **common),
+        Job("perbandingan", "stacked_bar", df_sorted, {"label_col": level}, **common),
+        Job("persentase", "realisasi_barh", df_sorted, {"label_col": level, "tahun": tahun}, **common),
+    ]
+    # Peta selalu tingkat provinsi, jadi hanya dibuat untuk tampilan nasional
+    if peta is not None and provinsi is None:
+        merged = merge_provinsi(peta, hierarchy.panel(dataset, 'Provinsi')[tahun])
+        jobs.insert(2, Job("perbandingan", "choropleth", merged, {"tahun": tahun}, **common))
+    return jobs
+
+
+def analisis_jobs():
+    """Grafik halaman analisis faktor dan IPM (dataset nasional, sekali per laporan)."""
+    from dashboard import models, stats
+    from dashboard.data import get_dataset
+    from dashboard.models import PREDIKTOR_IPM, PREDIKTOR_REALISASI
+
+    data_all = get_dataset("all")
+    cube = stats.cube("all")
+    corr, pval = cube.pearson_test('IPM', 'Realisasi TKDD')
+    var_ipm = [col for col in PREDIKTOR_IPM if col != 'Realisasi TKDD'] + ['Realisasi TKDD']
+    var_realisasi = list(PREDIKTOR_REALISASI)
+    diagnostik = {}
+    for halaman, model in (("faktor_realisasi", "realisasi_tkdd"), ("faktor_ipm", "ipm")):
+        hasil = models.fit(model)
+        diagnostik[halaman] = Job(halaman, "diagnostik_regresi", hasil.diagnostik_frame(), {
+            "n_params": len(hasil.params), "title": f"Diagnostik Residual: {hasil.spec.target}"})
+    return [
+        Job("faktor_realisasi", "scatter_grid", data_all[['Realisasi TKDD', *var_realisasi]],
+            {"variabels": var_realisasi, "target": 'Realisasi TKDD'}),
+        Job("faktor_realisasi", "korelasi_heatmap", cube.korelasi_target('Realisasi TKDD', var_realisasi),
+            {"title": 'Korelasi terhadap Realisasi TKDD'}),
+        diagnostik["faktor_realisasi"],
+        Job("hubungan_ipm", "ipm_scatter", data_all[['Provinsi', 'IPM', 'Realisasi TKDD']],
+            {"corr": corr, "pval": pval}),
+        Job("faktor_ipm", "scatter_grid", data_all[['IPM', *var_ipm]], {"variabels": var_ipm, "target": 'IPM'}),
+        Job("faktor_ipm", "korelasi_heatmap", cube.korelasi_target('IPM', ['Realisasi TKDD', *var_ipm[:-1]]),
+            {"title": 'Korelasi terhadap IPM'}),
+        diagnostik["faktor_ipm"],
+    ]
+
+
+def _relpath(job):
+    if job.tahun is None:
+        return os.path.join("analisis", job.halaman, job.chart)
+    return os.path.join(str(job.tahun), job.wilayah, job.halaman, job.chart)
+
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def render_job(job, out_dir, formats):
+    """Render satu grafik ke setiap format dan kembalikan entri manifest-nya."""
+    from dashboard import charts
+    from dashboard.figcache import SAVEFIG_OPTIONS
+
+    start = time.perf_counter()
+    fig = getattr(charts, job.chart)(job.data, **job.params)
+    files = []
+    for fmt in formats:
+        buf = io.BytesIO()
+        fig.savefig(buf, format=fmt, **SAVEFIG_OPTIONS)
+        image = buf.getvalue()
+        rel = f"{_relpath(job)}.{fmt}"
+        path = os.path.join(out_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(image)
+        files.append({"path": rel, "format": fmt, "bytes": len(image), "sha256": hashlib.sha256(image).hexdigest()})
+    return {
+        "halaman": job.halaman,
+        "chart": job.chart,
+        "tahun": job.tahun,
+        "wilayah": job.wilayah,
+        "params": {k: v for k, v in job.params.items() if isinstance(v, (str, int, float, list))},
+        "files": files,
+        "detik": round(time.perf_counter() - start, 3),
+    }
+
+
+def _render_chunk(jobs, out_dir, formats):
+    return [render_job(job, out_dir, formats) for job in jobs]
+
+
+def render_all(jobs, out_dir, formats=FORMATS, workers=None):
+    """Render semua ``jobs`` secara paralel; kembalikan entri manifest sesuai urutan ``jobs``."""
+    workers = workers or os.cpu_count() or 1
+    out_dir = str(out_dir)
+    if workers == 1:
+        _init_worker()
+        return _render_chunk(jobs, out_dir, formats)
+    # Beberapa grafik per tugas agar biaya pickle DataFrame dan antrian tidak mendominasi
+    chunk = max(1, min(8, len(jobs) // (workers * 4)))
+    chunks = [jobs[i:i + chunk] for i in range(0, len(jobs), chunk)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = pool.map(_render_chunk, chunks, [out_dir] * len(chunks), [formats] * len(chunks))
+        return [entry for part in results for entry in part]
+
+
+def build_jobs(dataset, level, years=None, regions=(), halaman=None, dilewati=None):
+    """Daftar ``Job`` untuk setiap tahun x (nasional + ``regions``), ditambah halaman analisis.
+
+    Grafik yang tidak bisa dibuat (peta tanpa batas wilayah) dicatat ke
+    list ``dilewati`` beserta alasannya.
+    """
+    halaman = set(halaman or (*HALAMAN_WILAYAH, *HALAMAN_ANALISIS))
+    jobs = []
+    if halaman & set(HALAMAN_WILAYAH):
+        years = years or sorted(hierarchy.panel(dataset, level))
+        peta = None
+        if "perbandingan" in halaman:
+            # Batas wilayah dimuat sekali di proses utama, bukan per tahun atau per worker
+            peta, alasan = batas_peta()
+            if peta is None and dilewati is not None:
+                dilewati.append({"halaman": "perbandingan", "chart": "choropleth",
+                                 "tahun": list(years), "wilayah": NASIONAL, "alasan": alasan})
+        for tahun in years:
+            jobs += wilayah_jobs(dataset, level, tahun, peta=peta)
+            for provinsi in regions:
+                jobs += wilayah_jobs(dataset, level, tahun, provinsi)
+    if halaman & set(HALAMAN_ANALISIS):
+        jobs += analisis_jobs()
+    return [job for job in jobs if job.halaman in halaman]
+
+
+def write_manifest(out_dir, entries, datasets, formats, seconds, dilewati=()):
+    from dashboard.data import dataset_version
+
+    manifest = {
+        "dibuat": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dataset": {name: dataset_version(name) for name in datasets},
+        "format": list(formats),
+        "jumlah_grafik": len(entries),
+        "jumlah_berkas": sum(len(entry["files"]) for entry in entries),
+        "detik": round(seconds, 2),
+        "grafik": entries,
+        "dilewati": list(dilewati),
+    }
+    path = out_dir / "manifest.json"
+    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+    return path
+
+
+def main(argv=None):
+    from dashboard.data import get_dataset, is_available
+    from dashboard.pages import PAGES
+
+    parser = argparse.ArgumentParser(description="Render semua halaman dashboard TKDD ke berkas gambar.")
+    parser.add_argument("--dataset", choices=["tkdd", "tkdd_kabkota"],
+                        help="default: tkdd_kabkota bila tersedia, selain itu tkdd")
+    parser.add_argument("--tahun", type=int, nargs="*", help="default: semua tahun di dataset")
+    parser.add_argument("--wilayah", nargs="*", default=[], help="provinsi untuk drill-down kabupaten/kota")
+    parser.add_argument("--semua-wilayah", action="store_true", help="drill-down setiap provinsi")
+    parser.add_argument("--halaman", nargs="*", choices=list(PAGES.values()), help="default: semua halaman")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--output", type=Path, default=REPORT_DIR)
+    args = parser.parse_args(argv)
+
+    dataset = args.dataset or ("tkdd_kabkota" if is_available("tkdd_kabkota") else "tkdd")
+    level = hierarchy.KOLOM_KABKOTA if dataset == "tkdd_kabkota" else "Provinsi"
+    regions = list(args.wilayah)
+    if args.semua_wilayah:
+        if level != hierarchy.KOLOM_KABKOTA:
+            parser.error("--semua-wilayah membutuhkan dataset tkdd_kabkota")
+        regions = sorted(get_dataset(dataset)['Provinsi'].unique())
+
+    start = time.perf_counter()
+    dilewati = []
+    jobs = build_jobs(dataset, level, args.tahun, regions, args.halaman, dilewati)
+    for item in dilewati:
+        print(f"PERINGATAN: {item['chart']} ({item['halaman']}) dilewati: {item['alasan']}", file=sys.stderr)
+    args.output.mkdir(parents=True, exist_ok=True)
+    entries = render_all(jobs, args.output, args.format, args.jobs)
+    seconds = time.perf_counter() - start
+
+    datasets = sorted({dataset, *("all" for job in jobs if job.tahun is None)})
+    path = write_manifest(args.output, entries, datasets, args.format, seconds, dilewati)
+    print(f"{len(entries)} grafik, {sum(len(e['files']) for e in entries)} berkas dalam {seconds:.1f} s -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
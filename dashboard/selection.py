@@ -0,0 +1,261 @@
+"""Penjelajah pemilihan model: semua subset prediktor dan leave-one-out per provinsi.
+
+Untuk spesifikasi regresi di ``dashboard.models``, semua ``2^p`` subset
+prediktor dievaluasi (AIC, BIC, R², R² adjusted, koefisien) untuk sampel
+penuh dan untuk setiap sampel tanpa satu provinsi.
+
+Tidak ada fit OLS per subset. Matriks Gram ``W'W`` dari ``[1, X, y]``
+(kolom distandardisasi) dibentuk sekali; sampel tanpa provinsi ``i``
+adalah downdate rank-one ``W'W - w_i w_i'``. Semua matriks itu ditumpuk
+lalu di-sweep bersama mengikuti urutan kode Gray, sehingga setiap langkah
+hanya menambah atau mengeluarkan satu prediktor. Setelah sweep, entri
+``[y, y]`` adalah RSS dan kolom ``y`` adalah koefisien subset yang aktif.
+"""
+import argparse
+import dataclasses
+import threading
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import models, slices, telemetry
+from dashboard.data import dataset_version
+
+KRITERIA = ("AIC", "BIC", "R² adj")
+
+# Pivot yang lebih kecil dari ini (relatif terhadap diagonal awal) dianggap singular
+TOL_PIVOT = 1e-10
+
+_results = slices.CacheVersi()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Eksplorasi:
+    spec: models.ModelSpec
+    version: str
+    predictors: Tuple[str, ...]
+    provinsi: Tuple[str, ...]
+    # Baris 0 = sampel penuh, baris i = tanpa provinsi ke-i; kolom = bitmask subset
+    rss: np.ndarray
+    tss: np.ndarray
+    nobs: np.ndarray
+    # Koefisien (konstanta lalu prediktor) dalam satuan asli, NaN untuk prediktor di luar subset
+    coef: np.ndarray
+
+    def _baris(self, tanpa):
+        return 0 if tanpa is None else self.provinsi.index(tanpa) + 1
+
+    def _subset_names(self, mask):
+        return [name for j, name in enumerate(self.predictors) if mask >> j & 1]
+
+    def metrik(self, tanpa=None):
+        """DataFrame metrik semua subset (indeks = bitmask), opsional tanpa provinsi ``tanpa``."""
+        row = self._baris(tanpa)
+        n, rss, tss = self.nobs[row], self.rss[row], self.tss[row]
+        masks = np.arange(rss.shape[0])
+        k = np.array([bin(m).count("1") for m in masks])
+        p = k + 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            llf = -n / 2 * (np.log(2 * np.pi) + np.log(rss / n) + 1)
+            r2 = 1 - rss / tss
+            r2_adj = 1 - (1 - r2) * (n - 1) / (n - p)
+        return pd.DataFrame({
+            'Prediktor': [", ".join(self._subset_names(m)) or "(hanya konstanta)" for m in masks],
+            'k': k,
+            'R²': r2,
+            'R² adj': r2_adj,
+            'AIC': -2 * llf + 2 * p,
+            'BIC': -2 * llf + p * np.log(n),
+        }, index=pd.Index(masks, name='subset'))
+
+    def peringkat(self, kriteria="AIC", top=10, tanpa=None):
+        """``top`` subset terbaik menurut ``kriteria`` (AIC/BIC terkecil, R² adj terbesar)."""
+        table = self.metrik(tanpa)
+        return table.sort_values(kriteria, ascending=kriteria != "R² adj").head(top)
+
+    def terbaik(self, kriteria="AIC"):
+        """Bitmask subset terbaik untuk setiap baris sampel (sampel penuh lalu tiap provinsi)."""
+        return np.array([self.peringkat(kriteria, 1, tanpa).index[0] for tanpa in (None, *self.provinsi)])
+
+    def stabilitas(self, kriteria="AIC"):
+        """Model terbaik bila setiap provinsi dikeluarkan, dibandingkan dengan sampel penuh."""
+        best = self.terbaik(kriteria)
+        return pd.DataFrame({
+            'Model terbaik': [", ".join(self._subset_names(m)) or "(hanya konstanta)" for m in best[1:]],
+            'k': [bin(m).count("1") for m in best[1:]],
+            'Sama dengan sampel penuh': best[1:] == best[0],
+        }, index=pd.Index(self.provinsi, name='Provinsi dikeluarkan'))
+
+    def frekuensi_prediktor(self, kriteria="AIC"):
+        """Proporsi sampel leave-one-out yang model terbaiknya memuat setiap prediktor."""
+        best = self.terbaik(kriteria)[1:]
+        return pd.Series([np.mean(best >> j & 1) for j in range(len(self.predictors))],
+                         index=list(self.predictors), name='Frekuensi')
+
+    def koefisien(self, subset, tanpa=None):
+        """Koefisien subset (bitmask) dalam satuan asli, opsional tanpa provinsi ``tanpa``."""
+        values = self.coef[self._baris(tanpa), subset]
+        index = ['const', *self.predictors]
+        return pd.Series(values, index=index).dropna()
+
+
+def _sweep(A, k, reverse=False):
+    """Sweep (atau reverse sweep) pivot ``k`` pada tumpukan matriks simetris ``(..., d, d)``."""
+    pivot = A[..., k, k][..., None]
+    row = A[..., k, :] / pivot
+    col = A[..., :, k] / pivot
+    B = A - A[..., :, k, None] * row[..., None, :]
+    sign = -1.0 if reverse else 1.0
+    B[..., k, :] = sign * row
+    B[..., :, k] = sign * col
+    B[..., k, k] = -1.0 / pivot[..., 0]
+    return B
+
+
+def gray_path(p):
+    """Urutan ``(pivot, bitmask setelah toggle)`` yang mengunjungi semua 2^p subset sekali."""
+    path = []
+    for i in range(1, 2 ** p):
+        bit = (i & -i).bit_length() - 1
+        path.append((bit, i ^ (i >> 1)))
+    return path
+
+
+def _lstsq_semua(W, p):
+    # Cadangan bila sweep menemui pivot singular: least squares per subset
+    y = W[:, -1]
+    rss = np.empty(2 ** p)
+    coef = np.full((2 ** p, p + 1), np.nan)
+    for mask in range(2 ** p):
+        cols = [0, *(j + 1 for j in range(p) if mask >> j & 1)]
+        beta, *_ = np.linalg.lstsq(W[:, cols], y, rcond=None)
+        rss[mask] = np.sum((y - W[:, cols] @ beta) ** 2)
+        coef[mask, cols] = beta
+    return rss, coef
+
+
+def semua_subset(W):
+    """RSS, TSS, dan koefisien semua subset untuk tumpukan matriks data ``W`` (konstanta, X, y).
+
+    ``W`` berbentuk ``(n, 1 + p + 1)``. Hasil: RSS ``(m, 2^p)``, TSS ``(m,)``,
+    dan koefisien ``(m, 2^p, 1 + p)`` untuk ``m = n + 1`` sampel (penuh, lalu
+    tanpa setiap baris).
+    """
+    n, d = W.shape
+    p = d - 2
+    full = W.T @ W
+    G = full[None] - W[:, :, None] * W[:, None, :]
+    G = np.concatenate([full[None], G])
+    diag0 = np.diagonal(G, axis1=1, axis2=2).copy()
+    singular = np.zeros(len(G), dtype=bool)
+
+    rss = np.empty((len(G), 2 ** p))
+    coef = np.full((len(G), 2 ** p, p + 1), np.nan)
+
+    def _catat(A, mask):
+        rss[:, mask] = A[:, -1, -1]
+        cols = [0, *(j + 1 for j in range(p) if mask >> j & 1)]
+        coef[:, mask, cols] = A[:, cols, -1]
+
+    A = _sweep(G, 0)
+    tss = A[:, -1, -1].copy()
+    _catat(A, 0)
+    aktif = 0
+    for bit, mask in gray_path(p):
+        k = bit + 1
+        masuk = not aktif >> bit & 1
+        if masuk:
+            singular |= np.abs(A[:, k, k]) <= TOL_PIVOT * diag0[:, k]
+        A = _sweep(A, k, reverse=not masuk)
+        aktif = mask
+        _catat(A, mask)
+
+    for i in np.flatnonzero(singular):
+        rows = np.ones(n, dtype=bool)
+        if i > 0:
+            rows[i - 1] = False
+        rss[i], coef[i] = _lstsq_semua(W[rows], p)
+    return rss, tss, coef
+
+
+def _hitung(spec, version):
+    # Kolom terstandardisasi (dari cache desain model) menjaga kondisi matriks Gram,
+    # karena kolom rupiah bernilai ~1e13
+    desain = models.design(spec)
+    x_mean, x_std = desain.x_mean, desain.x_std
+    y_mean, y_std = desain.y_mean, desain.y_std
+    W = np.column_stack([np.ones(len(desain.Z)), desain.Z, (desain.Y.to_numpy() - y_mean) / y_std])
+    rss, tss, coef = semua_subset(W)
+
+    # Kembalikan ke satuan asli: y = y_mean + y_std * (b0 + sum b_j (x_j - mean_j) / std_j)
+    slopes = coef[..., 1:] * y_std / x_std
+    const = y_mean + y_std * coef[..., 0] - np.nansum(slopes * x_mean, axis=-1)
+    n = len(W)
+    return Eksplorasi(
+        spec=spec,
+        version=version,
+        predictors=desain.predictors,
+        provinsi=desain.labels,
+        rss=rss * y_std ** 2,
+        tss=tss * y_std ** 2,
+        nobs=np.array([n] + [n - 1] * n),
+        coef=np.concatenate([const[..., None], slopes], axis=-1),
+    )
+
+
+def eksplorasi(spec):
+    """``Eksplorasi`` untuk ``spec`` (``ModelSpec`` atau nama di ``models.SPECS``), di-cache per versi data."""
+    if isinstance(spec, str):
+        spec = models.SPECS[spec]
+    version = dataset_version(spec.dataset)
+    key = (spec, version)
+    with _lock:
+        result = _results.get(key)
+    telemetry.cache_event("seleksi model", "hit" if result is not None else "miss")
+    if result is None:
+        with telemetry.fase("model"):
+            result = _hitung(spec, version)
+        with _lock:
+            result = _results.setdefault(key, result)
+    return result
+
+
+def carry_over(change):
+    """Pindahkan hasil ``change.dataset`` ke versi baru; hanya yang kolomnya berubah dihitung ulang."""
+    with _lock:
+        lama = [(spec, result) for (spec, version), result in _results.items()
+                if spec.dataset == change.dataset and version == change.old_version]
+    for spec, result in lama:
+        if change.rows_same and not set(change.columns) & {spec.target, *spec.predictors, 'Provinsi'}:
+            baru = dataclasses.replace(result, version=change.new_version)
+        else:
+            baru = _hitung(spec, change.new_version)
+        with _lock:
+            _results.pop((spec, change.old_version), None)
+            _results.setdefault((spec, change.new_version), baru)
+
+
+def clear_cache():
+    with _lock:
+        _results.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Peringkat semua subset prediktor model regresi TKDD.")
+    parser.add_argument("model", choices=list(models.SPECS))
+    parser.add_argument("--kriteria", choices=KRITERIA, default="AIC")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--tanpa", help="nama provinsi yang dikeluarkan")
+    args = parser.parse_args(argv)
+
+    result = eksplorasi(args.model)
+    with pd.option_context("display.max_colwidth", 120, "display.width", 200):
+        print(result.peringkat(args.kriteria, args.top, args.tanpa).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
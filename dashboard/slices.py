@@ -0,0 +1,304 @@
+"""Irisan data: filter kelompok pulau, kategori IPM, dan kategori realisasi.
+
+Setiap facet disimpan sebagai array kode kategori ``int8`` per dataset dan
+versi data, dihitung sekali (kelompok pulau diturunkan dari digit pertama
+kode provinsi BPS). Kombinasi filter apa pun menjadi irisan mask NumPy:
+untuk setiap facet, tabel lookup boolean diindeks dengan array kodenya,
+lalu hasilnya di-AND. Frame hasil irisan di-cache per (dataset, versi,
+irisan) sehingga rerun tidak menyalin ulang baris.
+
+Irisan aktif dipasang oleh ``dashboard.data.irisan_aktif``; selama aktif,
+``get_dataset`` mengembalikan baris yang lolos filter dan
+``dataset_version`` memuat token irisan, sehingga semua cache turunan
+(panel wilayah, kubus statistik, model, gambar) otomatis terpisah per
+irisan. Facet yang kolomnya tidak ada di suatu dataset diabaikan untuk
+dataset itu.
+
+Cache turunan per versi memakai ``CacheVersi``: entri versi dasar tidak
+dibatasi (jumlahnya sebanyak dataset x spesifikasi), sedangkan entri versi
+teriris dibatasi ``MAKS_FRAME`` dengan LRU seperti frame irisan, karena
+kombinasi filter dari URL tidak terbatas. Hasil versi teriris juga tidak
+ditulis ke disk.
+
+Irisan bisa dibaca dari dan ditulis ke parameter URL, misalnya
+``?pulau=jawa,sumatera&ipm=tinggi``.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import regions
+
+# Kelompok pulau menurut digit pertama kode provinsi BPS (Kepulauan Riau, 21, ikut Sumatera)
+PULAU = {
+    1: "Sumatera",
+    2: "Sumatera",
+    3: "Jawa",
+    5: "Bali dan Nusa Tenggara",
+    6: "Kalimantan",
+    7: "Sulawesi",
+    8: "Maluku",
+    9: "Papua",
+}
+
+# Jumlah frame hasil irisan (dan array kode per versi) yang disimpan
+MAKS_FRAME = 32
+
+# Pemisah versi dasar (hex) dan token irisan di ``versi``
+_PEMISAH = "-"
+
+_codes = OrderedDict()
+_frames = OrderedDict()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Facet:
+    name: str
+    label: str
+    # Nilai tampilan (urutan widget) -> nilai di URL
+    slugs: Dict[str, str]
+    # Kolom kategori di dataset; None untuk kelompok pulau (dari kode BPS)
+    kolom: Optional[str] = None
+
+    @property
+    def values(self):
+        return tuple(self.slugs)
+
+
+FACETS = {facet.name: facet for facet in (
+    Facet("pulau", "Kelompok Pulau", {nama: nama.lower().replace(" ", "-") for nama in dict.fromkeys(PULAU.values())}),
+    Facet("ipm", "Kategori IPM", {
+        "Sangat Tinggi": "sangat-tinggi", "Tinggi": "tinggi", "Sedang": "sedang", "Rendah": "rendah",
+    }, kolom='Kategori IPM'),
+    Facet("realisasi", "Kategori Realisasi TKDD", {
+        "<90%": "di-bawah-90", "90-100%": "90-100", ">100%": "di-atas-100",
+    }, kolom='Kategori Persentase Realisasi TKDD'),
+)}
+
+
+@dataclass(frozen=True)
+class Irisan:
+    # ((facet, (nilai, ...)), ...) terurut; facet tanpa pilihan atau dengan semua nilai tidak dicantumkan
+    pilihan: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+    @classmethod
+    def dari_pilihan(cls, pilihan):
+        """Irisan dari dict ``{facet: [nilai tampilan, ...]}``."""
+        items = []
+        for name, facet in FACETS.items():
+            nilai = tuple(v for v in facet.values if v in set(pilihan.get(name) or ()))
+            if nilai and len(nilai) < len(facet.values):
+                items.append((name, nilai))
+        return cls(tuple(items))
+
+    @classmethod
+    def dari_query(cls, params):
+        """Irisan dari parameter URL ``{facet: "slug,slug"}``; slug yang tidak dikenal diabaikan."""
+        pilihan = {}
+        for name, facet in FACETS.items():
+            slugs = set(str(params.get(name) or "").lower().split(","))
+            pilihan[name] = [nilai for nilai, slug in facet.slugs.items() if slug in slugs]
+        return cls.dari_pilihan(pilihan)
+
+    @property
+    def kosong(self):
+        return not self.pilihan
+
+    @property
+    def token(self):
+        return hashlib.sha1(json.dumps(self.pilihan).encode()).hexdigest()[:12]
+
+    def nilai(self, facet):
+        return list(dict(self.pilihan).get(facet, ()))
+
+    def query(self):
+        """Parameter URL ``{facet: "slug,slug"}`` untuk irisan ini."""
+        return {name: ",".join(FACETS[name].slugs[v] for v in nilai) for name, nilai in self.pilihan}
+
+    def deskripsi(self):
+        return "; ".join(f"{FACETS[name].label}: {', '.join(nilai)}" for name, nilai in self.pilihan) or "Semua wilayah"
+
+
+def versi(base, irisan):
+    """Versi data untuk irisan: versi dasar ditambah token irisan (aman untuk nama berkas)."""
+    return base if irisan is None or irisan.kosong else f"{base}{_PEMISAH}{irisan.token}"
+
+
+def teriris(version):
+    """True bila ``version`` adalah versi irisan (hasil ``versi`` dengan irisan tidak kosong)."""
+    return _PEMISAH in version
+
+
+class CacheVersi(dict):
+    """Dict cache berkunci tuple yang elemen terakhirnya versi data.
+
+    Entri versi teriris dibatasi ``maks`` (yang paling lama tidak dipakai
+    dibuang); entri versi dasar disimpan seperti dict biasa. Pemanggil tetap
+    memegang lock modulnya sendiri.
+    """
+
+    def __init__(self, maks=MAKS_FRAME):
+        super().__init__()
+        self.maks = maks
+        self._urutan = OrderedDict()
+
+    def _pakai(self, key):
+        if not teriris(key[-1]):
+            return
+        self._urutan[key] = None
+        self._urutan.move_to_end(key)
+        while len(self._urutan) > self.maks:
+            lama, _ = self._urutan.popitem(last=False)
+            super().pop(lama, None)
+
+    def get(self, key, default=None):
+        if key in self:
+            self._pakai(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self._pakai(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._pakai(key)
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._pakai(key)
+        return value
+
+    def pop(self, key, *default):
+        self._urutan.pop(key, None)
+        return super().pop(key, *default)
+
+    def __delitem__(self, key):
+        self._urutan.pop(key, None)
+        super().__delitem__(key)
+
+    def clear(self):
+        self._urutan.clear()
+        super().clear()
+
+
+def _hitung_kode(df):
+    codes = {}
+    if 'Provinsi' in df.columns:
+        # Kode kelompok pulau: posisi di FACETS["pulau"].values, -1 untuk provinsi yang tidak dikenal
+        kelompok = FACETS["pulau"].values
+        lut = np.full(10, -1, dtype='int8')
+        for digit, nama in PULAU.items():
+            lut[digit] = kelompok.index(nama)
+        kode = regions.INDEX.encode(df['Provinsi'])
+        codes["pulau"] = np.where(kode >= 0, lut[np.clip(kode // 10, 0, 9)], -1).astype('int8')
+    for name, facet in FACETS.items():
+        if facet.kolom is not None and facet.kolom in df.columns:
+            codes[name] = pd.Categorical(df[facet.kolom], categories=facet.values).codes.astype('int8')
+    return codes
+
+
+def kode(name, df, version):
+    """Dict ``{facet: array kode int8}`` untuk dataset ``name`` versi ``version``, dihitung sekali."""
+    key = (name, version)
+    with _lock:
+        result = _codes.get(key)
+    if result is None:
+        result = _simpan_kode(key, _hitung_kode(df))
+    return result
+
+
+def _simpan_kode(key, codes):
+    with _lock:
+        result = _codes.setdefault(key, codes)
+        _codes.move_to_end(key)
+        while len(_codes) > 2 * MAKS_FRAME:
+            _codes.popitem(last=False)
+    return result
+
+
+def _mask_kode(codes, irisan, n):
+    mask = np.ones(n, dtype=bool)
+    for name, nilai in irisan.pilihan:
+        if name not in codes:
+            continue
+        values = FACETS[name].values
+        # Indeks terakhir (untuk kode -1) selalu False
+        lut = np.zeros(len(values) + 1, dtype=bool)
+        lut[[values.index(v) for v in nilai]] = True
+        mask &= lut[codes[name]]
+    return mask
+
+
+def mask(name, df, version, irisan):
+    """Mask boolean baris ``df`` yang lolos ``irisan``."""
+    return _mask_kode(kode(name, df, version), irisan, len(df))
+
+
+def terapkan(name, df, version, irisan):
+    """Baris ``df`` yang lolos ``irisan``; frame hasil di-cache per (dataset, versi, irisan)."""
+    key = (name, version, irisan)
+    with _lock:
+        result = _frames.get(key)
+        if result is not None:
+            _frames.move_to_end(key)
+    if result is None:
+        codes = kode(name, df, version)
+        pilih = _mask_kode(codes, irisan, len(df))
+        result = df[pilih]
+        # Kode facet frame hasil irisan = kode dasar yang dimask, tanpa dihitung ulang
+        _simpan_kode((name, versi(version, irisan)), {facet: c[pilih] for facet, c in codes.items()})
+        with _lock:
+            _frames[key] = result
+            while len(_frames) > MAKS_FRAME:
+                _frames.popitem(last=False)
+    return result.copy(deep=False)
+
+
+def ringkasan(name, df, version, facet):
+    """Total Pagu/Realisasi, persentase realisasi, dan rata-rata IPM per nilai ``facet``.
+
+    ``df`` dan ``version`` adalah hasil ``get_dataset``/``dataset_version``
+    (sudah teriris bila ada irisan aktif). Dihitung dengan ``bincount`` pada
+    kode facet tanpa menyalin baris.
+    """
+    codes = kode(name, df, version)
+    values = FACETS[facet].values
+    if facet not in codes:
+        raise KeyError(f"Facet {facet!r} tidak tersedia untuk dataset {name!r}")
+    pilih = codes[facet] >= 0
+    c = codes[facet][pilih]
+
+    def total(col):
+        # Nilai kosong tidak ikut dijumlah; kembalikan juga jumlah nilai yang terisi
+        x = df[col].to_numpy(dtype='float64')[pilih]
+        ada = ~np.isnan(x)
+        return (np.bincount(c[ada], x[ada], minlength=len(values)),
+                np.bincount(c[ada], minlength=len(values)))
+
+    n = np.bincount(c, minlength=len(values))
+    hasil = pd.DataFrame({'Kelompok': list(values), 'Jumlah wilayah': n})
+    for col in ('Pagu TKDD', 'Realisasi TKDD'):
+        if col in df.columns:
+            hasil[col] = total(col)[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if 'Pagu TKDD' in hasil and 'Realisasi TKDD' in hasil:
+            hasil['Persentase Realisasi TKDD'] = hasil['Realisasi TKDD'] / hasil['Pagu TKDD'] * 100
+        if 'IPM' in df.columns:
+            jumlah, terisi = total('IPM')
+            hasil['Rata-rata IPM'] = jumlah / terisi
+    return hasil[hasil['Jumlah wilayah'] > 0].reset_index(drop=True)
+
+
+def clear_cache():
+    with _lock:
+        _codes.clear()
+        _frames.clear()
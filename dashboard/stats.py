@@ -0,0 +1,240 @@
+"""Kubus statistik korelasi yang dihitung sekali per versi dataset.
+
+Matriks korelasi Pearson dan Spearman, p-value berpasangan, dan jumlah
+observasi berpasangan (N) untuk semua kolom numerik dihitung dalam satu
+lintasan aljabar matriks, lalu disimpan ke ``Output/cache/stats`` sehingga
+proses baru tidak perlu menghitung ulang. Heatmap, judul scatter plot,
+dan uji signifikansi di setiap halaman membaca dari kubus ini.
+"""
+import dataclasses
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from dashboard import slices, telemetry
+from dashboard.config import CACHE_DIR
+from dashboard.data import dataset_version, get_dataset
+
+STATS_DIR = CACHE_DIR / "stats"
+
+_cubes = slices.CacheVersi()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class StatsCube:
+    version: str
+    columns: tuple
+    pearson: pd.DataFrame
+    pearson_p: pd.DataFrame
+    spearman: pd.DataFrame
+    spearman_p: pd.DataFrame
+    n: pd.DataFrame
+
+    def korelasi_target(self, target, columns, method='pearson'):
+        """Satu kolom korelasi ``target`` terhadap ``columns`` (bentuk yang dipakai heatmap)."""
+        matrix = self.pearson if method == 'pearson' else self.spearman
+        return matrix.loc[list(columns), [target]]
+
+    def pearson_test(self, x, y):
+        """Pasangan ``(r, p-value)`` Pearson dua arah, setara ``scipy.stats.pearsonr``."""
+        return float(self.pearson.at[x, y]), float(self.pearson_p.at[x, y])
+
+    def spearman_test(self, x, y):
+        return float(self.spearman.at[x, y]), float(self.spearman_p.at[x, y])
+
+
+def _pairwise_pearson(values, subset=None):
+    """Korelasi Pearson pairwise-complete dan N untuk semua pasangan kolom sekaligus.
+
+    Dengan ``subset`` (indeks kolom), hanya baris matriks untuk kolom-kolom
+    itu yang dihitung: hasilnya berbentuk ``(len(subset), n_kolom)``.
+    """
+    present = ~np.isnan(values)
+    mask = present.astype('float64')
+    x0 = np.where(present, values, 0.0)
+    rows = np.arange(values.shape[1]) if subset is None else np.asarray(subset)
+    mask_a, x0_a = mask[:, rows], x0[:, rows]
+
+    n = mask_a.T @ mask
+    sum_a = x0_a.T @ mask               # jumlah kolom a pada baris di mana kolom b juga ada
+    sum_b = mask_a.T @ x0
+    sum_aa = (x0_a * x0_a).T @ mask
+    sum_bb = mask_a.T @ (x0 * x0)
+    sum_ab = x0_a.T @ x0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_ab - sum_a * sum_b / n
+        var_a = sum_aa - sum_a ** 2 / n
+        var_b = sum_bb - sum_b ** 2 / n
+        r = cov / np.sqrt(var_a * var_b)
+    r = np.clip(r, -1.0, 1.0)
+    diag = (np.arange(len(rows)), rows)
+    r[diag] = np.where(n[diag] > 1, 1.0, np.nan)
+    return r, n
+
+
+def _p_values(r, n):
+    """p-value dua arah uji t untuk koefisien korelasi dengan ``n`` observasi."""
+    from scipy import stats as sps
+
+    dof = n - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = r * np.sqrt(dof / (1.0 - r ** 2))
+        p = 2 * sps.t.sf(np.abs(t), dof)
+    p[np.abs(r) >= 1.0] = 0.0
+    p[dof <= 0] = np.nan
+    return p
+
+
+def _frame(matrix, columns):
+    return pd.DataFrame(matrix, index=list(columns), columns=list(columns))
+
+
+def compute(df, version=""):
+    numeric = df.select_dtypes(include='number')
+    columns = tuple(numeric.columns)
+    values = numeric.to_numpy(dtype='float64')
+
+    pearson, n = _pairwise_pearson(values)
+    if np.isnan(values).any():
+        # Peringkat Spearman bergantung pada pasangan yang lengkap; pakai pandas bila ada nilai kosong
+        spearman = numeric.corr(method='spearman').to_numpy()
+    else:
+        ranks = numeric.rank(method='average').to_numpy(dtype='float64')
+        spearman, _ = _pairwise_pearson(ranks)
+
+    return StatsCube(
+        version=version,
+        columns=columns,
+        pearson=_frame(pearson, columns),
+        pearson_p=_frame(_p_values(pearson, n), columns),
+        spearman=_frame(spearman, columns),
+        spearman_p=_frame(_p_values(spearman, n), columns),
+        n=_frame(n, columns),
+    )
+
+
+def update(old, df, columns, version=""):
+    """Kubus baru setelah nilai ``columns`` berubah tanpa perubahan baris.
+
+    Hanya baris dan kolom matriks untuk kolom yang berubah yang dihitung
+    ulang; entri lain disalin dari ``old``. Bila susunan kolom numerik
+    berubah atau ada nilai kosong, kubus dihitung penuh.
+    """
+    numeric = df.select_dtypes(include='number')
+    if tuple(numeric.columns) != old.columns:
+        return compute(df, version)
+    idx = [old.columns.index(col) for col in columns if col in old.columns]
+    if not idx:
+        return dataclasses.replace(old, version=version)
+    values = numeric.to_numpy(dtype='float64')
+    if np.isnan(values).any():
+        return compute(df, version)
+
+    def _patch(matrix, block):
+        matrix = matrix.to_numpy().copy()
+        matrix[idx, :] = block
+        matrix[:, idx] = block.T
+        return matrix
+
+    r, n = _pairwise_pearson(values, idx)
+    pearson, n = _patch(old.pearson, r), _patch(old.n, n)
+    ranks = numeric.rank(method='average').to_numpy(dtype='float64')
+    r_s, _ = _pairwise_pearson(ranks, idx)
+    spearman = _patch(old.spearman, r_s)
+
+    return StatsCube(
+        version=version,
+        columns=old.columns,
+        pearson=_frame(pearson, old.columns),
+        pearson_p=_frame(_p_values(pearson, n), old.columns),
+        spearman=_frame(spearman, old.columns),
+        spearman_p=_frame(_p_values(spearman, n), old.columns),
+        n=_frame(n, old.columns),
+    )
+
+
+def _path(dataset, version):
+    return STATS_DIR / f"{dataset}-{version}.npz"
+
+
+def save(cube, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp.npz")
+    np.savez(
+        tmp_path,
+        version=np.array(cube.version),
+        columns=np.array(cube.columns),
+        **{name: getattr(cube, name).to_numpy() for name in ("pearson", "pearson_p", "spearman", "spearman_p", "n")},
+    )
+    tmp_path.replace(path)
+
+
+def load(path):
+    with np.load(path, allow_pickle=False) as npz:
+        columns = tuple(str(c) for c in npz["columns"])
+        return StatsCube(
+            version=str(npz["version"]),
+            columns=columns,
+            pearson=_frame(npz["pearson"], columns),
+            pearson_p=_frame(npz["pearson_p"], columns),
+            spearman=_frame(npz["spearman"], columns),
+            spearman_p=_frame(npz["spearman_p"], columns),
+            n=_frame(npz["n"], columns),
+        )
+
+
+def carry_over(change, df):
+    """Pindahkan kubus ``change.dataset`` ke versi baru, menghitung ulang entri yang terdampak saja."""
+    with _lock:
+        old = _cubes.get((change.dataset, change.old_version))
+    if old is None:
+        return None
+    if change.rows_same:
+        result = update(old, df, change.columns, change.new_version)
+    else:
+        result = compute(df, change.new_version)
+    try:
+        save(result, _path(change.dataset, change.new_version))
+        # Berkas versi lama tidak akan dibaca lagi
+        _path(change.dataset, change.old_version).unlink(missing_ok=True)
+    except OSError:
+        pass
+    with _lock:
+        _cubes.pop((change.dataset, change.old_version), None)
+        return _cubes.setdefault((change.dataset, change.new_version), result)
+
+
+def cube(dataset):
+    """``StatsCube`` untuk ``dataset``; dari memori, lalu disk, lalu dihitung."""
+    version = dataset_version(dataset)
+    key = (dataset, version)
+    with _lock:
+        result = _cubes.get(key)
+    if result is not None:
+        telemetry.cache_event("statistik", "hit")
+        return result
+
+    # Kubus irisan hanya di memori: kombinasi filter tidak terbatas dan murah dihitung ulang
+    path = None if slices.teriris(version) else _path(dataset, version)
+    with telemetry.fase("transform"):
+        result = None
+        if path is not None:
+            try:
+                result = load(path)
+                telemetry.cache_event("statistik", "disk")
+            except (OSError, KeyError, ValueError):
+                pass
+        if result is None:
+            telemetry.cache_event("statistik", "miss")
+            result = compute(get_dataset(dataset), version)
+            if path is not None:
+                try:
+                    save(result, path)
+                except OSError:
+                    pass
+    with _lock:
+        return _cubes.setdefault(key, result)
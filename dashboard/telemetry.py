@@ -0,0 +1,352 @@
+"""Instrumentasi server: waktu per fase, hit/miss cache, dan memori per sesi.
+
+Setiap render halaman dibungkus ``halaman(judul, sesi)``; di dalamnya modul
+dashboard menandai pekerjaannya dengan ``fase(nama)`` untuk lima fase
+``FASE`` (load, transform, model, render, serialize). Waktu dinding
+(``perf_counter``) dan waktu CPU thread (``thread_time``, karena setiap
+sesi Streamlit berjalan di thread-nya sendiri) dicatat secara eksklusif:
+fase bersarang, misalnya ``load`` di dalam ``transform``, tidak dihitung
+dua kali. Fase di luar render halaman (laporan batch, CLI) dicatat pada
+halaman ``TANPA_HALAMAN``. Pekerjaan yang dijalankan di thread lain dengan
+konteks yang disalin (``contextvars.copy_context``) tetap tercatat pada
+render halaman asalnya, dengan tumpukan fase per thread.
+
+Cache berbasis dict mencatat hit/miss lewat ``cache_event``; cache gambar,
+``lru_cache``, dan cache bersama (``bersama/<namespace>``, dengan hasil
+``replika`` untuk entri tulisan replika lain) dibaca langsung dari
+statistiknya saat ``snapshot``.
+
+Data dapat dilihat di halaman tersembunyi (``?diagnostik=1``), sebagai
+teks format Prometheus (``prometheus()``), atau sebagai log JSON per
+render bila ``TKDD_METRICS_LOG`` diisi. Log itu bisa diringkas menjadi
+teks Prometheus (misalnya untuk textfile collector node_exporter)::
+
+    python -m dashboard.telemetry Output/metrics.jsonl > tkdd.prom
+"""
+import argparse
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FASE = ("load", "transform", "model", "render", "serialize")
+TANPA_HALAMAN = "(tanpa halaman)"
+
+LOG_PATH = os.environ.get("TKDD_METRICS_LOG") or None
+
+# Jumlah sesi dan render terakhir yang disimpan di memori
+MAKS_SESI = 200
+MAKS_RIWAYAT = 50
+
+# Cache lru_cache yang dibaca lewat cache_info() bila modulnya sudah dimuat
+LRU_CACHES = (
+    ("batas wilayah", "dashboard.boundaries", "_load_boundaries"),
+    ("geometri", "dashboard.geometry", "_tiers"),
+)
+
+# Render yang sedang berjalan di konteks ini: {"halaman": ..., "fase": {...}, "tumpukan": {thread: [...]}}
+_render = contextvars.ContextVar("tkdd_render", default=None)
+# Tumpukan fase di luar render halaman, per thread
+_luar = threading.local()
+
+
+def rss_bytes():
+    """RSS proses saat ini dalam byte (puncak proses bila /proc tidak tersedia)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes():
+    """RSS puncak proses sejak mulai, dalam byte (0 bila tidak didukung)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss dalam KiB di Linux, dalam byte di macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Telemetri:
+    """Akumulator metrik; satu instans global untuk proses, atau dibangun ulang dari log JSON."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (halaman, fase) -> [jumlah, wall, cpu]
+        self.fase = {}
+        # halaman -> [jumlah, wall, cpu, wall_maks]
+        self.halaman = {}
+        # cache -> {"hit": n, "miss": n, ...}
+        self.cache = {}
+        # sesi -> {"render": n, "rss_puncak": byte, "terakhir": waktu}
+        self.sesi = OrderedDict()
+        self.riwayat = deque(maxlen=MAKS_RIWAYAT)
+
+    def tambah_fase(self, halaman, nama, wall, cpu):
+        with self._lock:
+            entri = self.fase.setdefault((halaman, nama), [0, 0.0, 0.0])
+            entri[0] += 1
+            entri[1] += wall
+            entri[2] += cpu
+
+    def cache_event(self, nama, hasil):
+        with self._lock:
+            counts = self.cache.setdefault(nama, {})
+            counts[hasil] = counts.get(hasil, 0) + 1
+
+    def catat_render(self, record):
+        """Tambahkan satu render halaman (dict seperti baris log JSON)."""
+        with self._lock:
+            entri = self.halaman.setdefault(record["halaman"], [0, 0.0, 0.0, 0.0])
+            entri[0] += 1
+            entri[1] += record["wall"]
+            entri[2] += record["cpu"]
+            entri[3] = max(entri[3], record["wall"])
+
+            sesi = self.sesi.pop(record["sesi"], {"render": 0, "rss_puncak": 0})
+            sesi["render"] += 1
+            sesi["rss_puncak"] = max(sesi["rss_puncak"], record["rss_puncak"])
+            sesi["terakhir"] = record["waktu"]
+            self.sesi[record["sesi"]] = sesi
+            while len(self.sesi) > MAKS_SESI:
+                self.sesi.popitem(last=False)
+            self.riwayat.append(record)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "fase": [{"halaman": h, "fase": f, "jumlah": n, "wall": w, "cpu": c}
+                         for (h, f), (n, w, c) in self.fase.items()],
+                "halaman": [{"halaman": h, "jumlah": n, "wall": w, "cpu": c, "wall_maks": m}
+                            for h, (n, w, c, m) in self.halaman.items()],
+                "cache": {name: dict(counts) for name, counts in self.cache.items()},
+                "sesi": {sesi: dict(info) for sesi, info in self.sesi.items()},
+                "riwayat": list(self.riwayat),
+            }
+
+
+_global = Telemetri()
+
+
+def get_telemetri():
+    return _global
+
+
+def _cache_bawaan():
+    # Statistik cache yang sudah dihitung sendiri oleh modulnya
+    stats = {}
+    figcache = sys.modules.get("dashboard.figcache")
+    if figcache is not None:
+        fig = figcache.get_cache().stats()
+        stats["gambar"] = {"hit": fig["hits"], "disk": fig["disk_hits"], "miss": fig["misses"]}
+    for name, module, attr in LRU_CACHES:
+        module = sys.modules.get(module)
+        if module is not None:
+            info = getattr(module, attr).cache_info()
+            stats[name] = {"hit": info.hits, "miss": info.misses}
+    cachestore = sys.modules.get("dashboard.cachestore")
+    store = cachestore.get_store() if cachestore is not None else None
+    if store is not None:
+        for namespace, counts in store.stats().items():
+            stats[f"bersama/{namespace}"] = counts
+    return stats
+
+
+def rasio_replika(data):
+    """Porsi akses cache bersama di ``data`` yang dilayani entri tulisan replika lain, atau None."""
+    counts = [c for name, c in data["cache"].items() if name.startswith("bersama/")]
+    total = sum(sum(c.values()) for c in counts)
+    return sum(c.get("replika", 0) for c in counts) / total if total else None
+
+
+def snapshot():
+    """Dict semua metrik proses ini, termasuk cache gambar/lru dan RSS."""
+    data = _global.snapshot()
+    data["cache"].update(_cache_bawaan())
+    data["rss"] = rss_bytes()
+    data["rss_puncak"] = peak_rss_bytes()
+    data["pid"] = os.getpid()
+    warmup = sys.modules.get("dashboard.warmup")
+    if warmup is not None and warmup.status() is not None:
+        data["warmup"] = warmup.status()
+    return data
+
+
+def cache_event(nama, hasil):
+    """Catat satu akses cache ``nama``; ``hasil`` = ``"hit"``, ``"miss"``, ``"disk"``, atau ``"bersama"``."""
+    _global.cache_event(nama, hasil)
+
+
+@contextmanager
+def fase(nama):
+    """Ukur blok sebagai fase ``nama`` (eksklusif terhadap fase bersarang di dalamnya)."""
+    render = _render.get()
+    if render is not None:
+        tumpukan = render["tumpukan"].setdefault(threading.get_ident(), [])
+    else:
+        tumpukan = _luar.__dict__.setdefault("tumpukan", [])
+    # [nama, mulai wall, mulai cpu, wall anak, cpu anak]
+    entri = [nama, time.perf_counter(), time.thread_time(), 0.0, 0.0]
+    tumpukan.append(entri)
+    try:
+        yield
+    finally:
+        tumpukan.pop()
+        wall = time.perf_counter() - entri[1]
+        cpu = time.thread_time() - entri[2]
+        if tumpukan:
+            tumpukan[-1][3] += wall
+            tumpukan[-1][4] += cpu
+        wall_eksklusif, cpu_eksklusif = max(wall - entri[3], 0.0), max(cpu - entri[4], 0.0)
+        halaman = render["halaman"] if render is not None else TANPA_HALAMAN
+        _global.tambah_fase(halaman, nama, wall_eksklusif, cpu_eksklusif)
+        if render is not None:
+            with render["lock"]:
+                per_fase = render["fase"].setdefault(nama, {"wall": 0.0, "cpu": 0.0})
+                per_fase["wall"] += wall_eksklusif
+                per_fase["cpu"] += cpu_eksklusif
+
+
+def _tulis_log(record, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@contextmanager
+def halaman(judul, sesi):
+    """Ukur satu render halaman ``judul`` untuk sesi ``sesi`` beserta semua fasenya."""
+    render = {"halaman": judul, "fase": {}, "tumpukan": {}, "lock": threading.Lock()}
+    token = _render.set(render)
+    mulai_wall, mulai_cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield render
+    finally:
+        _render.reset(token)
+        record = {
+            "waktu": time.time(),
+            "pid": os.getpid(),
+            "sesi": sesi,
+            "halaman": judul,
+            "wall": time.perf_counter() - mulai_wall,
+            "cpu": time.thread_time() - mulai_cpu,
+            "fase": render["fase"],
+            "rss_puncak": rss_bytes(),
+        }
+        _global.catat_render(record)
+        if LOG_PATH is not None:
+            try:
+                _tulis_log({**record, "cache": snapshot()["cache"]}, LOG_PATH)
+            except OSError:
+                pass
+
+
+def _label(**labels):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def prometheus(data=None):
+    """Teks exposition format Prometheus dari ``snapshot()`` (atau ``data`` yang diberikan)."""
+    data = data if data is not None else snapshot()
+    lines = []
+
+    def metrik(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{name}{_label(**labels)} {value:.6g}" for labels, value in samples)
+
+    metrik("tkdd_phase_seconds_total", "counter", "Waktu eksklusif per fase per halaman.", [
+        ({"page": row["halaman"], "phase": row["fase"], "clock": clock}, row[clock])
+        for row in data["fase"] for clock in ("wall", "cpu")
+    ])
+    metrik("tkdd_phase_calls_total", "counter", "Jumlah eksekusi fase per halaman.", [
+        ({"page": row["halaman"], "phase": row["fase"]}, row["jumlah"]) for row in data["fase"]
+    ])
+    metrik("tkdd_page_renders_total", "counter", "Jumlah render per halaman.", [
+        ({"page": row["halaman"]}, row["jumlah"]) for row in data["halaman"]
+    ])
+    metrik("tkdd_page_seconds_total", "counter", "Total waktu render per halaman.", [
+        ({"page": row["halaman"], "clock": clock}, row[clock])
+        for row in data["halaman"] for clock in ("wall", "cpu")
+    ])
+    metrik("tkdd_page_seconds_max", "gauge", "Render terlama per halaman (wall).", [
+        ({"page": row["halaman"]}, row["wall_maks"]) for row in data["halaman"]
+    ])
+    metrik("tkdd_cache_requests_total", "counter", "Akses cache menurut hasilnya.", [
+        ({"cache": name, "result": hasil}, n)
+        for name, counts in sorted(data["cache"].items()) for hasil, n in sorted(counts.items())
+    ])
+    rasio = rasio_replika(data)
+    if rasio is not None:
+        metrik("tkdd_shared_cache_cross_replica_ratio", "gauge",
+               "Porsi akses cache bersama yang dilayani entri tulisan replika lain.", [({}, rasio)])
+    metrik("tkdd_session_peak_rss_bytes", "gauge", "RSS tertinggi yang teramati selama render sesi.", [
+        ({"session": sesi}, info["rss_puncak"]) for sesi, info in data["sesi"].items()
+    ])
+    if "warmup" in data:
+        metrik("tkdd_ready", "gauge", "1 bila pemanasan semua halaman selesai tanpa galat.",
+               [({}, float(data["warmup"]["siap"]))])
+        metrik("tkdd_warmup_page_seconds", "gauge", "Waktu pemanasan per halaman.", [
+            ({"page": hasil["judul"]}, hasil["detik"]) for hasil in data["warmup"]["halaman"]
+        ])
+    if "rss" in data:
+        metrik("tkdd_process_rss_bytes", "gauge", "RSS proses saat ini.", [({}, data["rss"])])
+        metrik("tkdd_process_peak_rss_bytes", "gauge", "RSS puncak proses.", [({}, data["rss_puncak"])])
+    return "\n".join(lines) + "\n"
+
+
+def dari_log(path):
+    """Bangun ulang metrik dari log JSON: fase dan render dijumlahkan, cache dari baris terakhir tiap proses."""
+    telemetri = Telemetri()
+    cache_terakhir = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            for nama, waktu in record["fase"].items():
+                telemetri.tambah_fase(record["halaman"], nama, waktu["wall"], waktu["cpu"])
+            telemetri.catat_render(record)
+            cache_terakhir[record.get("pid")] = record.get("cache", {})
+    data = telemetri.snapshot()
+    for cache in cache_terakhir.values():
+        for name, counts in cache.items():
+            total = data["cache"].setdefault(name, {})
+            for hasil, n in counts.items():
+                total[hasil] = total.get(hasil, 0) + n
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ringkas log metrik JSON dashboard TKDD.")
+    parser.add_argument("log", nargs="?", default=LOG_PATH, help="berkas log (default: $TKDD_METRICS_LOG)")
+    parser.add_argument("--format", choices=("prometheus", "json"), default="prometheus")
+    args = parser.parse_args(argv)
+    if args.log is None:
+        parser.error("berkas log tidak diberikan dan TKDD_METRICS_LOG kosong")
+
+    data = dari_log(args.log)
+    if args.format == "json":
+        print(json.dumps({key: value for key, value in data.items() if key != "riwayat"}, indent=2, ensure_ascii=False))
+    else:
+        sys.stdout.write(prometheus(data))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
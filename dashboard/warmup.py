@@ -0,0 +1,223 @@
+"""Pemanasan cache: pipeline data, model, dan gambar setiap halaman dijalankan tanpa browser.
+
+Setiap halaman di ``dashboard.pages.PAGES`` dirender di thread pool tanpa
+sesi Streamlit ("bare mode"): perintah ``st`` tidak mengirim apa pun,
+widget mengembalikan nilai default, tetapi dataset, panel wilayah, kubus
+statistik, model OLS, inferensi, dan gambar (backend default) terhitung
+dan masuk cache. Tampilan default itulah yang dilihat pengunjung pertama.
+
+Dua cara pakai:
+
+* Di proses server: ``app.py`` memanggil ``mulai()`` pada rerun pertama;
+  pemanasan berjalan sekali per proses di thread latar belakang dan
+  statusnya tampil di halaman Instrumentasi Server. Penanda siap
+  (``Output/cache/warmup.json``) dihapus saat pemanasan dimulai dan ditulis
+  proses server itu sendiri setelah selesai (waktu, durasi, dan halaman
+  yang gagal), sehingga health check mencerminkan proses yang melayani.
+  ``TKDD_WARMUP=0`` menonaktifkannya.
+* Saat container start / health check::
+
+      python -m dashboard.warmup            # panaskan tanpa server, tulis penanda siap, exit 1 bila gagal
+      python -m dashboard.warmup --status   # exit 0 hanya bila penanda siap ada dan siap
+
+  Berkas bertipe, cache statistik/inferensi, dan batas wilayah tersimpan
+  di disk. Model dan gambar hanya terbawa ke proses server bila cache
+  bersama aktif (``TKDD_CACHE_STORE``, lihat ``dashboard.cachestore``).
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from dashboard.config import CACHE_DIR
+
+STATUS_PATH = CACHE_DIR / "warmup.json"
+
+DEFAULT_WORKERS = int(os.environ.get("TKDD_WARMUP_WORKERS", "4"))
+
+AKTIF = os.environ.get("TKDD_WARMUP", "1") != "0"
+
+# Logger yang memperingatkan setiap perintah st tanpa ScriptRunContext
+_LOGGER_KONTEKS = "streamlit.runtime.scriptrunner.script_run_context"
+
+
+@dataclass
+class HasilHalaman:
+    judul: str
+    detik: float
+    galat: Optional[str] = None
+
+
+class Pemanasan:
+    """Status satu putaran pemanasan; ``siap`` bila semua halaman selesai tanpa galat."""
+
+    def __init__(self, judul):
+        self.judul = tuple(judul)
+        self.hasil = {}
+        self.mulai = None
+        self.selesai = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def berjalan(self):
+        return self.mulai is not None and not self._done.is_set()
+
+    @property
+    def siap(self):
+        with self._lock:
+            return self._done.is_set() and all(h.galat is None for h in self.hasil.values())
+
+    def tunggu(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def _catat(self, hasil):
+        with self._lock:
+            self.hasil[hasil.judul] = hasil
+
+    def status(self):
+        with self._lock:
+            hasil = [asdict(self.hasil[judul]) for judul in self.judul if judul in self.hasil]
+        return {
+            "siap": self.siap,
+            "berjalan": self.berjalan,
+            "pid": os.getpid(),
+            "mulai": self.mulai,
+            "selesai": self.selesai,
+            "durasi": (self.selesai or time.time()) - self.mulai if self.mulai else None,
+            "halaman": hasil,
+        }
+
+
+def _halaman(judul, backend):
+    import streamlit as st
+
+    from dashboard import pages
+    from dashboard.backends import get_backend
+
+    def tampilkan_gambar(chart, data, **params):
+        get_backend(backend).show(st, chart, data, **params)
+
+    start = time.perf_counter()
+    try:
+        pages.preload(judul)
+        pages.render(judul, st, tampilkan_gambar)
+    except Exception as exc:
+        # Galat satu halaman dilaporkan; halaman lain tetap dipanaskan
+        return HasilHalaman(judul, time.perf_counter() - start, f"{type(exc).__name__}: {exc}")
+    return HasilHalaman(judul, time.perf_counter() - start)
+
+
+def _hapus_status(path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _jalankan(pemanasan, workers, backend, output=STATUS_PATH):
+    pemanasan.mulai = time.time()
+    logger = logging.getLogger(_LOGGER_KONTEKS)
+    level = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="warmup") as pool:
+            for hasil in pool.map(lambda judul: _halaman(judul, backend), pemanasan.judul):
+                pemanasan._catat(hasil)
+    finally:
+        logger.setLevel(level)
+        pemanasan.selesai = time.time()
+        pemanasan._done.set()
+        if output is not None:
+            try:
+                tulis_status(pemanasan.status(), output)
+            except OSError:
+                pass
+    return pemanasan
+
+
+def jalankan(judul=None, workers=DEFAULT_WORKERS, backend=None, output=STATUS_PATH):
+    """Panaskan halaman ``judul`` (default semua) dan tunggu sampai selesai; kembalikan ``Pemanasan``.
+
+    Penanda siap di ``output`` dihapus dulu lalu ditulis setelah selesai (``None``: tanpa penanda).
+    """
+    from dashboard.pages import PAGES
+
+    if output is not None:
+        _hapus_status(output)
+    return _jalankan(Pemanasan(judul or PAGES), workers, backend, output)
+
+
+_global = None
+_lock = threading.Lock()
+
+
+def mulai(workers=DEFAULT_WORKERS, backend=None):
+    """Mulai pemanasan semua halaman di thread latar belakang, sekali per proses; kembalikan ``Pemanasan``."""
+    global _global
+    from dashboard.pages import PAGES
+
+    if not AKTIF:
+        return None
+    with _lock:
+        if _global is None:
+            _global = Pemanasan(PAGES)
+            # Penanda lama (proses sebelumnya atau CLI) dihapus sebelum pemanasan proses ini dimulai
+            _hapus_status(STATUS_PATH)
+            threading.Thread(target=_jalankan, args=(_global, workers, backend),
+                             name="warmup", daemon=True).start()
+        return _global
+
+
+def status():
+    """Status pemanasan di proses ini, atau None bila belum dimulai."""
+    return _global.status() if _global is not None else None
+
+
+def tulis_status(data, path=STATUS_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+    tmp_path.replace(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Panaskan cache semua halaman dashboard TKDD.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--backend", help="backend grafik (default: TKDD_CHART_BACKEND atau matplotlib)")
+    parser.add_argument("--status", action="store_true", help="hanya periksa penanda siap (untuk health check)")
+    parser.add_argument("--output", default=str(STATUS_PATH), help="berkas penanda siap (JSON)")
+    args = parser.parse_args(argv)
+    output = Path(args.output)
+
+    if args.status:
+        try:
+            data = json.loads(output.read_text())
+        except (OSError, ValueError):
+            print("BELUM SIAP: penanda pemanasan tidak ada")
+            return 1
+        print(("SIAP" if data.get("siap") else "BELUM SIAP") + f" (pemanasan {data.get('durasi', 0):.1f} s)")
+        return 0 if data.get("siap") else 1
+
+    # Tanpa sesi Streamlit, peringatan bare mode tidak relevan
+    from streamlit import config
+    from streamlit.logger import set_log_level
+
+    config.set_option("global.showWarningOnDirectExecution", False)
+    set_log_level("error")
+    pemanasan = jalankan(workers=args.workers, backend=args.backend, output=output)
+    data = pemanasan.status()
+    for hasil in data["halaman"]:
+        print(f"{hasil['detik']:>7.2f} s  {hasil['judul']}" + (f"  GAGAL {hasil['galat']}" if hasil["galat"] else ""))
+    print(f"{data['durasi']:>7.2f} s  total ({args.workers} worker)")
+    return 0 if data["siap"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,29 @@
+import geopandas as gpd
+import pytest
+import shapely
+
+from dashboard import boundaries, geometry
+
+
+def tulis_geojson(path, nama, ukuran=0.5):
+    """GeoJSON lingkaran berjajar, satu per nama provinsi."""
+    gdf = gpd.GeoDataFrame({"PROVINSI": nama},
+                           geometry=[shapely.Point(i * 2, 0).buffer(ukuran) for i in range(len(nama))],
+                           crs="EPSG:4326")
+    gdf.to_file(path, driver="GeoJSON")
+    return path
+
+
+@pytest.fixture
+def penyimpanan_batas(tmp_path, monkeypatch):
+    """Penyimpanan batas wilayah di folder sementara, tanpa unduhan; cache dikosongkan."""
+    store_dir = tmp_path / "geo"
+    monkeypatch.setattr(boundaries, "STORE_DIR", store_dir)
+    monkeypatch.setattr(boundaries, "STORE_PATH", store_dir / "provinsi_38.parquet")
+    monkeypatch.setattr(boundaries, "MANIFEST_PATH", store_dir / "provinsi_38.json")
+    monkeypatch.setattr(boundaries, "UNDUH_PERTAMA", False)
+    boundaries._load_boundaries.cache_clear()
+    geometry._tiers.cache_clear()
+    yield tmp_path
+    boundaries._load_boundaries.cache_clear()
+    geometry._tiers.cache_clear()
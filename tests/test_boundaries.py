@@ -0,0 +1,64 @@
+import pytest
+
+from dashboard import boundaries
+
+from conftest import tulis_geojson
+
+
+def test_muat_dari_penyimpanan_lokal(penyimpanan_batas):
+    boundaries.build_store(tulis_geojson(penyimpanan_batas / "prov.json", ["ACEH", "BALI"]))
+    assert boundaries.verify_store()
+    manifest = boundaries.read_manifest()
+    assert (manifest["rows"], manifest["version"]) == (2, boundaries.STORE_VERSION)
+
+    gdf = boundaries.load_boundaries()
+    assert list(gdf["PROVINSI"]) == ["ACEH", "BALI"]
+    # Dimuat sekali per proses dan dibagi ke semua pemanggil
+    assert boundaries.load_boundaries() is gdf
+    assert boundaries._load_boundaries.cache_info().hits == 1
+
+
+def test_tanpa_penyimpanan_galat_diingat(penyimpanan_batas):
+    for _ in range(3):
+        with pytest.raises(boundaries.BoundaryStoreError, match="belum tersedia secara lokal"):
+            boundaries.load_boundaries()
+    info = boundaries._load_boundaries.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_unduhan_pertama_membangun_penyimpanan(penyimpanan_batas, monkeypatch):
+    sumber = tulis_geojson(penyimpanan_batas / "unduhan.json", ["ACEH", "BALI", "JAMBI"])
+    monkeypatch.setattr(boundaries, "UNDUH_PERTAMA", True)
+    monkeypatch.setattr(boundaries, "GEOJSON_URL", str(sumber))
+    assert len(boundaries.load_boundaries()) == 3
+    assert boundaries.verify_store()
+    assert boundaries.read_manifest()["source"] == str(sumber)
+
+
+def test_unduhan_pertama_gagal_sekali_saja(penyimpanan_batas, monkeypatch):
+    panggilan = []
+
+    def gagal(source, timeout):
+        panggilan.append(timeout)
+        raise OSError("jaringan tidak tersedia")
+
+    monkeypatch.setattr(boundaries, "UNDUH_PERTAMA", True)
+    monkeypatch.setattr(boundaries, "build_store", gagal)
+    for _ in range(3):
+        with pytest.raises(boundaries.BoundaryStoreError, match="unduhan pertama gagal"):
+            boundaries.load_boundaries()
+    assert panggilan == [boundaries.DOWNLOAD_TIMEOUT]
+
+
+def test_checksum_tidak_cocok(penyimpanan_batas):
+    boundaries.build_store(tulis_geojson(penyimpanan_batas / "prov.json", ["ACEH"]))
+    with open(boundaries.STORE_PATH, "ab") as f:
+        f.write(b"rusak")
+    assert not boundaries.verify_store()
+    with pytest.raises(boundaries.BoundaryStoreError, match="Checksum"):
+        boundaries.load_boundaries()
+
+
+def test_cli_gagal_mengembalikan_1(penyimpanan_batas, capsys):
+    assert boundaries.main(["--source", str(penyimpanan_batas / "tidak-ada.json")]) == 1
+    assert "GAGAL" in capsys.readouterr().out
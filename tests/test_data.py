@@ -0,0 +1,18 @@
+import pandas as pd
+
+from dashboard import data
+
+
+def test_impor_tidak_mengubah_opsi_pandas():
+    assert pd.get_option("mode.copy_on_write") is False
+
+
+def test_kolom_baru_tidak_masuk_salinan_bersama():
+    df = data.get_dataset("tkdd")
+    ipm = df["IPM"].copy()
+    df["Kolom Uji"] = 1.0
+    df = df.assign(IPM=0.0)
+    bersama = data.get_dataset("tkdd")
+    assert "Kolom Uji" not in bersama.columns
+    pd.testing.assert_series_equal(bersama["IPM"], ipm)
+    assert data.dataset_version("tkdd") == data.fingerprint(bersama)
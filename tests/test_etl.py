@@ -0,0 +1,31 @@
+import pytest
+
+from dashboard import data, etl
+
+
+@pytest.fixture(scope="module")
+def frames():
+    if not data.DATASETS["mentah"].path.exists():
+        pytest.skip("workbook mentah tidak tersedia")
+    return etl.transform()
+
+
+@pytest.mark.parametrize("name", etl.KELUARAN)
+def test_etl_identik_dengan_csv_di_commit(frames, name):
+    assert etl.isi_csv(frames[name]) == data.DATASETS[name].path.read_bytes()
+
+
+def test_etl_per_potongan_sama_dengan_sekaligus(frames):
+    kecil = etl.transform(chunk=7)
+    for name in etl.KELUARAN:
+        assert etl.isi_csv(kecil[name]) == etl.isi_csv(frames[name])
+
+
+def test_kategori():
+    realisasi = etl.kategori_realisasi([89.99, 90, 100, 100.01, float("nan")])
+    assert list(realisasi.astype(object)[:4]) == ["<90%", "90-100%", "90-100%", ">100%"]
+    assert realisasi.isna()[4]
+    assert list(realisasi.categories) == list(data.URUTAN_REALISASI)
+    ipm = etl.kategori_ipm([59.9, 60, 70, 80, float("nan")])
+    assert list(ipm.astype(object)[:4]) == ["Rendah", "Sedang", "Tinggi", "Sangat Tinggi"]
+    assert ipm.isna()[4]
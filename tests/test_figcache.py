@@ -0,0 +1,71 @@
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import charts, figcache
+from dashboard.data import fingerprint
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"Provinsi": ["ACEH", "BALI", "BANTEN"], "Nilai": [1.0, 2.5, np.nan]})
+
+
+def _key(df, **params):
+    return figcache.cache_key(charts.realisasi_barh, df, params, "png")
+
+
+def test_kunci_tetap_untuk_masukan_sama(df):
+    assert _key(df, tahun=2023) == _key(df.copy(), tahun=2023)
+
+
+def test_kunci_berubah_bila_data_berubah(df):
+    ubah = df.copy()
+    ubah.loc[1, "Nilai"] = 2.6
+    assert _key(ubah) != _key(df)
+    assert _key(df.iloc[::-1]) != _key(df)
+    assert _key(df.astype({"Nilai": "float32"})) != _key(df)
+
+
+def test_kunci_berubah_bila_parameter_atau_format_berubah(df):
+    assert _key(df, tahun=2023) != _key(df, tahun=2024)
+    assert _key(df, tahun=2023) != _key(df, tahun=2023, show_labels=True)
+    assert figcache.cache_key(charts.realisasi_barh, df, {}, "svg") != _key(df)
+    assert figcache.cache_key(charts.grouped_bar, df, {}, "png") != _key(df)
+
+
+def test_kunci_berubah_bila_tema_berubah(df):
+    before = _key(df)
+    with matplotlib.rc_context({"font.size": matplotlib.rcParams["font.size"] + 1}):
+        assert _key(df) != before
+    assert _key(df) == before
+
+
+def test_fingerprint_indeks_dan_nama_kolom(df):
+    assert fingerprint(df) == fingerprint(df.copy())
+    assert fingerprint(df.set_axis([5, 6, 7])) != fingerprint(df)
+    assert fingerprint(df.rename(columns={"Nilai": "Lain"})) != fingerprint(df)
+
+
+def test_lru_dibatasi_ukuran_byte():
+    cache = figcache.FigureCache(memory_bytes=10)
+    cache.put("a", "png", b"1234")
+    cache.put("b", "png", b"1234")
+    assert cache.get("a", "png") == b"1234"
+    # "b" paling lama tidak dipakai sehingga dikeluarkan lebih dulu
+    cache.put("c", "png", b"1234")
+    assert cache.get("b", "png") is None
+    assert cache.get("a", "png") == b"1234"
+    cache.put("besar", "png", b"x" * 11)
+    assert cache.get("besar", "png") is None
+    stats = cache.stats()
+    assert stats["bytes"] <= 10
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+
+def test_tingkat_disk(tmp_path):
+    figcache.FigureCache(memory_bytes=100, disk_dir=tmp_path).put("k", "png", b"gambar")
+    baru = figcache.FigureCache(memory_bytes=100, disk_dir=tmp_path)
+    assert baru.get("k", "png") == b"gambar"
+    assert baru.stats()["disk_hits"] == 1
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import boundaries, geometry, regions
+
+from conftest import tulis_geojson
+
+
+def _bangun(tmp_path, nama, nama_berkas="prov.json"):
+    boundaries.build_store(tulis_geojson(tmp_path / nama_berkas, nama))
+    # mtime berbeda walau dibangun dalam tik jam yang sama
+    os.utime(boundaries.STORE_PATH, ns=(0, os.stat(boundaries.STORE_PATH).st_mtime_ns + 1_000_000))
+
+
+def test_pick_tolerance_tidak_melebihi_satu_piksel():
+    # 1 derajat per 2800 piksel: hanya 0.001 yang lebih kecil dari satu piksel (~0.00036) -> resolusi penuh
+    assert geometry.pick_tolerance((0, 0, 1, 1), figsize=(14, 10), dpi=200) == 0.0
+    # 50 derajat / 2800 piksel ~ 0.018 derajat per piksel
+    assert geometry.pick_tolerance((95, -11, 145, 6), figsize=(14, 10), dpi=200) == 0.01
+    assert geometry.pick_tolerance((0, 0, 1000, 1000)) == max(geometry.TOLERANCES)
+
+
+def test_tingkat_dibangun_ulang_saat_penyimpanan_berubah(penyimpanan_batas):
+    _bangun(penyimpanan_batas, ["ACEH", "BALI"])
+    tiers = geometry.simplified_tiers()
+    assert set(tiers) == {0.0, *geometry.TOLERANCES}
+    assert list(tiers[0.0].index) == [11, 51]
+    assert geometry.vertex_count(tiers[0.05]) < geometry.vertex_count(tiers[0.0])
+    assert geometry.simplified_tiers() is tiers
+
+    _bangun(penyimpanan_batas, ["ACEH", "BALI", "JAMBI"], "baru.json")
+    assert list(geometry.simplified_tiers()[0.0].index) == [11, 51, 15]
+
+
+def test_join_dengan_kode_ganda_dan_tidak_cocok(penyimpanan_batas):
+    with pytest.warns(regions.RegionKeyWarning):
+        _bangun(penyimpanan_batas, ["ACEH", "ATLANTIS", "BALI", "LEMURIA", "BALI"])
+        gdf = geometry.simplified_tiers()[0.0]
+    assert list(gdf.index) == [11, -1, 51, -1, 51]
+
+    data = pd.DataFrame({"Provinsi": ["BALI", "ACEH", "JAMBI"], "Nilai": [2.0, 1.0, 3.0]})
+    merged, hasil = geometry.join_provinsi(gdf, data)
+    assert list(merged.index) == list(gdf.index)
+    np.testing.assert_array_equal(merged["Nilai"].to_numpy(), [1.0, np.nan, 2.0, np.nan, 2.0])
+    assert hasil.tanpa_peta == ("JAMBI",)
+    assert hasil.tanpa_data == ("ATLANTIS", "LEMURIA")
+    assert merged.crs == gdf.crs
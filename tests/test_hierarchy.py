@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import hierarchy, regions
+
+PERSEN = 'Persentase Realisasi TKDD'
+
+
+@pytest.fixture
+def kabkota():
+    return pd.DataFrame({
+        'Tahun': [2022, 2022, 2022, 2023, 2023, 2023, 2023],
+        'Provinsi': ["ACEH", "ACEH", "BALI", "ACEH", "ACEH", "BALI", "BALI"],
+        'Kabupaten/Kota': ["Banda Aceh", "Sabang", "Denpasar", "Banda Aceh", "Sabang", "Denpasar", "Badung"],
+        'Pagu TKDD': [100.0, 50.0, 80.0, 120.0, 60.0, 90.0, 40.0],
+        'Realisasi TKDD': [90.0, 30.0, 78.0, 100.0, 59.0, 45.0, 40.0],
+    })
+
+
+def test_precompute_per_tahun_terurut(kabkota):
+    panel = hierarchy.precompute(kabkota, 'Provinsi', default_year=2023)
+    assert list(panel) == [2022, 2023]
+
+    tahun_2023 = panel[2023]
+    assert list(tahun_2023['Provinsi']) == ["ACEH", "BALI"]
+    np.testing.assert_allclose(tahun_2023['Pagu TKDD'], [180, 130])
+    np.testing.assert_allclose(tahun_2023[PERSEN], [159 / 180 * 100, 85 / 130 * 100])
+    np.testing.assert_allclose(tahun_2023['Pagu (%)'] + tahun_2023['Realisasi (%)'], 100)
+    np.testing.assert_array_equal(tahun_2023[regions.KODE_PROVINSI], [11, 51])
+    assert panel[2022][PERSEN].is_monotonic_decreasing
+
+
+def test_precompute_tanpa_kolom_tahun(kabkota):
+    panel = hierarchy.precompute(kabkota.drop(columns='Tahun'), hierarchy.KOLOM_KABKOTA, default_year=2023)
+    assert list(panel) == [2023]
+    assert len(panel[2023]) == 4
+    assert panel[2023][PERSEN].is_monotonic_decreasing
+
+
+def test_drill_down(kabkota):
+    panel = hierarchy.precompute(kabkota, hierarchy.KOLOM_KABKOTA, default_year=2023)
+    bali = hierarchy.drill_down(panel[2023], "BALI")
+    assert list(bali[hierarchy.KOLOM_KABKOTA]) == ["Badung", "Denpasar"]
+    assert list(bali.index) == [0, 1]
+
+
+def test_top_bottom_baris_lainnya():
+    n_wilayah = 9
+    pagu = np.arange(1, n_wilayah + 1) * 100.0
+    df = hierarchy.tambah_persentase(pd.DataFrame({
+        'Provinsi': [f"P{i}" for i in range(n_wilayah)],
+        'Pagu TKDD': pagu,
+        'Realisasi TKDD': pagu * np.linspace(0.99, 0.5, n_wilayah),
+    }))
+
+    hasil = hierarchy.top_bottom(df, 2, 'Provinsi')
+    assert list(hasil['Provinsi']) == ["P0", "P1", "Lainnya (5 wilayah)", "P7", "P8"]
+    tengah = df.iloc[2:7]
+    lainnya = hasil.iloc[2]
+    assert lainnya['Pagu TKDD'] == tengah['Pagu TKDD'].sum()
+    assert lainnya['Realisasi TKDD'] == tengah['Realisasi TKDD'].sum()
+    # Persentase dari total gabungan, bukan rata-rata persentase
+    assert lainnya[PERSEN] == pytest.approx(tengah['Realisasi TKDD'].sum() / tengah['Pagu TKDD'].sum() * 100)
+
+    assert hierarchy.top_bottom(df, 4, 'Provinsi') is df
@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+from scipy.stats import chi2_contingency
+
+from dashboard import inference
+
+
+@pytest.fixture
+def tabel_2x2(monkeypatch):
+    df = pd.DataFrame({"a": list("xxxxyyyyyyxy"), "b": list("ppqqppppqqqp")})
+    monkeypatch.setattr(inference, "get_dataset", lambda name: df)
+    return df
+
+
+def test_p_asimtotik_sama_dengan_uji_di_halaman(tabel_2x2):
+    spec = inference.UjiSpec(name="uji", dataset="all", kind="chi2", x="a", y="b", replikasi=1000)
+    hasil = inference._hitung(spec, "v")
+    # Halaman memakai chi2_contingency bawaan (dengan koreksi Yates untuk 2x2)
+    assert hasil.p_asimtotik == pytest.approx(chi2_contingency(pd.crosstab(tabel_2x2["a"], tabel_2x2["b"]))[1])
+    assert "koreksi Yates" in " ".join(hasil.ringkasan())
+
+
+def test_tanpa_koreksi_yates(tabel_2x2):
+    spec = inference.UjiSpec(name="uji", dataset="all", kind="chi2", x="a", y="b", replikasi=1000, yates=False)
+    hasil = inference._hitung(spec, "v")
+    tabel = pd.crosstab(tabel_2x2["a"], tabel_2x2["b"])
+    assert hasil.p_asimtotik == pytest.approx(chi2_contingency(tabel, correction=False)[1])
+    assert hasil.statistik == pytest.approx(chi2_contingency(tabel, correction=False)[0])
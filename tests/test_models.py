@@ -0,0 +1,92 @@
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+from dashboard import cachestore, models
+
+SPEC = models.ModelSpec(
+    name="uji",
+    dataset="uji",
+    target="Y",
+    predictors=("Rupiah", "Penduduk", "Persen"),
+    log_columns=("Penduduk",),
+)
+
+
+def _frame(seed=0, n=34):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Provinsi": [f"P{i:02d}" for i in range(n)],
+        # Skala rupiah membuat desain mentah berkondisi buruk
+        "Rupiah": rng.uniform(1e12, 5e13, n),
+        "Penduduk": rng.uniform(1e6, 5e7, n),
+        "Persen": rng.uniform(5, 25, n),
+    })
+    df["Y"] = 3e-13 * df["Rupiah"] + 2 * np.log(df["Penduduk"]) - 0.4 * df["Persen"] + rng.normal(size=n)
+    df.loc[5, "Persen"] = np.nan
+    return df
+
+
+@pytest.fixture
+def dataset(monkeypatch):
+    state = {"df": _frame(), "versi": "v1"}
+    monkeypatch.setattr(models, "get_dataset", lambda name: state["df"])
+    monkeypatch.setattr(models, "dataset_version", lambda name: state["versi"])
+    monkeypatch.setattr(cachestore, "get_store", lambda: None)
+    models.clear_cache()
+    yield state
+    models.clear_cache()
+
+
+def _statsmodels(df, cov_type="nonrobust"):
+    frame = df[["Y", "Rupiah", "Penduduk", "Persen"]].dropna()
+    X = frame[["Rupiah", "Penduduk", "Persen"]].assign(Penduduk=np.log(frame["Penduduk"]))
+    return sm.OLS(frame["Y"], sm.add_constant(X)).fit(cov_type=cov_type)
+
+
+@pytest.mark.parametrize("cov_type", ["nonrobust", "HC3"])
+def test_fit_terstandar_sama_dengan_statsmodels_mentah(dataset, cov_type):
+    spec = dataclasses.replace(SPEC, cov_type=cov_type)
+    hasil = models.fit(spec)
+    acuan = _statsmodels(dataset["df"], cov_type)
+
+    assert hasil.nobs == 33
+    assert "P05" not in hasil.labels
+    for nama in ("params", "bse", "tvalues", "pvalues"):
+        pd.testing.assert_series_equal(getattr(hasil, nama), getattr(acuan, nama), check_names=False, rtol=1e-6)
+    np.testing.assert_allclose(hasil.cov.to_numpy(), acuan.cov_params().to_numpy(), rtol=1e-6)
+    assert hasil.rsquared == pytest.approx(acuan.rsquared)
+    assert hasil.aic == pytest.approx(acuan.aic)
+
+    influence = acuan.get_influence()
+    np.testing.assert_allclose(hasil.leverage, influence.hat_matrix_diag, rtol=1e-6)
+    np.testing.assert_allclose(hasil.cooks_distance, influence.cooks_distance[0], rtol=1e-6)
+
+
+def test_fit_di_cache_per_versi(dataset):
+    hasil = models.fit(SPEC)
+    assert models.fit(SPEC) is hasil
+
+    dataset["df"] = _frame(seed=1)
+    dataset["versi"] = "v2"
+    baru = models.fit(SPEC)
+    assert baru is not hasil
+    assert baru.version == "v2"
+    assert not np.allclose(baru.params, hasil.params)
+
+
+def test_serialisasi_bolak_balik(dataset):
+    hasil = models.fit(SPEC)
+    salinan = models.dari_bytes(models.ke_bytes(hasil), SPEC, hasil.version)
+    pd.testing.assert_series_equal(salinan.params, hasil.params)
+    pd.testing.assert_series_equal(salinan.vif, hasil.vif)
+    pd.testing.assert_frame_equal(salinan.cov, hasil.cov)
+    np.testing.assert_array_equal(salinan.cooks_distance, hasil.cooks_distance)
+    assert salinan.labels == hasil.labels
+    assert salinan.aic == hasil.aic
+
+    with pytest.raises(ValueError):
+        models.dari_bytes(b"bukan npz", SPEC, hasil.version)
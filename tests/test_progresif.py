@@ -0,0 +1,101 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from dashboard import figcache, progresif
+from dashboard.backends import BACKENDS
+
+
+class Slot:
+    def __init__(self, log, nomor):
+        self.log = log
+        self.nomor = nomor
+
+    def caption(self, teks):
+        self.log.append(("caption", self.nomor, teks))
+
+    def image(self, image, use_column_width=False):
+        self.log.append(("image", self.nomor, image))
+
+
+class StPalsu:
+    """Pengganti ``st`` yang mencatat urutan perintah."""
+
+    def __init__(self):
+        self.log = []
+        self._slot = 0
+
+    def empty(self):
+        self._slot += 1
+        return Slot(self.log, self._slot)
+
+    def markdown(self, teks):
+        self.log.append(("markdown", None, teks))
+
+    def altair_chart(self, spec, use_container_width=False):
+        self.log.append(("altair", None, spec))
+
+
+@pytest.fixture
+def korelasi():
+    return pd.DataFrame({"Korelasi": [0.8, -0.3, 0.1]}, index=["A", "B", "C"])
+
+
+def test_teks_tampil_sebelum_grafik_selesai(monkeypatch):
+    lanjut = {1: threading.Event(), 2: threading.Event()}
+
+    def render(chart, data, **params):
+        lanjut[data].wait(5)
+        return f"png-{data}".encode()
+
+    monkeypatch.setattr(BACKENDS["matplotlib"], "render", render)
+    st = StPalsu()
+    bertahap = progresif.RenderBertahap(st, backend="matplotlib")
+    bertahap.tampilkan("grouped_bar", 1)
+    bertahap.tampilkan("grouped_bar", 2)
+    # Skrip halaman berlanjut walaupun kedua grafik belum selesai
+    st.markdown("Kesimpulan")
+    assert st.log == [
+        ("caption", 1, "Memuat grafik..."),
+        ("caption", 2, "Memuat grafik..."),
+        ("markdown", None, "Kesimpulan"),
+    ]
+
+    # Grafik kedua selesai lebih dulu dan mengisi placeholder-nya lebih dulu
+    lanjut[2].set()
+    threading.Timer(0.1, lanjut[1].set).start()
+    bertahap.selesaikan()
+    assert st.log[3:] == [("image", 2, b"png-2"), ("image", 1, b"png-1")]
+
+
+def test_gambar_sama_dengan_cache_gambar(korelasi):
+    from dashboard import charts
+
+    st = StPalsu()
+    bertahap = progresif.RenderBertahap(st, backend="matplotlib")
+    bertahap.tampilkan("korelasi_heatmap", korelasi, title="Uji")
+    bertahap.selesaikan()
+    [(jenis, _, image)] = st.log[1:]
+    assert jenis == "image"
+    assert image == figcache.render(charts.korelasi_heatmap, korelasi, title="Uji")
+
+
+def test_vega_lite_langsung_ditampilkan(korelasi):
+    st = StPalsu()
+    bertahap = progresif.RenderBertahap(st, backend="vega-lite")
+    bertahap.tampilkan("korelasi_heatmap", korelasi, title="Uji")
+    assert [jenis for jenis, _, _ in st.log] == ["altair"]
+    bertahap.selesaikan()
+    assert len(st.log) == 1
+
+
+def test_galat_render_diteruskan(monkeypatch):
+    def render(chart, data, **params):
+        raise ValueError("gagal render")
+
+    monkeypatch.setattr(BACKENDS["matplotlib"], "render", render)
+    bertahap = progresif.RenderBertahap(StPalsu(), backend="matplotlib")
+    bertahap.tampilkan("grouped_bar", None)
+    with pytest.raises(ValueError, match="gagal render"):
+        bertahap.selesaikan()
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from dashboard import refresh
+
+
+def _frame():
+    return pd.DataFrame({
+        "Provinsi": ["ACEH", "BALI", "BANTEN", "JAMBI"],
+        "IPM": [74.7, 78.0, 75.8, np.nan],
+        "Pagu TKDD": [3.0, 1.1, 2.2, 1.5],
+    })
+
+
+def test_row_diff_tanpa_perubahan():
+    assert refresh.row_diff(_frame(), _frame(), ["Provinsi"]) == ((), (), (), ())
+
+
+def test_row_diff_baris_dan_kolom_berubah():
+    old = _frame()
+    new = old.copy()
+    new.loc[1, "Pagu TKDD"] = 1.2
+    # NaN ke NaN bukan perubahan
+    new.loc[3, "IPM"] = np.nan
+    new = pd.concat([new.drop(index=2), pd.DataFrame({"Provinsi": ["RIAU"], "IPM": [73.0], "Pagu TKDD": [2.0]})])
+    added, removed, changed, columns = refresh.row_diff(old, new, ["Provinsi"])
+    assert added == (("RIAU",),)
+    assert removed == (("BANTEN",),)
+    assert changed == (("BALI",),)
+    assert columns == ("Pagu TKDD",)
+
+
+def test_row_diff_tidak_bergantung_urutan_baris():
+    old = _frame()
+    assert refresh.row_diff(old, old.iloc[::-1], ["Provinsi"]) == ((), (), (), ())
+
+
+def test_row_diff_kunci_majemuk_dan_kolom_baru():
+    old = _frame().assign(Tahun=2023)
+    new = old.assign(Baru=1.0)
+    new.loc[0, "IPM"] = 75.0
+    added, removed, changed, columns = refresh.row_diff(old, new, ["Provinsi", "Tahun"])
+    assert (added, removed) == ((), ())
+    assert set(changed) == {(name, 2023) for name in old["Provinsi"]}
+    assert columns == ("IPM", "Pagu TKDD", "Baru")
+
+
+def test_perubahan_key_values():
+    change = refresh.Perubahan("tkdd", "a", "b", ("Provinsi",), (("RIAU",),), (), (("BALI",),), ("IPM",))
+    assert not change.rows_same
+    assert change.key_values("Provinsi") == {"RIAU", "BALI"}
@@ -0,0 +1,41 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from dashboard import regions
+
+
+@pytest.fixture
+def index():
+    return regions.RegionIndex()
+
+
+def test_normalize():
+    assert regions.normalize("Prov. Kep. Bangka-Belitung") == "KEPULAUAN BANGKA BELITUNG"
+    assert regions.normalize("  d.i. yogyakarta ") == "D I YOGYAKARTA"
+
+
+def test_encode_baku_alias_dan_fuzzy(index):
+    kode = index.encode(["ACEH", "Jawa Barat", "DIY", "Kep. Riau", "ACEH", "JAWA TENGAHH"])
+    np.testing.assert_array_equal(kode, [11, 32, 34, 21, 11, 33])
+    assert kode.dtype == np.int64
+    assert index.fuzzy == {"JAWA TENGAHH": "JAWA TENGAH"}
+
+
+def test_encode_tidak_cocok_diperingatkan(index):
+    with pytest.warns(regions.RegionKeyWarning, match="ATLANTIS"):
+        kode = index.encode(["BALI", "ATLANTIS", None], sumber="uji")
+    np.testing.assert_array_equal(kode, [51, regions.TIDAK_COCOK, regions.TIDAK_COCOK])
+    assert index.tidak_cocok == {"ATLANTIS": "uji"}
+    assert list(index.laporan()["Nama"]) == ["ATLANTIS"]
+
+
+def test_encode_kabkota(index):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        prov = index.encode(["ACEH", "ACEH", "BALI", "ACEH"])
+    kode = index.encode_kabkota(prov, ["Kab. Aceh Besar", "KABUPATEN ACEH BESAR", "Kab. Badung", "Kota Banda Aceh"])
+    assert kode[0] == kode[1] == regions.kode_kabkota(11, "KABUPATEN ACEH BESAR")
+    assert len(set(kode)) == 3
+    assert (kode // 10 ** 10).tolist() == [11, 11, 51, 11]
@@ -0,0 +1,51 @@
+import hashlib
+import json
+
+from dashboard import report
+
+from conftest import tulis_geojson
+
+
+def _manifest(out_dir):
+    return json.loads((out_dir / "manifest.json").read_text())
+
+
+def test_tanpa_batas_wilayah_peta_dilewati(penyimpanan_batas, tmp_path):
+    out_dir = tmp_path / "laporan"
+    assert report.main(["--dataset", "tkdd", "--halaman", "perbandingan", "--format", "png",
+                        "--jobs", "1", "--output", str(out_dir)]) == 0
+
+    manifest = _manifest(out_dir)
+    charts = [entry["chart"] for entry in manifest["grafik"]]
+    assert charts == ["grouped_bar", "stacked_bar"]
+    assert manifest["format"] == ["png"]
+    assert manifest["jumlah_berkas"] == manifest["jumlah_grafik"] == 2
+    assert set(manifest["dataset"]) == {"tkdd"}
+    [lewat] = manifest["dilewati"]
+    assert (lewat["chart"], lewat["halaman"], lewat["tahun"]) == ("choropleth", "perbandingan", [2023])
+    assert "belum tersedia" in lewat["alasan"]
+
+
+def test_berkas_sesuai_checksum_manifest(penyimpanan_batas, tmp_path):
+    from dashboard import boundaries
+
+    boundaries.build_store(tulis_geojson(penyimpanan_batas / "prov.json", ["ACEH", "BALI", "PAPUA"]))
+    out_dir = tmp_path / "laporan"
+    dilewati = []
+    jobs = report.build_jobs("tkdd", "Provinsi", halaman=["perbandingan"], dilewati=dilewati)
+    assert dilewati == []
+    assert [job.chart for job in jobs] == ["grouped_bar", "stacked_bar", "choropleth"]
+
+    entries = report.render_all(jobs, out_dir, ["png", "svg"], workers=1)
+    report.write_manifest(out_dir, entries, ["tkdd"], ["png", "svg"], 1.0)
+    manifest = _manifest(out_dir)
+    assert manifest["jumlah_grafik"] == 3
+    assert manifest["jumlah_berkas"] == 6
+    assert manifest["dilewati"] == []
+    for entry in manifest["grafik"]:
+        assert entry["tahun"] == 2023 and entry["wilayah"] == report.NASIONAL
+        for berkas in entry["files"]:
+            isi = (out_dir / berkas["path"]).read_bytes()
+            assert berkas["bytes"] == len(isi)
+            assert berkas["sha256"] == hashlib.sha256(isi).hexdigest()
+    assert (out_dir / "2023" / "nasional" / "perbandingan" / "choropleth.svg").exists()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from dashboard import selection
+
+
+def _brute_force(W, p):
+    y = W[:, -1]
+    rss = np.empty(2 ** p)
+    coef = np.full((2 ** p, p + 1), np.nan)
+    for mask in range(2 ** p):
+        cols = [0, *(j + 1 for j in range(p) if mask >> j & 1)]
+        beta, *_ = np.linalg.lstsq(W[:, cols], y, rcond=None)
+        rss[mask] = np.sum((y - W[:, cols] @ beta) ** 2)
+        coef[mask, cols] = beta
+    return rss, coef
+
+
+@pytest.fixture
+def W():
+    rng = np.random.default_rng(1)
+    n, p = 25, 4
+    X = rng.normal(size=(n, p))
+    y = X @ rng.normal(size=p) + rng.normal(scale=0.5, size=n)
+    return np.column_stack([np.ones(n), X, y])
+
+
+def test_gray_path_mengunjungi_semua_subset_sekali():
+    masks = [mask for _, mask in selection.gray_path(5)]
+    assert sorted(masks) == list(range(1, 2 ** 5))
+    # Setiap langkah hanya mengubah satu prediktor
+    for (bit, mask), sebelum in zip(selection.gray_path(5), [0, *masks]):
+        assert mask ^ sebelum == 1 << bit
+
+
+def test_rss_semua_subset_sama_dengan_lstsq(W):
+    p = W.shape[1] - 2
+    rss, tss, coef = selection.semua_subset(W)
+    expected_rss, expected_coef = _brute_force(W, p)
+    np.testing.assert_allclose(rss[0], expected_rss, rtol=1e-9)
+    np.testing.assert_allclose(coef[0], expected_coef, rtol=1e-8, atol=1e-10)
+    assert tss[0] == pytest.approx(np.sum((W[:, -1] - W[:, -1].mean()) ** 2))
+
+
+def test_downdate_tanpa_setiap_baris(W):
+    p = W.shape[1] - 2
+    rss, tss, coef = selection.semua_subset(W)
+    assert rss.shape == (len(W) + 1, 2 ** p)
+    for i in (0, 7, len(W) - 1):
+        tanpa = np.delete(W, i, axis=0)
+        expected_rss, expected_coef = _brute_force(tanpa, p)
+        np.testing.assert_allclose(rss[i + 1], expected_rss, rtol=1e-8)
+        np.testing.assert_allclose(coef[i + 1], expected_coef, rtol=1e-7, atol=1e-9)
+
+
+def test_pivot_singular_memakai_lstsq(W):
+    # Prediktor terakhir kolinear sempurna dengan yang pertama
+    W = W.copy()
+    W[:, 4] = 2 * W[:, 1]
+    p = W.shape[1] - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rss, _, _ = selection.semua_subset(W)
+    expected_rss, _ = _brute_force(W, p)
+    np.testing.assert_allclose(rss[0], expected_rss, rtol=1e-8)
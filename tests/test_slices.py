@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import data, regions, slices
+
+
+@pytest.fixture(autouse=True)
+def cache_bersih():
+    slices.clear_cache()
+    yield
+    slices.clear_cache()
+
+
+def _harapan(df, pulau, ipm):
+    kode = regions.INDEX.encode(df['Provinsi'])
+    kelompok = pd.Series(kode // 10).map(slices.PULAU).to_numpy()
+    return np.isin(kelompok, pulau) & df['Kategori IPM'].isin(ipm).to_numpy()
+
+
+def test_irisan_dari_query_dan_kembali():
+    irisan = slices.Irisan.dari_query({"pulau": "JAWA,sumatera,atlantis", "ipm": "tinggi", "realisasi": ""})
+    assert irisan.pilihan == (("pulau", ("Sumatera", "Jawa")), ("ipm", ("Tinggi",)))
+    assert slices.Irisan.dari_query(irisan.query()) == irisan
+    # Semua nilai sebuah facet sama dengan tanpa filter
+    assert slices.Irisan.dari_pilihan({"ipm": list(slices.FACETS["ipm"].values)}).kosong
+
+
+def test_mask_sama_dengan_filter_pandas():
+    df = data.get_dataset("all")
+    version = data.dataset_version("all")
+    irisan = slices.Irisan.dari_query({"pulau": "jawa,sumatera", "ipm": "tinggi,sedang"})
+
+    mask = slices.mask("all", df, version, irisan)
+    harapan = _harapan(df, ["Jawa", "Sumatera"], ["Tinggi", "Sedang"])
+    assert harapan.any() and not harapan.all()
+    np.testing.assert_array_equal(mask, harapan)
+    pd.testing.assert_frame_equal(slices.terapkan("all", df, version, irisan), df[harapan])
+
+
+def test_provinsi_dan_kategori_tidak_dikenal_tidak_lolos():
+    df = pd.DataFrame({
+        'Provinsi': ["ACEH", "BALI", "ATLANTIS", "JAWA BARAT"],
+        'Kategori IPM': ["Tinggi", "Tinggi", "Tinggi", None],
+    })
+    with pytest.warns(regions.RegionKeyWarning):
+        codes = slices.kode("uji", df, "v1")
+    np.testing.assert_array_equal(codes["pulau"], [0, 2, -1, 1])
+    assert "realisasi" not in codes
+
+    irisan = slices.Irisan.dari_pilihan({"pulau": ["Sumatera", "Jawa"], "ipm": ["Tinggi"], "realisasi": ["<90%"]})
+    # Facet realisasi tidak punya kolom di dataset ini sehingga diabaikan
+    np.testing.assert_array_equal(slices.mask("uji", df, "v1", irisan), [True, False, False, False])
+
+
+def test_irisan_aktif_memisahkan_versi():
+    base = data.dataset_version("all")
+    irisan = slices.Irisan.dari_query({"pulau": "papua"})
+    with data.irisan_aktif(irisan):
+        version = data.dataset_version("all")
+        df = data.get_dataset("all")
+    assert version == slices.versi(base, irisan) != base
+    assert slices.teriris(version) and not slices.teriris(base)
+    assert slices.versi(base, slices.Irisan()) == base
+    assert len(df) and (regions.INDEX.encode(df['Provinsi']) // 10 == 9).all()
+    assert len(data.get_dataset("all")) > len(df)
+
+
+def test_cache_versi_hanya_membatasi_versi_teriris():
+    cache = slices.CacheVersi(maks=2)
+    cache[("a", "v1")] = 1
+    for i in range(4):
+        cache[("a", f"v1-irisan{i}")] = i
+    cache.get(("a", "v1-irisan2"))
+    cache[("b", "v1-irisan9")] = 9
+    assert set(cache) == {("a", "v1"), ("a", "v1-irisan2"), ("b", "v1-irisan9")}
+
+    cache.pop(("a", "v1-irisan2"))
+    cache[("c", "v1-irisan8")] = 8
+    assert ("b", "v1-irisan9") in cache and ("c", "v1-irisan8") in cache
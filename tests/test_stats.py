@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats as sps
+
+from dashboard import stats
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=60)
+    return pd.DataFrame({
+        "a": x,
+        "b": 2 * x + rng.normal(size=60),
+        "c": rng.lognormal(size=60),
+        "d": rng.integers(0, 5, 60),
+        "label": ["x"] * 60,
+    })
+
+
+def test_kubus_sama_dengan_pandas_dan_scipy(frame):
+    cube = stats.compute(frame, "v1")
+    numeric = frame.select_dtypes(include="number")
+    assert cube.columns == tuple(numeric.columns)
+    pd.testing.assert_frame_equal(cube.pearson, numeric.corr(), check_exact=False, atol=1e-12)
+    pd.testing.assert_frame_equal(cube.spearman, numeric.corr(method="spearman"), check_exact=False, atol=1e-12)
+    for x, y in [("a", "b"), ("a", "c"), ("c", "d")]:
+        r, p = sps.pearsonr(frame[x], frame[y])
+        assert cube.pearson_test(x, y) == pytest.approx((r, p), rel=1e-9, abs=1e-12)
+        rho, p_s = sps.spearmanr(frame[x], frame[y])
+        assert cube.spearman_test(x, y) == pytest.approx((rho, p_s), rel=1e-9, abs=1e-12)
+
+
+def test_kubus_pairwise_complete_dengan_nilai_kosong(frame):
+    frame.loc[[1, 5, 9], "a"] = np.nan
+    frame.loc[[5, 20], "c"] = np.nan
+    cube = stats.compute(frame)
+    numeric = frame.select_dtypes(include="number")
+    pd.testing.assert_frame_equal(cube.pearson, numeric.corr(), check_exact=False, atol=1e-12)
+    pd.testing.assert_frame_equal(cube.spearman, numeric.corr(method="spearman"), check_exact=False, atol=1e-12)
+    assert cube.n.at["a", "c"] == 60 - 4
+    lengkap = frame[["a", "c"]].dropna()
+    assert cube.pearson_test("a", "c")[1] == pytest.approx(sps.pearsonr(lengkap["a"], lengkap["c"])[1], rel=1e-9)
+
+
+def test_update_sama_dengan_hitung_ulang(frame):
+    old = stats.compute(frame, "v1")
+    new = frame.assign(c=frame["c"] * 3 + np.sin(frame["a"]))
+    cube = stats.update(old, new, ["c"], "v2")
+    penuh = stats.compute(new, "v2")
+    assert cube.version == "v2"
+    for name in ("pearson", "pearson_p", "spearman", "spearman_p", "n"):
+        pd.testing.assert_frame_equal(getattr(cube, name), getattr(penuh, name), check_exact=False, atol=1e-12)
@@ -0,0 +1,55 @@
+import json
+
+from dashboard import warmup
+
+JUDUL = ("Halaman A", "Halaman B")
+
+
+def test_penanda_dihapus_lalu_ditulis(tmp_path, monkeypatch):
+    penanda = tmp_path / "warmup.json"
+    penanda.write_text(json.dumps({"siap": True, "pid": -1}))
+    terlihat = []
+
+    def halaman(judul, backend):
+        terlihat.append(penanda.exists())
+        return warmup.HasilHalaman(judul, 0.0)
+
+    monkeypatch.setattr(warmup, "_halaman", halaman)
+    pemanasan = warmup.jalankan(JUDUL, workers=2, output=penanda)
+
+    # Penanda lama tidak boleh terlihat selama pemanasan berjalan
+    assert terlihat == [False, False]
+    assert pemanasan.siap and not pemanasan.berjalan
+    data = json.loads(penanda.read_text())
+    assert data["siap"] is True
+    assert data["pid"] != -1
+    assert [h["judul"] for h in data["halaman"]] == list(JUDUL)
+    assert warmup.main(["--status", "--output", str(penanda)]) == 0
+
+
+def test_halaman_gagal_tidak_siap(tmp_path, monkeypatch):
+    penanda = tmp_path / "warmup.json"
+
+    def halaman(judul, backend):
+        return warmup.HasilHalaman(judul, 0.0, "ValueError: rusak" if judul == "Halaman B" else None)
+
+    monkeypatch.setattr(warmup, "_halaman", halaman)
+    pemanasan = warmup.jalankan(JUDUL, workers=1, output=penanda)
+
+    assert not pemanasan.siap
+    data = json.loads(penanda.read_text())
+    assert data["siap"] is False
+    assert [h["galat"] for h in data["halaman"]] == [None, "ValueError: rusak"]
+    assert warmup.main(["--status", "--output", str(penanda)]) == 1
+
+
+def test_status_tanpa_penanda(tmp_path, capsys):
+    assert warmup.main(["--status", "--output", str(tmp_path / "tidak-ada.json")]) == 1
+    assert "BELUM SIAP" in capsys.readouterr().out
+
+
+def test_halaman_nyata_bare_mode(tmp_path):
+    penanda = tmp_path / "warmup.json"
+    pemanasan = warmup.jalankan(["Hubungan Realisasi TKDD dan IPM"], workers=1, output=penanda)
+    assert pemanasan.status()["halaman"][0]["galat"] is None
+    assert json.loads(penanda.read_text())["siap"] is True